@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Load test: p50/p99 login latency under N concurrent requests, comparing
+verification on the event loop (blocking) with AsyncHasher (offloaded).
+
+Each simulated login verifies a scrypt hash. A heartbeat task measures how
+late the event loop runs, which is what every other request on the loop
+would experience.
+
+Usage: python benchmarks/bench_async_login.py [--concurrency 64] [--requests 256]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.async_hasher import AsyncHasher
+from pypassguard.hasher import ScryptHasher, verify_password
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def heartbeat(stop, lags, interval=0.005):
+    """Record how late a 5 ms timer fires while logins run."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+async def run(mode, encoded, concurrency, total, workers):
+    latencies = []
+    lags = []
+    slots = asyncio.Semaphore(concurrency)
+    hasher = AsyncHasher(max_workers=workers, max_queue=total) if mode == 'offloaded' else None
+
+    async def login(arrival):
+        # Latency runs from arrival, so it includes queueing on a busy loop
+        async with slots:
+            if hasher is None:
+                verify_password("correct horse", encoded)
+            else:
+                await hasher.verify("correct horse", encoded)
+            latencies.append(time.perf_counter() - arrival)
+
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    start = time.perf_counter()
+    # All requests arrive at once, as in a burst of logins
+    await asyncio.gather(*(login(start) for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    if hasher is not None:
+        hasher.close()
+    return latencies, lags or [0.0], elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=256)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--ln', type=int, default=12, help='scrypt log2(N) for the test hash')
+    args = parser.parse_args()
+
+    encoded = ScryptHasher(ln=args.ln).encode("correct horse")
+    print(f"{args.requests} logins, concurrency {args.concurrency}, "
+          f"{args.workers} hashing threads, scrypt ln={args.ln}")
+    print(f"{'mode':>10} {'p50 ms':>8} {'p99 ms':>8} {'logins/s':>9} {'loop lag p99 ms':>16}")
+    print("-" * 56)
+    for mode in ('blocking', 'offloaded'):
+        latencies, lags, elapsed = asyncio.run(
+            run(mode, encoded, args.concurrency, args.requests, args.workers))
+        print(f"{mode:>10} {statistics.median(latencies) * 1000:>8.1f} "
+              f"{percentile(latencies, 0.99) * 1000:>8.1f} {args.requests / elapsed:>9.1f} "
+              f"{percentile(lags, 0.99) * 1000:>16.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: blocklist build time, memory and lookup cost by list size.
+
+Usage: python benchmarks/bench_blocklist.py [--sizes 100000,1000000]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.blocklist import Blocklist
+from corpus import write_word_list
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1000,100000,1000000',
+                        help='Comma-separated list sizes to benchmark')
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    pool = string.ascii_letters + string.digits + '!@#$%'
+    passwords = [''.join(rng.choices(pool, k=rng.randint(8, 30))) for _ in range(2000)]
+
+    print(f"{'entries':>10} {'build (s)':>10} {'memory (MiB)':>13} {'ns/lookup':>10}")
+    print("-" * 46)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (int(s) for s in args.sizes.split(',')):
+            path = os.path.join(tmp, f'words-{size}.txt')
+            write_word_list(path, size)
+
+            start = time.perf_counter()
+            blocklist = Blocklist.from_file(path)
+            build = time.perf_counter() - start
+
+            # Measure the retained size separately; tracing slows the build
+            del blocklist
+            tracemalloc.start()
+            blocklist = Blocklist.from_file(path)
+            memory = tracemalloc.get_traced_memory()[0] / 2**20
+            tracemalloc.stop()
+
+            timer = timeit.Timer(lambda: [blocklist.contains_any(p) for p in passwords])
+            lookup = min(timer.repeat(repeat=5, number=1)) / len(passwords) * 1e9
+            print(f"{len(blocklist):>10} {build:>10.2f} {memory:>13.1f} {lookup:>10.0f}")
+            del blocklist
+
+if __name__ == "__main__":
+    main()
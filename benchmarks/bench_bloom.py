@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Bloom filter memory per entry, measured FPR and query latency.
+
+Usage: python benchmarks/bench_bloom.py [--entries 200000]
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.bloom import BloomFilter, build_filter
+
+def digests(prefix, count):
+    return [hashlib.sha1(f"{prefix}{i}".encode()).digest() for i in range(count)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=200_000)
+    parser.add_argument('--queries', type=int, default=200_000)
+    args = parser.parse_args()
+
+    members = digests('member', args.entries)
+    others = digests('other', args.queries)
+
+    print(f"{'target FPR':>10} {'bits/entry':>10} {'k':>3} {'measured FPR':>13} "
+          f"{'miss ns':>8} {'hit ns':>8}")
+    print("-" * 58)
+    with tempfile.TemporaryDirectory() as tmp:
+        for fpr in (0.1, 0.01, 0.001, 0.0001):
+            path = os.path.join(tmp, f'{fpr}.bloom')
+            size = build_filter(members, len(members), path, fpr)
+
+            with BloomFilter(path) as bloom:
+                start = time.perf_counter_ns()
+                false_positives = sum(map(bloom.might_contain, others))
+                miss_ns = (time.perf_counter_ns() - start) / len(others)
+
+                start = time.perf_counter_ns()
+                for digest in members:
+                    bloom.might_contain(digest)
+                hit_ns = (time.perf_counter_ns() - start) / len(members)
+
+                print(f"{fpr:>10g} {size * 8 / len(members):>10.2f} {bloom.hash_count:>3} "
+                      f"{false_positives / len(others):>13.5f} {miss_ns:>8.0f} {hit_ns:>8.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark: lookup latency of the memory-mapped breach index.
+
+Usage: python benchmarks/bench_breach.py [--entries 1000000]
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.breach import BreachIndex, build_index
+from corpus import write_hash_dump
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=1_000_000)
+    parser.add_argument('--lookups', type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump = os.path.join(tmp, 'dump.txt')
+        index_path = os.path.join(tmp, 'breach.idx')
+        write_hash_dump(dump, args.entries)
+
+        start = time.perf_counter()
+        build_index([dump], index_path)
+        print(f"build: {args.entries:,} entries in {time.perf_counter() - start:.2f}s, "
+              f"{os.path.getsize(index_path) / 2**20:.1f} MiB on disk")
+
+        rng = random.Random(5)
+        with BreachIndex(index_path) as index:
+            hits = [bytes.fromhex(line.split(':')[0])
+                    for line in open(dump) if rng.random() < args.lookups / args.entries]
+            misses = [hashlib.sha1(str(i).encode()).digest() for i in range(args.lookups)]
+
+            for label, digests in (('hit', hits), ('miss', misses)):
+                start = time.perf_counter_ns()
+                for digest in digests:
+                    index.lookup_digest(digest)
+                per_lookup = (time.perf_counter_ns() - start) / len(digests) / 1000
+                print(f"{label:>5}: {per_lookup:.2f} us/lookup over {len(digests):,} lookups")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: validation requests/sec through the daemon versus one CLI
+process per call.
+
+Starts `main.py serve` in a subprocess on a temporary Unix socket and a
+free HTTP port, then times single and batched /validate requests over
+each transport with a keep-alive DaemonClient. The baseline runs
+`main.py validate PASSWORD` once per password, paying interpreter startup
+and module imports every time.
+
+Usage: python benchmarks/bench_daemon.py [--requests 2000] [--batch 1000] [--processes 20]
+"""
+
+import argparse
+import os
+import random
+import socket
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from pypassguard.daemon_client import DaemonClient
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def wait_for(client, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return client.health()
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+def rate(func, items):
+    start = time.perf_counter()
+    func()
+    return items / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000, help='Single-password requests')
+    parser.add_argument('--batch', type=int, default=1000, help='Passwords per batched request')
+    parser.add_argument('--processes', type=int, default=20, help='CLI processes for the baseline')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    alphabet = string.ascii_letters + string.digits + '!@#$%'
+    passwords = [''.join(rng.choice(alphabet) for _ in range(rng.randint(6, 16)))
+                 for _ in range(max(args.requests, args.batch * 10))]
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, 'bench.sock')
+        port = free_port()
+        daemon = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'main.py'), 'serve',
+             '--socket', socket_path, '--port', str(port)],
+            stdout=subprocess.DEVNULL, cwd=directory)
+        try:
+            results = []
+            for name, client in (('unix socket', DaemonClient(socket_path)),
+                                 ('http', DaemonClient(host='127.0.0.1', port=port))):
+                with client:
+                    wait_for(client)
+                    single = rate(lambda: [client.validate(p) for p in passwords[:args.requests]],
+                                  args.requests)
+                    batches = [passwords[i:i + args.batch] for i in range(0, args.batch * 10, args.batch)]
+                    batched = rate(lambda: [client.validate(b) for b in batches], args.batch * 10)
+                results.append((f'daemon {name}, single', single))
+                results.append((f'daemon {name}, batch of {args.batch}', batched))
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    def per_process():
+        for password in passwords[:args.processes]:
+            subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), 'validate', password],
+                           stdout=subprocess.DEVNULL, check=True)
+    results.append(('process per call', rate(per_process, args.processes)))
+
+    baseline = results[-1][1]
+    print(f"{'mode':36} {'passwords/s':>12} {'speedup':>9}")
+    print("-" * 59)
+    for name, value in results:
+        print(f"{name:36} {value:12,.0f} {value / baseline:8.0f}x")
+
+if __name__ == "__main__":
+    main()
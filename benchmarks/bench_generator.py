@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bulk generator vs. one generate_password call per password.
+
+Usage: python benchmarks/bench_generator.py [--count 1000000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.generator import generate_password, generate_passwords_bulk
+
+def rate(func, count):
+    start = time.perf_counter()
+    func(count)
+    return count / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'length':>6} {'special':>7} {'per-call/s':>12} {'bulk/s':>12} {'speedup':>8}")
+    print("-" * 50)
+    for length in (8, 12, 16, 32):
+        for special in (True, False):
+            single = rate(lambda n: [generate_password(length, special) for _ in range(n)],
+                          args.count // 10)
+            bulk = rate(lambda n: sum(1 for _ in generate_passwords_bulk(n, length, special)),
+                        args.count)
+            print(f"{length:>6} {str(special):>7} {single:>12,.0f} {bulk:>12,.0f} {bulk / single:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
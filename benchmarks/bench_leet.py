@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: leet-canonical blocklist vs. naive substitution expansion.
+
+Two naive baselines are measured against Blocklist(substitutions=...):
+expanding every blocklist word into all of its leetspeak spellings, and
+expanding every password into all of its de-leeted readings.
+
+Usage: python benchmarks/bench_leet.py [--sizes 100,1000,100000]
+"""
+
+import argparse
+import itertools
+import math
+import os
+import random
+import string
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.config import COMMON_SUBSTITUTIONS
+from pypassguard.blocklist import Blocklist
+from pypassguard.leet import reverse_substitutions
+from corpus import leetify
+
+# Expanded word lists above this many spellings are not materialized
+MAX_EXPANDED = 2_000_000
+
+REVERSE = reverse_substitutions(COMMON_SUBSTITUTIONS)
+
+def spellings(word):
+    """Every leetspeak spelling of a word."""
+    options = [[c] + COMMON_SUBSTITUTIONS.get(c, []) for c in word]
+    return map(''.join, itertools.product(*options))
+
+def spelling_count(word):
+    return math.prod(1 + len(COMMON_SUBSTITUTIONS.get(c, ())) for c in word)
+
+def readings(password):
+    """Every de-leeted reading of a password (each substitute kept or undone)."""
+    options = [[c] + REVERSE.get(c, []) for c in password.lower()]
+    return map(''.join, itertools.product(*options))
+
+def measure(build):
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    return result, elapsed, memory
+
+def lookup_ns(func, passwords):
+    timer = timeit.Timer(lambda: [func(p) for p in passwords])
+    return min(timer.repeat(repeat=3, number=1)) / len(passwords) * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='100,1000,100000',
+                        help='Comma-separated blocklist sizes to benchmark')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    letters = string.ascii_lowercase
+    print(f"{'entries':>9} {'method':>18} {'patterns':>12} {'build (s)':>10} "
+          f"{'memory (MiB)':>13} {'ns/lookup':>10}")
+    print("-" * 78)
+    for size in (int(s) for s in args.sizes.split(',')):
+        words = [''.join(rng.choices(letters, k=rng.randint(4, 12))) for _ in range(size)]
+        # Half the passwords embed a leet-spelled blocklist word
+        passwords = [leetify(rng.choice(words), rng) + '!' + str(i) if i % 2 else
+                     ''.join(rng.choices(letters + string.digits + '!@$', k=rng.randint(8, 20)))
+                     for i in range(1000)]
+
+        plain, build, memory = measure(lambda: Blocklist(words))
+        ns = lookup_ns(plain.contains_any, passwords)
+        print(f"{size:>9} {'plain (no leet)':>18} {len(plain):>12,} {build:>10.2f} {memory:>13.1f} {ns:>10,.0f}")
+
+        canonical, build, memory = measure(lambda: Blocklist(words, substitutions=COMMON_SUBSTITUTIONS))
+        ns = lookup_ns(canonical.contains_any, passwords)
+        print(f"{size:>9} {'canonical':>18} {len(canonical):>12,} {build:>10.2f} {memory:>13.1f} {ns:>10,.0f}")
+
+        total = sum(map(spelling_count, words))
+        if total <= MAX_EXPANDED:
+            expanded, build, memory = measure(
+                lambda: Blocklist(itertools.chain.from_iterable(map(spellings, words))))
+            ns = lookup_ns(expanded.contains_any, passwords)
+            print(f"{size:>9} {'expand patterns':>18} {total:>12,} {build:>10.2f} {memory:>13.1f} {ns:>10,.0f}")
+            del expanded
+        else:
+            print(f"{size:>9} {'expand patterns':>18} {total:>12,} {'(too large to build)':>36}")
+
+        ns = lookup_ns(lambda p: any(map(plain.contains_any, readings(p))), passwords)
+        print(f"{size:>9} {'expand passwords':>18} {len(plain):>12,} {'':>10} {'':>13} {ns:>10,.0f}")
+        del canonical, plain
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: validation and generation scaling from 1 to N worker processes.
+
+Usage: python benchmarks/bench_parallel.py [--passwords 1000000] [--max-workers 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.generator import generate_passwords_bulk
+from pypassguard.parallel import generate_passwords_parallel, validate_many_parallel
+from pypassguard.validator import validate_many
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def drain(iterator):
+    for _ in iterator:
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--passwords', type=int, default=1_000_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    corpus = list(generate_passwords_bulk(args.passwords, 12))
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, args.max_workers} & set(range(1, args.max_workers + 1)))
+    print(f"{args.passwords:,} passwords, {os.cpu_count()} CPUs available")
+    print(f"{'workers':>7} {'validate/s':>12} {'efficiency':>10} {'generate/s':>12} {'efficiency':>10}")
+    print("-" * 56)
+
+    base_validate = base_generate = None
+    for workers in worker_counts:
+        if workers == 1:
+            validate = timed(lambda: drain(validate_many(corpus)))
+            generate = timed(lambda: drain(generate_passwords_bulk(args.passwords, 12)))
+        else:
+            validate = timed(lambda: drain(validate_many_parallel(corpus, workers)))
+            generate = timed(lambda: drain(generate_passwords_parallel(args.passwords, 12,
+                                                                        workers=workers)))
+        validate_rate = args.passwords / validate
+        generate_rate = args.passwords / generate
+        base_validate = base_validate or validate_rate
+        base_generate = base_generate or generate_rate
+        print(f"{workers:>7} {validate_rate:>12,.0f} {validate_rate / base_validate / workers:>10.0%} "
+              f"{generate_rate:>12,.0f} {generate_rate / base_generate / workers:>10.0%}")
+
+if __name__ == "__main__":
+    main()
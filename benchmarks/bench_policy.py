@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-tenant policy lookup and validation through PolicyStore.
+
+Writes one profile file per tenant (with a limited number of distinct
+settings, as in a real tenant population) and measures cold loads,
+cached lookups and validation against a freshly compiled policy.
+
+Usage: python benchmarks/bench_policy.py [--tenants 2000] [--distinct 50]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.policy import Policy, PolicyStore
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tenants', type=int, default=2000)
+    parser.add_argument('--distinct', type=int, default=50, help='Distinct policy settings')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    variants = [{'version': 1, 'min_length': 8 + i % 12, 'require_special_chars': bool(i % 2),
+                 'blocklist': [f'tenant{i}']} for i in range(args.distinct)]
+    names = [f'tenant-{i:05d}' for i in range(args.tenants)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names:
+            with open(os.path.join(directory, name + '.json'), 'w') as f:
+                json.dump(rng.choice(variants), f)
+
+        store = PolicyStore(directory, cache_size=1024, check_interval=1.0)
+        start = time.perf_counter()
+        for name in names:
+            store.get(name)
+        cold = (time.perf_counter() - start) / len(names) * 1e6
+
+        requests = [rng.choice(names) for _ in range(20000)]
+        warm = timeit.timeit(lambda: [store.get(n) for n in requests], number=1) / len(requests) * 1e6
+        cached = timeit.timeit(lambda: [store.get(n).check("Xq7!mZp2wKv9") for n in requests],
+                               number=1) / len(requests) * 1e6
+        uncached = timeit.timeit(lambda: [Policy(n, variants[0]).check("Xq7!mZp2wKv9")
+                                          for n in requests[:500]], number=1) / 500 * 1e6
+
+        print(f"Tenants: {len(names):,}, compiled policies in cache: {len(store):,} "
+              f"(hits {store.hits:,}, misses {store.misses:,})")
+        print(f"{'operation':36} {'us/op':>10}")
+        print("-" * 48)
+        print(f"{'cold load (parse + compile/share)':36} {cold:10.1f}")
+        print(f"{'cached lookup':36} {warm:10.2f}")
+        print(f"{'cached lookup + validate':36} {cached:10.2f}")
+        print(f"{'compile per request + validate':36} {uncached:10.1f}")
+
+if __name__ == "__main__":
+    main()
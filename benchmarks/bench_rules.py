@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: compiled single-pass rule engine vs. the original
+multi-scan validate_password implementation.
+
+Both sides call the same blocklist lookup, which is a fixed share of every
+end-to-end number; the second table leaves it out to time the rule checks
+alone.
+
+Usage: python benchmarks/bench_rules.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.config import PASSWORD_REQUIREMENTS
+from pypassguard.rules import CompiledRules
+from pypassguard.validator import validate_password, validate_password_mask, _has_common_weak_patterns
+from corpus import random_passwords
+
+def legacy_validate_password(password):
+    """The original seven-scan implementation, kept as the baseline."""
+    requirements = PASSWORD_REQUIREMENTS
+    results = {}
+    results['length'] = len(password) >= requirements['min_length']
+    results['uppercase'] = (not requirements['require_uppercase'] or
+                            any(c.isupper() for c in password))
+    results['lowercase'] = (not requirements['require_lowercase'] or
+                            any(c.islower() for c in password))
+    results['digits'] = (not requirements['require_digits'] or
+                         any(c.isdigit() for c in password))
+    results['special'] = (not requirements['require_special_chars'] or
+                          any(c in requirements['special_chars'] for c in password))
+    results['common_patterns'] = not _has_common_weak_patterns(password)
+    results['sequential'] = not _legacy_sequential(password)
+    return all(results.values()), results
+
+def legacy_rule_checks(password):
+    """The original class, length and sequence scans, without the blocklist."""
+    requirements = PASSWORD_REQUIREMENTS
+    return (len(password) >= requirements['min_length'] and
+            (not requirements['require_uppercase'] or any(c.isupper() for c in password)) and
+            (not requirements['require_lowercase'] or any(c.islower() for c in password)) and
+            (not requirements['require_digits'] or any(c.isdigit() for c in password)) and
+            (not requirements['require_special_chars'] or
+             any(c in requirements['special_chars'] for c in password)) and
+            not _legacy_sequential(password))
+
+def _legacy_sequential(password):
+    if len(password) < 3:
+        return False
+    for i in range(len(password) - 2):
+        if (ord(password[i].lower()) + 1 == ord(password[i+1].lower()) and
+                ord(password[i].lower()) + 2 == ord(password[i+2].lower())):
+            return True
+        if (password[i].isdigit() and password[i+1].isdigit() and password[i+2].isdigit() and
+                int(password[i]) + 1 == int(password[i+1]) and
+                int(password[i]) + 2 == int(password[i+2])):
+            return True
+    return False
+
+def bench(func, corpus, repeat=5):
+    """Best-of-N nanoseconds per password."""
+    timer = timeit.Timer(lambda: [func(p) for p in corpus])
+    best = min(timer.repeat(repeat=repeat, number=1))
+    return best / len(corpus) * 1e9
+
+def main():
+    corpus = random_passwords(2000)
+
+    # Sanity check: the engine must agree with the original implementation
+    # on every check except 'sequential', which now also catches descending
+    # runs and keyboard walks (see bench_sequences.py)
+    for password in corpus:
+        _, results = validate_password(password)
+        _, legacy_results = legacy_validate_password(password)
+        results.pop('sequential')
+        legacy_results.pop('sequential')
+        assert results == legacy_results, password
+
+    legacy = bench(legacy_validate_password, corpus)
+    compiled = bench(validate_password, corpus)
+    mask = bench(validate_password_mask, corpus)
+
+    print(f"{'end to end':32} {'ns/password':>12} {'speedup':>8}")
+    print("-" * 54)
+    print(f"{'legacy validate_password':32} {legacy:12.0f} {1.0:7.2f}x")
+    print(f"{'compiled validate_password':32} {compiled:12.0f} {legacy / compiled:7.2f}x")
+    print(f"{'validate_password_mask':32} {mask:12.0f} {legacy / mask:7.2f}x")
+
+    engine = CompiledRules(PASSWORD_REQUIREMENTS)
+    legacy_rules = bench(legacy_rule_checks, corpus)
+    engine_rules = bench(engine.check, corpus)
+    blocklist = bench(_has_common_weak_patterns, corpus)
+
+    print()
+    print(f"{'rule checks, no blocklist':32} {'ns/password':>12} {'speedup':>8}")
+    print("-" * 54)
+    print(f"{'legacy scans':32} {legacy_rules:12.0f} {1.0:7.2f}x")
+    print(f"{'CompiledRules.check':32} {engine_rules:12.0f} {legacy_rules / engine_rules:7.2f}x")
+    print(f"{'blocklist lookup (both sides)':32} {blocklist:12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: precomputed SequenceDetector vs. the original ord()/int() loop.
+
+The detector also finds descending runs and keyboard walks on three
+layouts, which the original loop does not; the hit rates show how much
+more it catches on the same corpus.
+
+Usage: python benchmarks/bench_sequences.py [--size 2000]
+"""
+
+import argparse
+import os
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.sequences import SequenceDetector
+from corpus import random_passwords
+
+def legacy_sequential(password):
+    """The original _has_sequential_chars, kept as the baseline."""
+    if len(password) < 3:
+        return False
+    for i in range(len(password) - 2):
+        if (ord(password[i].lower()) + 1 == ord(password[i+1].lower()) and
+                ord(password[i].lower()) + 2 == ord(password[i+2].lower())):
+            return True
+        if (password[i].isdigit() and password[i+1].isdigit() and password[i+2].isdigit() and
+                int(password[i]) + 1 == int(password[i+1]) and
+                int(password[i]) + 2 == int(password[i+2])):
+            return True
+    return False
+
+def bench(func, corpus, repeat=5):
+    """Best-of-N nanoseconds per password."""
+    timer = timeit.Timer(lambda: [func(p) for p in corpus])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(corpus) * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = random_passwords(args.size, pool=string.ascii_letters + string.digits + '!@#$%^&*')
+    detector = SequenceDetector(3, keyboard_min_length=4)
+
+    rows = [
+        ('legacy loop', legacy_sequential),
+        ('detector.contains_any', detector.contains_any),
+        ('detector.find_all', detector.find_all),
+    ]
+    legacy = bench(legacy_sequential, corpus)
+    print(f"{'implementation':24} {'ns/password':>12} {'speedup':>8} {'hit rate':>9}")
+    print("-" * 57)
+    for name, func in rows:
+        ns = bench(func, corpus)
+        hits = sum(1 for p in corpus if func(p)) / len(corpus)
+        print(f"{name:24} {ns:12.0f} {legacy / ns:7.2f}x {hits:8.1%}")
+
+if __name__ == "__main__":
+    main()
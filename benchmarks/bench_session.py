@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-keystroke cost of an incremental ValidationSession vs.
+re-validating the whole field on every keystroke.
+
+Typing traces are simulated from the benchmark corpus: each password is
+typed left to right with occasional typos, each corrected by a
+backspace. After every keystroke both paths produce the result and
+feedback for the current text, and they are checked to agree.
+
+Usage: python benchmarks/bench_session.py [--size 500] [--typo-rate 0.05]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.session import ValidationSession
+from pypassguard.validator import get_validation_feedback, validate_password, validate_password_result
+from corpus import LENGTH_PROFILES, POOL, random_passwords, realistic_passwords
+
+def typing_trace(password, rng, typo_rate):
+    """Keystrokes as ('type', char) or ('backspace', None) events."""
+    events = []
+    for char in password:
+        if rng.random() < typo_rate:
+            events.append(('type', rng.choice(POOL)))
+            events.append(('backspace', None))
+        events.append(('type', char))
+    return events
+
+def run_session(traces):
+    for events in traces:
+        session = ValidationSession()
+        for kind, char in events:
+            if kind == 'type':
+                session.append(char)
+            else:
+                session.backspace()
+            session.feedback()
+
+def run_stateless(traces):
+    for events in traces:
+        text = ''
+        for kind, char in events:
+            text = text + char if kind == 'type' else text[:-1]
+            list(validate_password_result(text).feedback)
+
+def run_legacy(traces):
+    """validate_password + get_validation_feedback, as a form handler would call them."""
+    for events in traces:
+        text = ''
+        for kind, char in events:
+            text = text + char if kind == 'type' else text[:-1]
+            _, results = validate_password(text)
+            get_validation_feedback(results)
+
+def check(traces):
+    for events in traces:
+        session, text = ValidationSession(), ''
+        for kind, char in events:
+            if kind == 'type':
+                session.append(char)
+                text += char
+            else:
+                session.backspace()
+                text = text[:-1]
+            _, results = validate_password(text)
+            assert session.feedback() == get_validation_feedback(results), text
+
+def bench(func, traces, repeat=5):
+    """Best-of-N nanoseconds per keystroke."""
+    keystrokes = sum(len(events) for events in traces)
+    best = min(timeit.Timer(lambda: func(traces)).repeat(repeat=repeat, number=1))
+    return best / keystrokes * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=500, help='Passwords typed per corpus')
+    parser.add_argument('--typo-rate', type=float, default=0.05)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    corpora = {
+        'realistic': realistic_passwords(args.size),
+        'long': random_passwords(args.size, lengths=LENGTH_PROFILES['long']),
+        'passphrase': random_passwords(args.size // 5, lengths=LENGTH_PROFILES['passphrase']),
+    }
+
+    print(f"{'corpus':12} {'path':34} {'ns/keystroke':>13} {'speedup':>8}")
+    print("-" * 70)
+    for name, passwords in corpora.items():
+        traces = [typing_trace(p, rng, args.typo_rate) for p in passwords]
+        check(traces)
+        legacy = bench(run_legacy, traces)
+        stateless = bench(run_stateless, traces)
+        incremental = bench(run_session, traces)
+        print(f"{name:12} {'validate_password + feedback':34} {legacy:13,.0f} {1.0:7.2f}x")
+        print(f"{'':12} {'validate_password_result':34} {stateless:13,.0f} {legacy / stateless:7.2f}x")
+        print(f"{'':12} {'ValidationSession':34} {incremental:13,.0f} {legacy / incremental:7.2f}x")
+
+if __name__ == "__main__":
+    main()
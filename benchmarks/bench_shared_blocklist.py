@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: host memory and worker startup with a shared blocklist vs.
+loading the word list in every worker process.
+
+Starts --workers fresh interpreters at once, as a pre-fork server would,
+each loading the blocklist through validator.load_blocklist: either the
+plain word list (every worker builds its own sets) or a file published
+with publish_blocklist (every worker maps the same pages). Once all are
+up and have run some lookups (so the pages they need are resident),
+each reports its load time, RSS and PSS
+(resident memory with shared pages split between the processes that map
+them, from /proc/self/smaps_rollup); the PSS total is the real cost to
+the host. A run with no blocklist file gives the interpreter baseline.
+
+Usage: python benchmarks/bench_shared_blocklist.py [--size 1000000] [--workers 16]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from corpus import realistic_passwords, write_word_list
+
+# Run in each worker: load, warm up, wait for the others, report
+WORKER = r'''
+import json, os, sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from pypassguard import validator
+path = sys.argv[2] or None
+if path:
+    validator.load_blocklist(path)
+loaded = time.perf_counter() - start
+for password in json.loads(sys.stdin.readline()):
+    validator._BLOCKLIST.contains_any(password)
+print('ready', flush=True)
+sys.stdin.readline()
+memory = {}
+with open('/proc/self/smaps_rollup') as f:
+    for line in f:
+        fields = line.split()
+        if fields[0] in ('Rss:', 'Pss:'):
+            memory[fields[0][:-1].lower()] = int(fields[1]) * 1024
+print(json.dumps(dict(memory, loaded=loaded)), flush=True)
+'''
+
+def run_workers(path, workers, passwords):
+    """Start the workers together; return their reports once all are up."""
+    command = [sys.executable, '-c', WORKER, os.path.join(ROOT, 'src'), path or '']
+    processes = [subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+                 for _ in range(workers)]
+    batch = json.dumps(passwords) + '\n'
+    for process in processes:
+        process.stdin.write(batch)
+        process.stdin.flush()
+    for process in processes:
+        process.stdout.readline()
+    reports = []
+    for process in processes:
+        process.stdin.write('\n')
+        process.stdin.flush()
+        reports.append(json.loads(process.stdout.readline()))
+        process.stdin.close()
+    for process in processes:
+        process.wait()
+    return reports
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=1000000, help='Patterns in the word list')
+    parser.add_argument('--workers', type=int, default=16, help='Concurrent worker processes')
+    parser.add_argument('--lookups', type=int, default=2000, help='Passwords checked per worker')
+    args = parser.parse_args()
+
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        sys.exit("This benchmark reads /proc/self/smaps_rollup (Linux 4.14+)")
+    from pypassguard.config import COMMON_SUBSTITUTIONS, COMMON_WEAK_PATTERNS
+    from pypassguard.shared_blocklist import publish_blocklist
+
+    passwords = realistic_passwords(args.lookups)
+    with tempfile.TemporaryDirectory() as tmp:
+        words = os.path.join(tmp, 'words.txt')
+        write_word_list(words, args.size)
+        shared = os.path.join(tmp, 'words.blocklist')
+        start = time.perf_counter()
+        publish_blocklist(shared, COMMON_WEAK_PATTERNS, words, COMMON_SUBSTITUTIONS)
+        published = time.perf_counter() - start
+        print(f"{args.size:,} patterns; published {os.path.getsize(shared) / 2**20:.1f} MiB "
+              f"in {published:.2f}s; {args.workers} workers\n")
+
+        print(f"{'mode':14} {'load ms':>9} {'RSS MiB/worker':>15} {'host RSS MiB':>13} "
+              f"{'host PSS MiB':>13}")
+        print("-" * 68)
+        for mode, path in (('no blocklist', None), ('per-process', words), ('shared', shared)):
+            reports = run_workers(path, args.workers, passwords)
+            loaded = statistics.median(r['loaded'] for r in reports) * 1000
+            rss = sum(r['rss'] for r in reports) / 2**20
+            pss = sum(r['pss'] for r in reports) / 2**20
+            print(f"{mode:14} {loaded:9.1f} {rss / len(reports):15.1f} {rss:13.1f} {pss:13.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start time of short CLI calls.
+
+Runs each command repeatedly in a fresh interpreter with warm bytecode and
+table caches, and reports the median wall time next to a bare `python -c
+pass`, plus the slowest package imports from `-X importtime`. Pass
+--cold-cache to clear the table cache before every run instead.
+
+Usage: python benchmarks/bench_startup.py [--runs 20] [--cold-cache]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+from test_startup import import_times
+
+COMMANDS = (
+    ('bare interpreter', ['-c', 'pass']),
+    ('--help', [os.path.join(ROOT, 'main.py'), '--help']),
+    ('validate PASSWORD', [os.path.join(ROOT, 'main.py'), 'validate', 'Xy7!kkP0qz']),
+    ('validate --policy strict', [os.path.join(ROOT, 'main.py'), 'validate', 'Xy7!kkP0qz',
+                                  '--policy', 'strict']),
+    ('strength PASSWORD', [os.path.join(ROOT, 'main.py'), 'strength', 'P@ssw0rd1990']),
+)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--cold-cache', action='store_true',
+                        help='Clear the table cache before every run')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tables = os.path.join(tmp, 'tables')
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=os.path.join(tmp, 'pyc'),
+                   PYPASSGUARD_CACHE_DIR=tables)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+        samples = {name: [] for name, _ in COMMANDS}
+        for name, command in COMMANDS:
+            subprocess.run([sys.executable, *command], stdout=subprocess.DEVNULL, env=env, check=True)
+        # Interleave commands so host noise hits them all alike
+        for _ in range(args.runs):
+            for name, command in COMMANDS:
+                if args.cold_cache:
+                    shutil.rmtree(tables, ignore_errors=True)
+                start = time.perf_counter()
+                subprocess.run([sys.executable, *command], stdout=subprocess.DEVNULL, env=env, check=True)
+                samples[name].append(time.perf_counter() - start)
+
+    bare = statistics.median(samples['bare interpreter']) * 1000
+    print(f"{'command':28} {'median ms':>10} {'over bare':>10}")
+    print("-" * 50)
+    for name, values in samples.items():
+        median = statistics.median(values) * 1000
+        print(f"{name:28} {median:10.1f} {median - bare:10.1f}")
+
+    times = import_times('validate', 'Xy7!kkP0qz')
+    print("\nSlowest imports for `validate PASSWORD` (cumulative ms, best of 3):")
+    slowest = sorted(((us, name) for name, (_, us) in times.items()), reverse=True)
+    for us, name in [entry for entry in slowest if entry[1].startswith('pypassguard')][:8]:
+        print(f"  {name:28} {us / 1000:6.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark: strength estimator latency per password, by input length and shape.
+
+The estimator is meant to run on every keystroke, so the target is well
+under 1 ms per call even for 30-character inputs.
+
+Usage: python benchmarks/bench_strength.py [--number 2000]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.strength import estimate_strength, get_frequency_table
+
+def shapes(length, rng):
+    printable = string.ascii_letters + string.digits + string.punctuation
+    yield 'random', ''.join(rng.choice(printable) for _ in range(length))
+    yield 'words+l33t', ('P@ssw0rd' + 'dragon' + 'm0nkey' + '1990' + 'qwerty' * 5)[:length]
+    yield 'keyboard', ('qwertyuiop' + 'asdfghjkl;' + 'zxcvbnm,./' + '1234567890')[:length]
+    yield 'sequence', (string.ascii_lowercase + string.digits)[:length]
+    yield 'repeat', ('abc' * length)[:length]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000, help='Calls per measurement')
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    table = get_frequency_table()
+    print(f"Loaded {len(table)} ranked words in {(time.perf_counter() - start) * 1000:.2f} ms\n")
+
+    print(f"{'length':>6} {'shape':>11} {'us/call':>9} {'score':>5}")
+    print("-" * 35)
+    worst = 0.0
+    for length in (8, 16, 30):
+        for shape, password in shapes(length, rng):
+            seconds = timeit.timeit(lambda: estimate_strength(password), number=args.number)
+            micros = seconds / args.number * 1e6
+            worst = max(worst, micros)
+            print(f"{length:>6} {shape:>11} {micros:>9.1f} {estimate_strength(password)['score']:>5}")
+    print(f"\nWorst case: {worst:.1f} us per password ({'within' if worst < 1000 else 'OVER'} 1 ms budget)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Synthetic, seeded corpora for the benchmarks.
+
+Everything is generated from a seed and the word list bundled with the
+package, so any result can be reproduced offline. Used as a module by the
+benchmark scripts, or from the command line to write a corpus to disk:
+
+Usage: python benchmarks/corpus.py passwords OUT [--count 100000] [--shape realistic] [--lengths typical]
+       python benchmarks/corpus.py words OUT [--count 100000]
+       python benchmarks/corpus.py dump OUT [--count 1000000]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.config import COMMON_SUBSTITUTIONS, PASSWORD_REQUIREMENTS
+
+# Password length ranges (inclusive) used across the benchmarks
+LENGTH_PROFILES = {
+    'short': (4, 8),
+    'typical': (8, 16),
+    'long': (16, 64),
+    'passphrase': (64, 256),
+    'mixed': (6, 24),
+}
+
+POOL = string.ascii_letters + string.digits + PASSWORD_REQUIREMENTS['special_chars']
+
+_WORDLIST = os.path.join(os.path.dirname(__file__), '..', 'src', 'pypassguard',
+                         'wordlists', 'passwords.txt')
+_WALKS = ('qwerty', 'asdfgh', 'zxcvbn', '1qaz2wsx', 'qazwsx', 'azerty', 'aoeuid')
+
+def random_passwords(count, seed=1234, lengths=LENGTH_PROFILES['mixed'], pool=POOL):
+    """Uniformly random passwords with lengths drawn from `lengths`."""
+    rng = random.Random(seed)
+    low, high = lengths
+    return [''.join(rng.choice(pool) for _ in range(rng.randint(low, high))) for _ in range(count)]
+
+def common_words():
+    """The ranked word list bundled with the package."""
+    with open(_WORDLIST, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def leetify(word, rng):
+    """Replace about half of the substitutable letters with a leet spelling."""
+    return ''.join(rng.choice(COMMON_SUBSTITUTIONS[c]) if c in COMMON_SUBSTITUTIONS and rng.random() < 0.5
+                   else c for c in word)
+
+def realistic_passwords(count, seed=1234, lengths=LENGTH_PROFILES['typical']):
+    """
+    Passwords shaped like a real leak: mostly words with suffixes, leet
+    spellings, keyboard walks and sequences, plus uniformly random ones.
+
+    Shaped passwords are padded or cut to fall within `lengths`.
+    """
+    rng = random.Random(seed)
+    words = common_words()
+    low, high = lengths
+    passwords = []
+    for _ in range(count):
+        shape = rng.random()
+        if shape < 0.35:
+            password = rng.choice(words).capitalize() + str(rng.randint(0, 2030)) + rng.choice('!@#$.')
+        elif shape < 0.5:
+            password = leetify(rng.choice(words), rng) + str(rng.randint(0, 99))
+        elif shape < 0.6:
+            password = rng.choice(_WALKS) + rng.choice(('', '!', '123', '2024'))
+        elif shape < 0.65:
+            start = rng.randint(0, 5)
+            password = 'abcdefghij'[start:start + 4] + '1234567890'[start:start + 4]
+        else:
+            password = ''.join(rng.choice(POOL) for _ in range(rng.randint(low, high)))
+        length = rng.randint(low, high)
+        while len(password) < length:
+            password += rng.choice(POOL)
+        passwords.append(password[:length])
+    return passwords
+
+def random_words(count, seed=42):
+    """Random lowercase words of 4-12 characters, e.g. for blocklists."""
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    return [''.join(rng.choices(letters, k=rng.randint(4, 12))) for _ in range(count)]
+
+def write_word_list(path, count, seed=42):
+    """Write `count` random words, one per line."""
+    with open(path, 'w') as f:
+        for word in random_words(count, seed):
+            f.write(word)
+            f.write('\n')
+
+def write_hash_dump(path, count, seed=99):
+    """Write `count` random SHA-1 HASH:COUNT lines, unsorted."""
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for _ in range(count):
+            f.write(f"{rng.getrandbits(160):040X}:{rng.randint(1, 1000)}\n")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('kind', choices=['passwords', 'words', 'dump'])
+    parser.add_argument('output', help='File to write')
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--shape', choices=['realistic', 'random'], default='realistic',
+                        help='Password shapes (passwords only)')
+    parser.add_argument('--lengths', choices=sorted(LENGTH_PROFILES), default='typical',
+                        help='Length profile (passwords only)')
+    args = parser.parse_args()
+
+    if args.kind == 'passwords':
+        make = realistic_passwords if args.shape == 'realistic' else random_passwords
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for password in make(args.count, args.seed, LENGTH_PROFILES[args.lengths]):
+                f.write(password)
+                f.write('\n')
+    elif args.kind == 'words':
+        write_word_list(args.output, args.count, args.seed)
+    else:
+        write_hash_dump(args.output, args.count, args.seed)
+    print(f"Wrote {args.count:,} {args.kind} to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: timings of the hashing, generation, validation and lookup
+hot paths, written as JSON and compared against a baseline.
+
+Every case runs in-process against synthetic corpora from corpus.py, with
+no network or external services. Each case is calibrated to run for at
+least --min-time seconds per repeat; the best of --repeat runs is the
+headline figure, as it is the least disturbed by other load on the host.
+
+Usage: python benchmarks/suite.py run [--output results.json] [--filter validate] [--quick]
+       python benchmarks/suite.py run --baseline baseline.json [--threshold 0.10]
+       python benchmarks/suite.py compare baseline.json results.json [--threshold 0.10]
+       python benchmarks/suite.py list
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from corpus import (LENGTH_PROFILES, random_passwords, realistic_passwords, write_hash_dump,
+                    write_word_list)
+
+RESULTS_VERSION = 1
+
+# name -> setup(scale, tmp) returning (callable, items per call)
+CASES = {}
+
+def case(name):
+    """Register a benchmark setup function under `name`."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+@case('hash_password')
+def _hash_password(scale, tmp):
+    from pypassguard.hasher import hash_password
+    passwords = realistic_passwords(1000 * scale)
+    return lambda: [hash_password(p) for p in passwords], len(passwords)
+
+@case('hash_file[realistic]')
+def _hash_file(scale, tmp):
+    import io
+    from pypassguard.bulk_hash import hash_file
+    passwords = realistic_passwords(10000 * scale)
+    data = ('\n'.join(passwords) + '\n').encode('utf-8')
+    return lambda: hash_file(io.BytesIO(data), io.BytesIO()), len(passwords)
+
+@case('generate_password')
+def _generate_password(scale, tmp):
+    from pypassguard.generator import generate_password
+    count = 200 * scale
+    return lambda: [generate_password(16) for _ in range(count)], count
+
+@case('generate_multiple_passwords')
+def _generate_multiple_passwords(scale, tmp):
+    from pypassguard.generator import generate_multiple_passwords
+    count = 200 * scale
+    return lambda: generate_multiple_passwords(count, 16), count
+
+@case('generate_passwords_bulk')
+def _generate_passwords_bulk(scale, tmp):
+    from pypassguard.generator import generate_passwords_bulk
+    count = 2000 * scale
+    return lambda: list(generate_passwords_bulk(count, 16)), count
+
+@case('passphrase')
+def _passphrase(scale, tmp):
+    from pypassguard.passphrase import open_word_list
+    wordlist = open_word_list()
+    count = 200 * scale
+    return lambda: [wordlist.passphrase(6) for _ in range(count)], count
+
+@case('passphrases_bulk[200k words]')
+def _passphrases_bulk(scale, tmp):
+    from pypassguard.passphrase import WordList, build_word_list
+    source, path = os.path.join(tmp, 'words.txt'), os.path.join(tmp, 'words.ppw')
+    write_word_list(source, 200_000)
+    build_word_list([source], path)
+    wordlist = WordList(path)
+    count = 2000 * scale
+    return lambda: list(wordlist.passphrases_bulk(count, 6)), count
+
+def _validate_case(profile):
+    def setup(scale, tmp):
+        from pypassguard.validator import validate_password
+        passwords = random_passwords(1000 * scale, lengths=LENGTH_PROFILES[profile])
+        return lambda: [validate_password(p) for p in passwords], len(passwords)
+    return setup
+
+for _profile in ('short', 'typical', 'long', 'passphrase'):
+    case(f'validate_password[{_profile}]')(_validate_case(_profile))
+
+@case('validate_password[realistic]')
+def _validate_realistic(scale, tmp):
+    from pypassguard.validator import validate_password
+    passwords = realistic_passwords(1000 * scale)
+    return lambda: [validate_password(p) for p in passwords], len(passwords)
+
+@case('validate_password_result[realistic]')
+def _validate_result(scale, tmp):
+    from pypassguard.validator import validate_password_result
+    passwords = realistic_passwords(1000 * scale)
+    return lambda: [validate_password_result(p) for p in passwords], len(passwords)
+
+@case('validate_batch[realistic]')
+def _validate_batch(scale, tmp):
+    from pypassguard.validator import validate_batch
+    passwords = realistic_passwords(1000 * scale)
+    return lambda: validate_batch(passwords).failure_counts(), len(passwords)
+
+@case('validate_password_mask[realistic]')
+def _validate_mask(scale, tmp):
+    from pypassguard.validator import validate_password_mask
+    passwords = realistic_passwords(1000 * scale)
+    return lambda: [validate_password_mask(p) for p in passwords], len(passwords)
+
+@case('audit_stream[realistic]')
+def _audit_stream(scale, tmp):
+    import io
+    from pypassguard.audit import audit_stream
+    passwords = realistic_passwords(5000 * scale)
+    data = ('\n'.join(passwords) + '\n').encode('utf-8')
+    return lambda: audit_stream(io.BytesIO(data)).report(), len(passwords)
+
+@case('ValidationSession[typing]')
+def _session(scale, tmp):
+    from pypassguard.session import ValidationSession
+    passwords = realistic_passwords(200 * scale)
+
+    def run():
+        for password in passwords:
+            session = ValidationSession()
+            for char in password:
+                session.append(char)
+                session.result()
+    return run, sum(len(p) for p in passwords)
+
+@case('blocklist.contains_any[100k]')
+def _blocklist(scale, tmp):
+    from pypassguard.blocklist import Blocklist
+    from pypassguard.config import COMMON_SUBSTITUTIONS
+    path = os.path.join(tmp, 'words.txt')
+    write_word_list(path, 100_000)
+    blocklist = Blocklist.from_file(path, substitutions=COMMON_SUBSTITUTIONS)
+    passwords = realistic_passwords(1000 * scale)
+    return lambda: [blocklist.contains_any(p) for p in passwords], len(passwords)
+
+def _breach_case(bloom):
+    def setup(scale, tmp):
+        from pypassguard.bloom import build_filter
+        from pypassguard.breach import BreachIndex, build_index
+        dump = os.path.join(tmp, 'dump.txt')
+        index_path = os.path.join(tmp, 'breach.idx')
+        if not os.path.exists(index_path):
+            write_hash_dump(dump, 200_000)
+            build_index([dump], index_path)
+        bloom_path = None
+        if bloom:
+            bloom_path = os.path.join(tmp, 'breach.bloom')
+            with BreachIndex(index_path) as index:
+                build_filter(index.iter_digests(), len(index), bloom_path, 0.001,
+                             source=index.fingerprint())
+        index = BreachIndex(index_path, bloom_path)
+        # Listed digests alternating with misses
+        with open(dump) as f:
+            hits = [bytes.fromhex(line[:40]) for _, line in zip(range(500 * scale), f)]
+        misses = [bytes.fromhex(f'{i:040x}') for i in range(len(hits))]
+        digests = [d for pair in zip(hits, misses) for d in pair]
+        return lambda: [index.lookup_digest(d) for d in digests], len(digests)
+    return setup
+
+case('breach.lookup_digest')(_breach_case(bloom=False))
+case('breach.lookup_digest[bloom]')(_breach_case(bloom=True))
+
+def _calibrate(func, min_time):
+    """Calls per repeat so that one repeat takes at least `min_time` seconds."""
+    number = 1
+    while True:
+        elapsed = timeit.Timer(func, timer=time.perf_counter_ns).timeit(number) / 1e9
+        if elapsed >= min_time:
+            return number
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.2))
+
+def run_case(setup, scale, tmp, repeat, min_time):
+    """Time one case; returns its result record."""
+    func, items = setup(scale, tmp)
+    func()  # Warm caches, lazy tables and the allocator
+    number = _calibrate(func, min_time)
+    runs = timeit.Timer(func, timer=time.perf_counter_ns).repeat(repeat, number)
+    per_item = [ns / number / items for ns in runs]
+    best = min(per_item)
+    return {
+        'ns_per_op': round(best, 2),
+        'median_ns_per_op': round(statistics.median(per_item), 2),
+        'ops_per_sec': round(1e9 / best, 1),
+        'items': items,
+        'number': number,
+        'repeat': repeat,
+    }
+
+def environment():
+    """Where the results came from, so baselines are compared like for like."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    from pypassguard import __version__
+    return {
+        'version': __version__,
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+def run(patterns, scale, repeat, min_time):
+    selected = [name for name in CASES if not patterns or any(fnmatch.fnmatchcase(name, p) for p in patterns)]
+    if not selected:
+        raise SystemExit(f"No benchmark matches {', '.join(patterns)}; see `suite.py list`")
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in selected:
+            results[name] = run_case(CASES[name], scale, tmp, repeat, min_time)
+            print(f"{name:40} {results[name]['ns_per_op']:12,.1f} ns/op "
+                  f"{results[name]['ops_per_sec']:14,.0f} ops/s", file=sys.stderr)
+    return {'format': RESULTS_VERSION, 'environment': environment(), 'results': results}
+
+def compare(baseline, current, threshold):
+    """
+    Print a comparison table.
+
+    Returns:
+        List[str]: Names of cases slower than the baseline by more than
+        `threshold` (a fraction, e.g. 0.10 for 10%)
+    """
+    regressions = []
+    print(f"{'benchmark':40} {'baseline ns':>12} {'current ns':>12} {'change':>8}")
+    print("-" * 75)
+    for name, result in current['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            print(f"{name:40} {'-':>12} {result['ns_per_op']:12,.1f} {'new':>8}")
+            continue
+        change = result['ns_per_op'] / old['ns_per_op'] - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:40} {old['ns_per_op']:12,.1f} {result['ns_per_op']:12,.1f} {change:+8.1%}{flag}")
+    for name in sorted(baseline['results'].keys() - current['results'].keys()):
+        print(f"{name:40} {'(not run)':>12}")
+    if baseline.get('environment', {}).get('machine') != current.get('environment', {}).get('machine'):
+        print("\nWarning: baseline was recorded on a different machine type", file=sys.stderr)
+    return regressions
+
+def _load(path):
+    with open(path, encoding='utf-8') as f:
+        results = json.load(f)
+    if results.get('format') != RESULTS_VERSION:
+        raise SystemExit(f"{path}: unsupported results format {results.get('format')!r}")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the suite and write JSON results')
+    run_parser.add_argument('--output', '-o', help='Write results to this file (default: stdout)')
+    run_parser.add_argument('--filter', '-k', action='append', default=[], metavar='PATTERN',
+                            help='Only run cases matching this glob (repeatable)')
+    run_parser.add_argument('--quick', action='store_true', help='Smaller corpora and shorter runs')
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--min-time', type=float, default=0.2,
+                            help='Minimum seconds per repeat (default: 0.2)')
+    run_parser.add_argument('--baseline', help='Compare against these results afterwards')
+    run_parser.add_argument('--threshold', type=float, default=0.10,
+                            help='Allowed slowdown before failing, as a fraction (default: 0.10)')
+
+    compare_parser = commands.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help='Allowed slowdown before failing, as a fraction (default: 0.10)')
+
+    commands.add_parser('list', help='List the benchmark cases')
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        print('\n'.join(CASES))
+        return 0
+
+    if args.command == 'run':
+        scale, min_time = (1, min(args.min_time, 0.05)) if args.quick else (5, args.min_time)
+        current = run(args.filter, scale, args.repeat, min_time)
+        text = json.dumps(current, indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
+        elif not args.baseline:
+            print(text)
+        if not args.baseline:
+            return 0
+        baseline = _load(args.baseline)
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}: "
+              f"{', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""
+PyPassGuard - Comprehensive Password Security Toolkit
+
+Modules are imported on demand (`from pypassguard.validator import
+validate_password`); importing the package itself loads nothing else.
+"""
+
+__version__ = '1.0.0'
@@ -0,0 +1,198 @@
+import asyncio
+import bisect
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .hasher import get_hasher, verify_password
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float('inf'))
+
+class QueueFullError(RuntimeError):
+    """Raised when more hashing requests are waiting than the queue allows."""
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; cheap enough to update on every call."""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * len(buckets_ms)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (ms) of the bucket holding the given fraction of samples."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.buckets_ms, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.buckets_ms[-1]
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary statistics as a plain dict."""
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p99_ms': self.percentile(0.99),
+        }
+
+class AsyncHasher:
+    """
+    Runs slow password hashing on a bounded thread pool for asyncio code.
+
+    hashlib's PBKDF2 and scrypt release the GIL while they work, so hashes
+    run in parallel on the pool while the event loop keeps serving other
+    requests. At most `max_queue` requests may be pending; beyond that
+    calls fail fast with QueueFullError so callers can shed load. Batches
+    take at most one slot per worker thread and feed their items through
+    those slots, so a batch of any size either runs to completion or is
+    rejected before anything is submitted.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: int = 256,
+                 scheme: Optional[str] = None, **params):
+        """
+        Args:
+            max_workers (int, optional): Hashing threads (default: executor default)
+            max_queue (int): Maximum pending requests (default: 256)
+            scheme (str, optional): Scheme for new hashes (default: from config)
+            **params: Work factor overrides for the scheme
+        """
+        self.max_queue = max_queue
+        # ThreadPoolExecutor's own default
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.hasher = get_hasher(scheme, **params)
+        self.pending = 0
+        self.rejected = 0
+        self.latency = {'hash': LatencyHistogram(), 'verify': LatencyHistogram()}
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='pypassguard-hash')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Shut down the thread pool, waiting for running hashes."""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, kind: str, func, *args):
+        if self.pending >= self.max_queue:
+            self.rejected += 1
+            raise QueueFullError(f"{self.pending} hashing requests already pending")
+
+        self.pending += 1
+        try:
+            return await self._submit(kind, func, *args)
+        finally:
+            self.pending -= 1
+
+    async def _submit(self, kind: str, func, *args):
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.latency[kind].record(time.perf_counter() - start)
+
+    async def _run_many(self, kind: str, func, batch: List[tuple]) -> list:
+        if not batch:
+            return []
+        free = self.max_queue - self.pending
+        if free <= 0:
+            self.rejected += 1
+            raise QueueFullError(f"{self.pending} hashing requests already pending")
+
+        # Reserve the slots up front; other callers cannot take them mid-batch
+        slots = min(free, len(batch), self.max_workers)
+        self.pending += slots
+        results = [None] * len(batch)
+        items = iter(enumerate(batch))
+
+        async def feed():
+            for index, args in items:
+                results[index] = await self._submit(kind, func, *args)
+
+        tasks = [asyncio.ensure_future(feed()) for _ in range(slots)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # After a failure, stop the other feeders from submitting more
+            for task in tasks:
+                task.cancel()
+            self.pending -= slots
+        return results
+
+    async def hash_password(self, password: str) -> str:
+        """Hash a password for storage without blocking the event loop."""
+        return await self._run('hash', self.hasher.encode, password)
+
+    async def verify(self, password: str, encoded: str) -> bool:
+        """Verify a password against an encoded hash without blocking the event loop."""
+        return await self._run('verify', verify_password, password, encoded)
+
+    async def hash_many(self, passwords: Iterable[str]) -> List[str]:
+        """Hash a batch of passwords concurrently, one at a time per reserved slot."""
+        return await self._run_many('hash', self.hasher.encode, [(p,) for p in passwords])
+
+    async def verify_many(self, pairs: Iterable[Tuple[str, str]]) -> List[bool]:
+        """Verify a batch of (password, encoded) pairs concurrently."""
+        return await self._run_many('verify', verify_password, [tuple(pair) for pair in pairs])
+
+    def stats(self) -> Dict[str, object]:
+        """Queue depth, rejections and latency summaries."""
+        return {
+            'pending': self.pending,
+            'rejected': self.rejected,
+            'hash': self.latency['hash'].snapshot(),
+            'verify': self.latency['verify'].snapshot(),
+        }
+
+_default_hasher: Optional[AsyncHasher] = None
+
+def _get_default() -> AsyncHasher:
+    global _default_hasher
+    if _default_hasher is None:
+        _default_hasher = AsyncHasher()
+    return _default_hasher
+
+async def async_hash_password(password: str) -> str:
+    """
+    Hash a password for storage on the shared thread pool.
+
+    Args:
+        password (str): The password to hash
+
+    Returns:
+        str: Encoded hash, as produced by hasher.encode_password
+    """
+    return await _get_default().hash_password(password)
+
+async def async_verify(password: str, encoded: str) -> bool:
+    """
+    Verify a password on the shared thread pool.
+
+    Args:
+        password (str): Password to check
+        encoded (str): Stored encoded hash
+
+    Returns:
+        bool: True if the password matches
+    """
+    return await _get_default().verify(password, encoded)
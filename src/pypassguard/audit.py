@@ -0,0 +1,468 @@
+import base64
+import heapq
+import json
+import math
+import string
+import zlib
+from collections import Counter
+from hashlib import blake2b
+from typing import IO, Dict, Iterable, List, Mapping, Optional
+
+from . import validator
+from .bulk_hash import read_blocks
+from .config import AUDIT_SETTINGS, COMMON_SUBSTITUTIONS
+from .leet import reverse_substitutions
+from .results import summarize_masks
+from .rules import CHECK_BITS, SPECIAL
+
+# Saved states are JSON documents tagged with this format and version
+STATE_FORMAT = 'pypassguard-audit'
+STATE_VERSION = 1
+
+# Bytes of input per block; each block is counted exactly (duplicates are
+# validated once) before it is folded into the sketches, and is one unit
+# of work for a worker
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# Class bits -> histogram key, e.g. 'lowercase+digits'
+_CLASS_NAMES = tuple('+'.join(name for name, bit in CHECK_BITS if bits & bit) or 'none'
+                     for bits in range(SPECIAL << 1))
+
+# Decoration stripped from both ends of a password to find its base word
+_DECORATION = string.digits + string.punctuation + string.whitespace
+
+# Substitute -> the first letter it stands for ('0' -> 'o', '1' -> 'i')
+_DELEET = str.maketrans({sub: letters[0] for sub, letters
+                         in reverse_substitutions(COMMON_SUBSTITUTIONS).items()})
+
+class AuditError(ValueError):
+    """Raised when an audit state is malformed or states cannot be merged."""
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-value counter (Flajolet et al., 2007).
+
+    Values are hashed to 64 bits with BLAKE2b, which is the same on every
+    host, so sketches of different shards of a dump merge (register-wise
+    maximum) into exactly the sketch of the whole. Memory is 2**precision
+    bytes however many values are added; the standard error of count()
+    is about 1.04 / sqrt(2**precision).
+    """
+
+    __slots__ = ('precision', 'registers')
+
+    def __init__(self, precision: int = 14, registers: Optional[bytes] = None):
+        """
+        Args:
+            precision (int): log2 of the number of registers, 7 to 18
+            registers (bytes, optional): Saved registers to resume from
+
+        Raises:
+            AuditError: If precision is out of range or the registers do
+                not match it
+        """
+        if not 7 <= precision <= 18:
+            raise AuditError(f"HyperLogLog precision must be between 7 and 18, got {precision}")
+        size = 1 << precision
+        if registers is not None and len(registers) != size:
+            raise AuditError(f"expected {size} HyperLogLog registers, got {len(registers)}")
+        self.precision = precision
+        self.registers = bytearray(size) if registers is None else bytearray(registers)
+
+    def update(self, values: Iterable[str]) -> None:
+        """Add values; adding one again changes nothing."""
+        registers = self.registers
+        shift = 64 - self.precision
+        low = (1 << shift) - 1
+        for value in values:
+            digest = blake2b(value.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+            hashed = int.from_bytes(digest, 'big')
+            index = hashed >> shift
+            # Position of the first 1 bit after the index bits
+            rank = shift - (hashed & low).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Fold in another sketch; the result counts the union of both inputs."""
+        if other.precision != self.precision:
+            raise AuditError(f"cannot merge HyperLogLog sketches of precision "
+                             f"{self.precision} and {other.precision}")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        """Estimated number of distinct values added."""
+        size = len(self.registers)
+        histogram = Counter(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(count * 2.0 ** -rank
+                                             for rank, count in histogram.items())
+        zeros = histogram.get(0, 0)
+        if estimate <= 2.5 * size and zeros:
+            # Small-range correction: linear counting over the empty registers
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+    @property
+    def standard_error(self) -> float:
+        """Relative standard error of count()."""
+        return 1.04 / math.sqrt(1 << self.precision)
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable state; registers are compressed and base64-encoded."""
+        return {'precision': self.precision,
+                'registers': base64.b64encode(zlib.compress(bytes(self.registers))).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, state: Mapping) -> 'HyperLogLog':
+        try:
+            registers = zlib.decompress(base64.b64decode(state['registers']))
+            return cls(state['precision'], registers)
+        except (KeyError, TypeError, ValueError, zlib.error) as e:
+            raise AuditError(f"invalid HyperLogLog state: {e}") from None
+
+class SpaceSaving:
+    """
+    Space-Saving top-k summary (Metwally et al., 2005), updated in batches.
+
+    At most `capacity` items are tracked, each with a count that may
+    overestimate the true one by at most its `error`; any item occurring
+    more than total / capacity times is always tracked. Batches of exact
+    counts and other summaries are folded in with the mergeable-summary
+    rule: an item missing from a full side is taken to have that side's
+    smallest tracked count (its floor), then only the `capacity` largest
+    counts are kept.
+    """
+
+    __slots__ = ('capacity', 'counts', 'errors')
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Args:
+            capacity (int): Maximum number of tracked items
+        """
+        if capacity < 1:
+            raise AuditError("Space-Saving capacity must be at least 1")
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def floor(self) -> int:
+        """Most times an untracked item can have occurred."""
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def update(self, counts: Mapping[str, int]) -> None:
+        """Fold in exact counts, e.g. a Counter over one block of the input."""
+        self._combine(counts, {}, 0)
+
+    def merge(self, other: 'SpaceSaving') -> None:
+        """Fold in another summary, e.g. one built from another shard."""
+        self._combine(other.counts, other.errors, other.floor)
+
+    def _combine(self, counts: Mapping[str, int], errors: Mapping[str, int], floor: int) -> None:
+        mine, my_floor = self.counts, self.floor
+        if floor:
+            combined = {item: count + floor for item, count in mine.items()}
+            combined_errors = {item: error + floor for item, error in self.errors.items()}
+        else:
+            combined, combined_errors = dict(mine), dict(self.errors)
+        error_of = errors.get
+        for item, count in counts.items():
+            if item in mine:
+                combined[item] += count - floor
+                combined_errors[item] += error_of(item, 0) - floor
+            else:
+                combined[item] = my_floor + count
+                combined_errors[item] = my_floor + error_of(item, 0)
+        if len(combined) > self.capacity:
+            combined = {item: combined[item]
+                        for item in heapq.nlargest(self.capacity, combined, key=combined.get)}
+            combined_errors = {item: combined_errors[item] for item in combined}
+        self.counts, self.errors = combined, combined_errors
+
+    def top(self, n: int) -> List[tuple]:
+        """
+        The n most frequent items.
+
+        Returns:
+            List[tuple]: (item, count, error), most frequent first; the true
+            count lies in [count - error, count]
+        """
+        counts, errors = self.counts, self.errors
+        items = heapq.nsmallest(n, counts, key=lambda item: (-counts[item], item))
+        return [(item, counts[item], errors[item]) for item in items]
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable state."""
+        return {'capacity': self.capacity,
+                'items': [[item, count, self.errors[item]] for item, count in self.counts.items()]}
+
+    @classmethod
+    def from_dict(cls, state: Mapping) -> 'SpaceSaving':
+        try:
+            summary = cls(state['capacity'])
+            for item, count, error in state['items']:
+                summary.counts[item] = count
+                summary.errors[item] = error
+        except (KeyError, TypeError, ValueError) as e:
+            raise AuditError(f"invalid Space-Saving state: {e}") from None
+        return summary
+
+def base_word(password: str) -> str:
+    """
+    The word a password is built on.
+
+    The password is lowercased, digits, punctuation and whitespace are
+    stripped from both ends and common substitutions (COMMON_SUBSTITUTIONS)
+    are undone: 'P@ssw0rd123!' -> 'password'. Empty when nothing but
+    decoration remains, e.g. for '123456'.
+    """
+    return password.lower().strip(_DECORATION).translate(_DELEET)
+
+def _rules(policy: Optional[str]):
+    if policy is None:
+        return validator._RULES
+    from .policy import get_policy
+    return get_policy(policy).rules
+
+class AuditSketch:
+    """
+    Fixed-memory aggregate statistics of a password dump.
+
+    Holds the failure-mask histogram (rule failure rates, as
+    BatchResult.summary), length and character-class histograms,
+    HyperLogLog distinct counts of passwords and base words, and
+    Space-Saving lists of the most frequent of both. Passwords are added
+    in batches, each counted exactly first so that a password repeated in
+    a batch is validated and hashed once. Sketches of different shards
+    merge into the sketch of the whole; save() and load() carry them
+    between machines.
+    """
+
+    __slots__ = ('policy', 'max_length', 'total', 'masks', 'lengths', 'classes',
+                 'distinct_passwords', 'distinct_base_words', 'top_passwords', 'top_base_words')
+
+    def __init__(self, policy: Optional[str] = None, precision: Optional[int] = None,
+                 capacity: Optional[int] = None, max_length: Optional[int] = None):
+        """
+        Args:
+            policy (str, optional): Named policy profile the passwords are
+                validated against (default: PASSWORD_REQUIREMENTS)
+            precision (int, optional): HyperLogLog precision (default: from config)
+            capacity (int, optional): Space-Saving capacity (default: from config)
+            max_length (int, optional): Last length bucket (default: from config)
+        """
+        precision = precision or AUDIT_SETTINGS['hll_precision']
+        capacity = capacity or AUDIT_SETTINGS['top_k_capacity']
+        self.policy = policy
+        self.max_length = max_length or AUDIT_SETTINGS['max_length']
+        self.total = 0
+        self.masks: Counter = Counter()
+        self.lengths: Counter = Counter()
+        self.classes: Counter = Counter()
+        self.distinct_passwords = HyperLogLog(precision)
+        self.distinct_base_words = HyperLogLog(precision)
+        self.top_passwords = SpaceSaving(capacity)
+        self.top_base_words = SpaceSaving(capacity)
+
+    def update(self, passwords: Iterable[str]) -> None:
+        """
+        Add a batch of passwords.
+
+        Memory grows with the number of distinct passwords in the batch,
+        so feed a large input in batches (see audit_stream).
+        """
+        counts = Counter(passwords)
+        check = validator._checker(self.policy)
+        classify = _rules(self.policy).classes
+        masks, lengths, classes = self.masks, self.lengths, self.classes
+        max_length = self.max_length
+        bases: Counter = Counter()
+        for password, count in counts.items():
+            masks[check(password)] += count
+            lengths[min(len(password), max_length)] += count
+            classes[classify(password)] += count
+            base = base_word(password)
+            if base:
+                bases[base] += count
+        self.total += sum(counts.values())
+        self.distinct_passwords.update(counts)
+        self.distinct_base_words.update(bases)
+        self.top_passwords.update(counts)
+        self.top_base_words.update(bases)
+
+    def merge(self, other: 'AuditSketch') -> None:
+        """
+        Fold in the sketch of another shard.
+
+        Raises:
+            AuditError: If the sketches used different policies, length
+                buckets or HyperLogLog precisions
+        """
+        if other.policy != self.policy:
+            raise AuditError(f"cannot merge audits against policies "
+                             f"{self.policy or 'default'!r} and {other.policy or 'default'!r}")
+        if other.max_length != self.max_length:
+            raise AuditError("cannot merge audits with different length buckets")
+        self.distinct_passwords.merge(other.distinct_passwords)
+        self.distinct_base_words.merge(other.distinct_base_words)
+        self.total += other.total
+        self.masks.update(other.masks)
+        self.lengths.update(other.lengths)
+        self.classes.update(other.classes)
+        self.top_passwords.merge(other.top_passwords)
+        self.top_base_words.merge(other.top_base_words)
+
+    def report(self, top: Optional[int] = None) -> Dict:
+        """
+        The audit report.
+
+        Args:
+            top (int, optional): Entries per top-k list (default: from config)
+
+        Returns:
+            Dict: JSON-serializable report: BatchResult.summary fields,
+            distinct counts, histograms and top-k lists with error bounds
+        """
+        top = AUDIT_SETTINGS['top_k'] if top is None else top
+        report = {'policy': self.policy}
+        report.update(summarize_masks(self.masks))
+        last = self.max_length
+        report.update({
+            'distinct_passwords': self.distinct_passwords.count(),
+            'distinct_base_words': self.distinct_base_words.count(),
+            'length_histogram': {(f'{length}+' if length == last else str(length)): count
+                                 for length, count in sorted(self.lengths.items())},
+            'class_histogram': {_CLASS_NAMES[bits]: count
+                                for bits, count in self.classes.most_common()},
+            'top_passwords': [{'password': item, 'count': count, 'error': error}
+                              for item, count, error in self.top_passwords.top(top)],
+            'top_base_words': [{'base_word': item, 'count': count, 'error': error}
+                               for item, count, error in self.top_base_words.top(top)],
+            'sketch': {
+                'hll_precision': self.distinct_passwords.precision,
+                'distinct_standard_error': round(self.distinct_passwords.standard_error, 5),
+                'top_k_capacity': self.top_passwords.capacity,
+            },
+        })
+        return report
+
+    def to_dict(self) -> Dict:
+        """Mergeable state as a JSON-serializable dict."""
+        return {
+            'format': STATE_FORMAT,
+            'version': STATE_VERSION,
+            'policy': self.policy,
+            'max_length': self.max_length,
+            'total': self.total,
+            'masks': {str(mask): count for mask, count in self.masks.items()},
+            'lengths': {str(length): count for length, count in self.lengths.items()},
+            'classes': {str(bits): count for bits, count in self.classes.items()},
+            'distinct_passwords': self.distinct_passwords.to_dict(),
+            'distinct_base_words': self.distinct_base_words.to_dict(),
+            'top_passwords': self.top_passwords.to_dict(),
+            'top_base_words': self.top_base_words.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Mapping) -> 'AuditSketch':
+        """
+        Rebuild a sketch from to_dict output.
+
+        Raises:
+            AuditError: If the state is not a valid audit state
+        """
+        if not isinstance(state, Mapping) or state.get('format') != STATE_FORMAT:
+            raise AuditError("not a PyPassGuard audit state")
+        if state.get('version') != STATE_VERSION:
+            raise AuditError(f"unsupported audit state version: {state.get('version')}")
+        try:
+            sketch = cls(state['policy'], max_length=state['max_length'])
+            sketch.total = state['total']
+            sketch.masks = Counter({int(k): v for k, v in state['masks'].items()})
+            sketch.lengths = Counter({int(k): v for k, v in state['lengths'].items()})
+            sketch.classes = Counter({int(k): v for k, v in state['classes'].items()})
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise AuditError(f"invalid audit state: {e}") from None
+        sketch.distinct_passwords = HyperLogLog.from_dict(state.get('distinct_passwords', {}))
+        sketch.distinct_base_words = HyperLogLog.from_dict(state.get('distinct_base_words', {}))
+        sketch.top_passwords = SpaceSaving.from_dict(state.get('top_passwords', {}))
+        sketch.top_base_words = SpaceSaving.from_dict(state.get('top_base_words', {}))
+        return sketch
+
+    def save(self, path: str) -> None:
+        """Write the mergeable state as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'AuditSketch':
+        """
+        Read a state written by save().
+
+        Raises:
+            OSError: If the file cannot be read
+            AuditError: If it is not a valid audit state
+        """
+        with open(path, encoding='utf-8') as f:
+            try:
+                state = json.load(f)
+            except ValueError as e:
+                raise AuditError(f"{path}: not a JSON audit state: {e}") from None
+        return cls.from_dict(state)
+
+def block_passwords(block: bytes) -> List[str]:
+    """Non-empty lines of a block from read_blocks, decoded as read_passwords does."""
+    text = block.decode('utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+    return [line for line in text.split('\n') if line]
+
+def audit_stream(source: IO[bytes], policy: Optional[str] = None, workers: int = 1,
+                 block_size: int = DEFAULT_BLOCK_SIZE, blocklist: Optional[str] = None,
+                 precision: Optional[int] = None, capacity: Optional[int] = None) -> AuditSketch:
+    """
+    Audit a password dump in one streaming pass.
+
+    The input is read in line-aligned blocks; each block is sketched on
+    its own (in a worker process when workers > 1) and merged into the
+    result, so memory is a few blocks plus the fixed-size sketches.
+
+    Args:
+        source (IO[bytes]): Binary stream with one password per line
+        policy (str, optional): Named policy profile (default: PASSWORD_REQUIREMENTS)
+        workers (int): Worker processes; 1 audits in this process
+        block_size (int): Bytes per block (default: 1 MiB)
+        blocklist (str, optional): Word list loaded in every worker
+        precision (int, optional): HyperLogLog precision (default: from config)
+        capacity (int, optional): Space-Saving capacity (default: from config)
+
+    Returns:
+        AuditSketch: Sketch of the whole input
+    """
+    sketch = AuditSketch(policy, precision, capacity)
+    blocks = read_blocks(source, block_size)
+    if workers <= 1:
+        for block in blocks:
+            sketch.update(block_passwords(block))
+        return sketch
+    from .parallel import parallel_map
+    tasks = ((block, policy, precision, capacity) for block in blocks)
+    for _, partial in parallel_map(_audit_task, tasks, workers,
+                                   initializer=_init_audit, initargs=(blocklist,)):
+        sketch.merge(partial)
+    return sketch
+
+def _init_audit(blocklist: Optional[str]) -> None:
+    if blocklist:
+        validator.load_blocklist(blocklist)
+
+def _audit_task(task: tuple) -> AuditSketch:
+    block, policy, precision, capacity = task
+    sketch = AuditSketch(policy, precision, capacity)
+    sketch.update(block_passwords(block))
+    return sketch
@@ -0,0 +1,114 @@
+import csv
+import itertools
+import json
+import time
+from typing import IO, Iterable, Iterator, Tuple
+
+OUTPUT_FORMATS = ('jsonl', 'csv')
+
+def read_passwords(stream: IO[str]) -> Iterator[str]:
+    """
+    Yield one password per line from a text stream.
+
+    Trailing newlines are stripped and blank lines are skipped. The stream is
+    read lazily, so arbitrarily large files use a constant amount of memory.
+
+    Args:
+        stream (IO[str]): Open text stream (file or stdin)
+
+    Yields:
+        str: Password from each non-empty line
+    """
+    for line in stream:
+        password = line.rstrip('\r\n')
+        if password:
+            yield password
+
+def write_lines(out: IO[str], lines: Iterable[str], batch_size: int = 65536) -> int:
+    """
+    Write strings one per line, joining them in batches to cut write calls.
+
+    Args:
+        out (IO[str]): Stream to write to
+        lines (Iterable[str]): Lines without trailing newlines
+        batch_size (int): Lines joined per write (default: 65536)
+
+    Returns:
+        int: Number of lines written
+    """
+    written = 0
+    iterator = iter(lines)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return written
+        out.write('\n'.join(batch))
+        out.write('\n')
+        written += len(batch)
+
+def write_validation_results(results: Iterable[Tuple[str, bool, Tuple[str, ...]]],
+                             out: IO[str], fmt: str = 'jsonl') -> int:
+    """
+    Write results from validator.validate_many in a compact line format.
+
+    Args:
+        results (Iterable): (password, is_valid, failed_checks) tuples
+        out (IO[str]): Stream to write to
+        fmt (str): 'jsonl' or 'csv' (default: 'jsonl')
+
+    Returns:
+        int: Number of results written
+
+    Raises:
+        ValueError: If fmt is not a supported output format
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {fmt}")
+
+    count = 0
+    write = out.write
+
+    if fmt == 'csv':
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(('password', 'valid', 'failed'))
+        for password, is_valid, failed in results:
+            writer.writerow((password, int(is_valid), ';'.join(failed)))
+            count += 1
+        return count
+
+    # The set of distinct failure combinations is tiny, so their JSON
+    # fragments are rendered once and reused for every line.
+    failed_json = {}
+    for password, is_valid, failed in results:
+        fragment = failed_json.get(failed)
+        if fragment is None:
+            fragment = failed_json[failed] = json.dumps(list(failed))
+        write('{"password": %s, "valid": %s, "failed": %s}\n'
+              % (json.dumps(password), 'true' if is_valid else 'false', fragment))
+        count += 1
+    return count
+
+class Throughput:
+    """Context manager measuring items per second for a batch run."""
+
+    def __init__(self):
+        self.count = 0
+        self.elapsed = 0.0
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self._start
+        return False
+
+    @property
+    def rate(self) -> float:
+        """Items processed per second."""
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self, noun: str = 'passwords', verb: str = 'Processed') -> str:
+        """Human-readable throughput line."""
+        return f"{verb} {self.count} {noun} in {self.elapsed:.2f}s ({self.rate:,.0f} {noun}/sec)"
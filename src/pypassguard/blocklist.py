@@ -0,0 +1,404 @@
+import os
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from .leet import canonical_table
+
+# Patterns shorter than this would match almost every password
+MIN_PATTERN_LENGTH = 3
+
+# Up to this many patterns a plain `in` scan beats hashing every window
+SMALL_LIST_SIZE = 64
+
+class Blocklist:
+    """
+    Case-insensitive multi-pattern substring matcher.
+
+    Patterns are bucketed by length into hash sets when the list is built.
+    A lookup hashes each window of the password once per distinct pattern
+    length, so its cost depends on the password length and the number of
+    distinct lengths, never on how many patterns are loaded. Small lists
+    fall back to a direct substring scan, which is faster at that size.
+
+    When built from a file, the list is reloaded automatically after the
+    file changes, checked at most once every `reload_interval` seconds.
+
+    Given a substitution map, patterns and passwords are both reduced to a
+    de-leeted normal form (see leet.canonical_table), so 'p@$$w0rd' hits
+    'password' with one extra translate call and no variant expansion.
+    Patterns without letters ('123456', '!@#$') are kept out of it and
+    matched against the lowercased password alone, since their normal form
+    is made of letters and would match plain words ('izeasb').
+    """
+
+    def __init__(self, patterns: Iterable[str] = (), path: Optional[str] = None,
+                 reload_interval: float = 5.0,
+                 substitutions: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            patterns (Iterable[str]): Patterns that are always included
+            path (str, optional): Word list file, one pattern per line
+            reload_interval (float): Seconds between file change checks
+            substitutions (Dict[str, List[str]], optional): Letter -> leetspeak
+                substitutes to see through, e.g. COMMON_SUBSTITUTIONS
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+        self._table = canonical_table(substitutions) if substitutions else None
+        self._base = frozenset(_normalize(patterns))
+        self._mtime = None
+        self._next_check = 0.0
+        self._generation = 0
+        self._state = self._build(self._load())
+        # (state, window buckets) for trackers, built on first use per state
+        self._windowed = None
+
+    @classmethod
+    def from_file(cls, path: str, reload_interval: float = 5.0,
+                  substitutions: Optional[Dict[str, List[str]]] = None) -> 'Blocklist':
+        """Build a blocklist from a word list file."""
+        return cls(path=path, reload_interval=reload_interval, substitutions=substitutions)
+
+    def __len__(self) -> int:
+        return self._state[3]
+
+    def _load(self) -> FrozenSet[str]:
+        """Read the word list file (if any) and merge it with the base patterns."""
+        if self.path is None:
+            return self._base
+
+        self._mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, encoding='utf-8', errors='replace') as handle:
+            return self._base.union(_normalize(handle))
+
+    def _build(self, patterns: FrozenSet[str]) -> Tuple:
+        """
+        Build the immutable lookup state: (lengths, buckets, small, count,
+        originals, literal), where literal is a Blocklist of the patterns
+        kept out of the normal form, or None.
+        """
+        patterns, originals, literal = canonical_patterns(patterns, self._table)
+        literal = Blocklist(literal) if literal else None
+        count = len(patterns) + (len(literal) if literal is not None else 0)
+
+        if len(patterns) <= SMALL_LIST_SIZE:
+            return (), {}, tuple(sorted(patterns)), count, originals, literal
+
+        buckets: Dict[int, set] = {}
+        for pattern in patterns:
+            buckets.setdefault(len(pattern), set()).add(pattern)
+        buckets = {length: frozenset(bucket) for length, bucket in buckets.items()}
+        return tuple(sorted(buckets)), buckets, None, count, originals, literal
+
+    def refresh(self) -> bool:
+        """
+        Reload the word list if its file changed on disk.
+
+        Returns:
+            bool: True if the list was reloaded
+        """
+        if self.path is None or os.stat(self.path).st_mtime_ns == self._mtime:
+            return False
+        # Build the new state fully before swapping it in, so concurrent
+        # readers only ever see a complete list
+        self._state = self._build(self._load())
+        self._generation += 1
+        return True
+
+    def generation(self) -> int:
+        """
+        Number of reloads so far, for callers that cache match results.
+
+        Checks the file for changes first, like contains_any, so a cache
+        that skips contains_any still notices an edited word list.
+        """
+        if self.path is not None:
+            self._maybe_refresh()
+        return self._generation
+
+    def _maybe_refresh(self) -> None:
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.reload_interval
+            try:
+                self.refresh()
+            except (OSError, ValueError):
+                # Keep serving the last good list if the file is mid-rewrite,
+                # or was replaced by one that cannot be read (e.g. a shared
+                # blocklist that is truncated or not a shared blocklist at all)
+                pass
+
+    def contains_any(self, password: str) -> bool:
+        """
+        Check whether any pattern occurs in the password.
+
+        Args:
+            password (str): Password to check
+
+        Returns:
+            bool: True if at least one pattern matches
+        """
+        if self.path is not None:
+            self._maybe_refresh()
+
+        lengths, buckets, small, _, _, literal = self._state
+        if literal is not None and literal.contains_any(password):
+            return True
+        text = password.lower()
+        if self._table is not None:
+            text = text.translate(self._table)
+        if small is not None:
+            return any(pattern in text for pattern in small)
+
+        size = len(text)
+        window = text.__getitem__
+        for length in lengths:
+            if length > size:
+                break
+            # Slicing and hashing every window runs at C speed
+            if not buckets[length].isdisjoint(map(window, _windows(size, length))):
+                return True
+        return False
+
+    def _window_buckets(self) -> Tuple[Tuple[int, FrozenSet[str]], ...]:
+        """(length, patterns) for every pattern length, small lists included."""
+        state = self._state
+        windowed = self._windowed
+        if windowed is None or windowed[0] is not state:
+            lengths, buckets, small, _, _, _ = state
+            if small is not None:
+                # Small lists are scanned with `in`; bucket them for windowing
+                grouped: Dict[int, set] = {}
+                for pattern in small:
+                    grouped.setdefault(len(pattern), set()).add(pattern)
+                buckets = {length: frozenset(bucket) for length, bucket in grouped.items()}
+                lengths = sorted(buckets)
+            windowed = self._windowed = (state, tuple((length, buckets[length]) for length in lengths))
+        return windowed[1]
+
+    def tracker(self, password: str = '') -> 'BlocklistTracker':
+        """Incremental contains_any for a password being edited (see BlocklistTracker)."""
+        return BlocklistTracker(self, password)
+
+    def find_all(self, password: str) -> List[Tuple[int, int, str]]:
+        """
+        Find every pattern occurrence in the password.
+
+        Args:
+            password (str): Password to search
+
+        Returns:
+            List[Tuple[int, int, str]]: (start, end, pattern) sorted by position,
+            with the pattern as listed rather than its canonical form
+        """
+        if self.path is not None:
+            self._maybe_refresh()
+
+        lengths, buckets, small, _, originals, literal = self._state
+        text = password.lower()
+        if self._table is not None:
+            text = text.translate(self._table)
+        matches = []
+
+        if small is not None:
+            for pattern in small:
+                start = text.find(pattern)
+                while start != -1:
+                    matches.append((start, start + len(pattern), pattern))
+                    start = text.find(pattern, start + 1)
+        else:
+            size = len(text)
+            for length in lengths:
+                if length > size:
+                    break
+                bucket = buckets[length]
+                for start, window in enumerate(map(text.__getitem__, _windows(size, length))):
+                    if window in bucket:
+                        matches.append((start, start + length, window))
+
+        if originals:
+            matches = [(start, end, originals.get(pattern, pattern))
+                       for start, end, pattern in matches]
+        if literal is not None:
+            matches += literal.find_all(password)
+        matches.sort()
+        return matches
+
+class BlocklistTracker:
+    """
+    Keeps Blocklist.contains_any up to date across edits.
+
+    Holds the password's canonical form one character at a time and the
+    number of pattern occurrences in it. An edit only changes the windows
+    that overlap the edited characters, so only those are rehashed, at
+    most one longest-pattern span on each side of the edit.
+
+    Patterns kept out of the normal form are tracked by a second tracker
+    over the literal patterns' Blocklist.
+
+    The tracker reflects the list as it was when the tracker was made;
+    compare Blocklist.generation() and make a new one after a reload.
+    Characters whose lowercase form is not a single character (or is
+    context-dependent, like final sigma) make `found` fall back to a full
+    contains_any until they are edited away, so the answer always matches.
+    """
+
+    __slots__ = ('blocklist', '_table', '_buckets', '_span', '_canonical', '_irregular', 'matches',
+                 '_literal')
+
+    # Stands in for irregular characters (NUL itself counts as one)
+    _PLACEHOLDER = '\0'
+
+    def __init__(self, blocklist: Blocklist, password: Sequence[str] = ''):
+        """
+        Args:
+            blocklist (Blocklist): Patterns to track
+            password (Sequence[str]): Initial text
+        """
+        self.blocklist = blocklist
+        self._table = blocklist._table
+        self._buckets = blocklist._window_buckets()
+        literal = blocklist._state[5]
+        self._literal = literal.tracker() if literal is not None else None
+        self._span = self._buckets[-1][0] if self._buckets else 1
+        self._canonical: List[str] = []
+        self._irregular = 0
+        # Pattern occurrences in the canonical text
+        self.matches = 0
+        if password:
+            self.splice(password, 0, 0, len(password))
+
+    def found(self, text: Sequence[str]) -> bool:
+        """Same as contains_any on `text`, the current text."""
+        if self._irregular:
+            return self.blocklist.contains_any(''.join(text))
+        return self.matches > 0 or (self._literal is not None and self._literal.found(text))
+
+    def _canonicalize(self, char: str) -> str:
+        text = char.lower()
+        if self._table is not None:
+            text = text.translate(self._table)
+        if len(text) != 1 or text == self._PLACEHOLDER or char == '\u03a3':
+            self._irregular += 1
+            return self._PLACEHOLDER
+        return text
+
+    def _count(self, start: int, width: int) -> int:
+        """Occurrences overlapping [start, start + width), or spanning `start` for width 0."""
+        canonical = self._canonical
+        size = len(canonical)
+        end = start + width
+        if not width and (start == 0 or start >= size):
+            # Nothing spans the very start or end of the text
+            return 0
+        first = start - self._span + 1
+        if first < 0:
+            first = 0
+        segment = ''.join(canonical[first:end + self._span - 1])
+        count = 0
+        for length, bucket in self._buckets:
+            low = start - length + 1
+            if low < first:
+                low = first
+            high = size - length + 1
+            if high > end:
+                high = end
+            for offset in range(low - first, high - first):
+                if segment[offset:offset + length] in bucket:
+                    count += 1
+        return count
+
+    def _count_tail(self) -> int:
+        """Occurrences ending in the last character."""
+        tail = ''.join(self._canonical[-self._span:])
+        size = len(tail)
+        count = 0
+        for length, bucket in self._buckets:
+            if length > size:
+                break
+            if tail[size - length:] in bucket:
+                count += 1
+        return count
+
+    def splice(self, text: Sequence[str], start: int, removed: int, inserted: int) -> None:
+        """
+        Account for an edit that has already been applied to `text`.
+
+        Args:
+            text (Sequence[str]): The text after the edit
+            start (int): Index of the edit
+            removed (int): Characters removed at `start`
+            inserted (int): Characters inserted at `start`
+        """
+        if self._literal is not None:
+            self._literal.splice(text, start, removed, inserted)
+        canonical = self._canonical
+        if start + inserted == len(text) and inserted + removed == 1:
+            # Typing or deleting one character at the end: only occurrences
+            # ending in the last character change
+            if inserted:
+                canonical.append(self._canonicalize(text[-1]))
+                self.matches += self._count_tail()
+            else:
+                self.matches -= self._count_tail()
+                if canonical.pop() == self._PLACEHOLDER:
+                    self._irregular -= 1
+            return
+        # Only occurrences overlapping the edited characters (or spanning
+        # the insertion point) can appear or disappear
+        before = self._count(start, removed)
+        for char in canonical[start:start + removed]:
+            if char == self._PLACEHOLDER:
+                self._irregular -= 1
+        canonical[start:start + removed] = [self._canonicalize(char)
+                                            for char in text[start:start + inserted]]
+        self.matches += self._count(start, inserted) - before
+
+def canonical_patterns(patterns: FrozenSet[str], table: Optional[Dict[int, str]]
+                       ) -> Tuple[FrozenSet[str], Dict[str, str], FrozenSet[str]]:
+    """
+    Reduce normalized patterns to their canonical (de-leeted) forms.
+
+    Patterns without a letter are returned apart, unchanged: their
+    canonical form would be all letters, so '123456' would match 'izeasb'.
+
+    Args:
+        patterns (FrozenSet[str]): Lowercased patterns, as from _normalize
+        table (Dict[int, str], optional): leet.canonical_table; None keeps
+            the patterns as they are
+
+    Returns:
+        Tuple: (canonical patterns, canonical form -> listed pattern where
+        the two differ, patterns to match literally)
+    """
+    originals: Dict[str, str] = {}
+    if table is None:
+        return patterns, originals, frozenset()
+    canonical = set()
+    literal = set()
+    for pattern in patterns:
+        if _is_literal(pattern):
+            literal.add(pattern)
+            continue
+        key = pattern.translate(table)
+        if key != pattern:
+            originals.setdefault(key, pattern)
+        canonical.add(key)
+    return frozenset(canonical), originals, frozenset(literal)
+
+def _is_literal(pattern: str) -> bool:
+    """Whether a pattern has no letters, and so is kept out of the normal form."""
+    return not any(map(str.isalpha, pattern))
+
+@lru_cache(maxsize=4096)
+def _windows(size: int, length: int) -> Tuple[slice, ...]:
+    """Slices for every window of `length` characters in a string of `size`."""
+    return tuple(slice(start, start + length) for start in range(size - length + 1))
+
+def _normalize(patterns: Iterable[str]) -> Iterable[str]:
+    """Strip and lowercase patterns, dropping comments and short entries."""
+    for pattern in patterns:
+        pattern = pattern.strip().lower()
+        if len(pattern) >= MIN_PATTERN_LENGTH and not pattern.startswith('#'):
+            yield pattern
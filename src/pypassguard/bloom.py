@@ -0,0 +1,145 @@
+import math
+import mmap
+import os
+import struct
+from typing import Iterable
+
+# File layout: a fixed 68-byte header followed by the m-bit array.
+# Header: magic, version, digest algorithm, k, m (bits), n (entries), target FPR,
+# fingerprint of the breach index the filter was built from (zeros if none).
+MAGIC = b'PPGBLOM1'
+VERSION = 2
+HEADER = struct.Struct('>8sH8sH4xQQd4x16s')
+SOURCE_SIZE = 16
+
+class BloomFilterError(ValueError):
+    """Raised when a filter file is malformed or of an unsupported version."""
+
+def optimal_parameters(entries: int, fpr: float):
+    """
+    Size a Bloom filter for a target false-positive rate.
+
+    Args:
+        entries (int): Number of items that will be added
+        fpr (float): Target false-positive rate, e.g. 0.001
+
+    Returns:
+        Tuple[int, int]: (bits, hash_count)
+    """
+    if not 0 < fpr < 1:
+        raise ValueError("False-positive rate must be between 0 and 1")
+    entries = max(entries, 1)
+    bits = max(8, math.ceil(-entries * math.log(fpr) / math.log(2) ** 2))
+    hash_count = max(1, round(bits / entries * math.log(2)))
+    return bits, hash_count
+
+class BloomFilter:
+    """
+    Memory-mapped Bloom filter over password digests.
+
+    The items are already cryptographic digests, so the k bit positions are
+    derived from the digest bytes by double hashing instead of hashing again.
+    A clear bit answers "definitely not present" without touching the exact
+    store; only possible hits need a real lookup.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Filter file written by build_filter
+
+        Raises:
+            BloomFilterError: If the file is not a valid filter
+        """
+        self.path = path
+        with open(path, 'rb') as handle:
+            header = handle.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise BloomFilterError(f"{path}: file too short for a filter header")
+            magic, version, algorithm, hash_count, bits, entries, fpr, source = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise BloomFilterError(f"{path}: not a PyPassGuard Bloom filter (v{VERSION})")
+            if os.fstat(handle.fileno()).st_size < HEADER.size + (bits + 7) // 8:
+                raise BloomFilterError(f"{path}: truncated filter")
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.algorithm = algorithm.rstrip(b'\0').decode('ascii')
+        self.hash_count = hash_count
+        self.bits = bits
+        self.entries = entries
+        self.fpr = fpr
+        self.source = source
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Unmap the filter file."""
+        self._mm.close()
+
+    def might_contain(self, digest: bytes) -> bool:
+        """
+        Test a digest against the filter.
+
+        Args:
+            digest (bytes): Digest made with the filter's algorithm
+
+        Returns:
+            bool: False if the digest was definitely never added
+        """
+        mm = self._mm
+        bits = self.bits
+        base = HEADER.size
+        position, step = _hash_pair(digest)
+        for _ in range(self.hash_count):
+            bit = position % bits
+            if not mm[base + (bit >> 3)] & (1 << (bit & 7)):
+                return False
+            position += step
+        return True
+
+def build_filter(digests: Iterable[bytes], entries: int, output: str,
+                 fpr: float = 0.001, algorithm: str = 'sha1', source: bytes = b'') -> int:
+    """
+    Build and write a Bloom filter for a set of digests.
+
+    Args:
+        digests (Iterable[bytes]): Digests to add
+        entries (int): Expected number of digests (sizes the filter)
+        output (str): Path of the filter file to write
+        fpr (float): Target false-positive rate (default: 0.001)
+        algorithm (str): Digest algorithm name recorded in the header
+        source (bytes): Fingerprint of the index the digests come from
+            (BreachIndex.fingerprint()), checked when the two are opened together
+
+    Returns:
+        int: Size of the bit array in bytes
+    """
+    if len(source) > SOURCE_SIZE:
+        raise ValueError(f"Source fingerprint is longer than {SOURCE_SIZE} bytes")
+    bits, hash_count = optimal_parameters(entries, fpr)
+    array = bytearray((bits + 7) // 8)
+    added = 0
+
+    for digest in digests:
+        position, step = _hash_pair(digest)
+        for _ in range(hash_count):
+            bit = position % bits
+            array[bit >> 3] |= 1 << (bit & 7)
+            position += step
+        added += 1
+
+    with open(output, 'wb') as out:
+        out.write(HEADER.pack(MAGIC, VERSION, algorithm.encode('ascii'),
+                              hash_count, bits, added, fpr, source))
+        out.write(array)
+    return len(array)
+
+def _hash_pair(digest: bytes):
+    """Split a digest into the two 64-bit hashes used for double hashing."""
+    # Force a non-zero step so the k probes land on different bits
+    return int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:16], 'big') | 1
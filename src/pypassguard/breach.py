@@ -0,0 +1,385 @@
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+from . import metrics
+from .bloom import SOURCE_SIZE, BloomFilter
+from .hasher import digest_password
+
+# Index layout: a fixed 32-byte header followed by `count` fixed-width
+# records sorted by digest. Each record is the raw digest followed by a
+# big-endian uint32 breach count.
+MAGIC = b'PPGBRIX1'
+VERSION = 1
+HEADER = struct.Struct('>8sHHHHQ8x')
+COUNT = struct.Struct('>I')
+
+ALGORITHMS = {'sha1': (1, 20), 'sha256': (2, 32)}
+_ALGORITHM_IDS = {algorithm_id: name for name, (algorithm_id, _) in ALGORITHMS.items()}
+
+# Records sorted in memory before spilling a run to disk
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Interpolation gives way to plain bisection below this many candidates,
+# or after this many probes (guards against skewed, non-uniform input)
+_BISECT_THRESHOLD = 8
+_MAX_INTERPOLATION_PROBES = 6
+
+# Records hashed, evenly spaced, into an index fingerprint
+_FINGERPRINT_SAMPLES = 256
+
+class BreachIndexError(ValueError):
+    """Raised when an index file is malformed or of the wrong algorithm."""
+
+class BreachIndex:
+    """
+    Memory-mapped, read-only view of a sorted breached-password index.
+
+    Nothing is loaded up front: a lookup touches only the few pages its
+    interpolation search probes. Because digests are uniformly distributed,
+    a lookup needs a handful of probes even for billions of records.
+
+    An optional Bloom filter sits in front of the index so that most misses
+    are answered without touching the index pages at all.
+    """
+
+    def __init__(self, path: str, bloom_path: Optional[str] = None):
+        """
+        Args:
+            path (str): Index file built by build_index
+            bloom_path (str, optional): Bloom filter built from this index
+
+        Raises:
+            BreachIndexError: If the file is not a valid index
+        """
+        self.path = path
+        self.bloom = None
+        self._file = open(path, 'rb')
+        try:
+            header = self._file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise BreachIndexError(f"{path}: file too short for an index header")
+            magic, version, algorithm_id, record_size, digest_size, count = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise BreachIndexError(f"{path}: not a PyPassGuard breach index (v{VERSION})")
+            if algorithm_id not in _ALGORITHM_IDS:
+                raise BreachIndexError(f"{path}: unknown digest algorithm id {algorithm_id}")
+            if os.fstat(self._file.fileno()).st_size < HEADER.size + count * record_size:
+                raise BreachIndexError(f"{path}: truncated index")
+
+            self.algorithm = _ALGORITHM_IDS[algorithm_id]
+            self.record_size = record_size
+            self.digest_size = digest_size
+            self.count = count
+            self._header = header
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if count else None
+        except Exception:
+            self._file.close()
+            raise
+
+        if self._mm is not None and hasattr(self._mm, 'madvise'):
+            # Lookups jump around the file; read-ahead would only waste I/O
+            self._mm.madvise(mmap.MADV_RANDOM)
+
+        if bloom_path is not None:
+            try:
+                self.bloom = BloomFilter(bloom_path)
+                bloom_algorithm = self.bloom.algorithm
+                if bloom_algorithm != self.algorithm:
+                    raise BreachIndexError(
+                        f"{bloom_path}: filter uses {bloom_algorithm}, index uses {self.algorithm}")
+                if self.bloom.source != self.fingerprint():
+                    # A stale filter would turn breached passwords into misses
+                    raise BreachIndexError(
+                        f"{bloom_path}: filter was not built from {path}; rebuild it with bloom-build")
+            except Exception:
+                self.close()
+                raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, password: str) -> bool:
+        return self.lookup(password) > 0
+
+    def close(self) -> None:
+        """Unmap and close the index file."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self.bloom is not None:
+            self.bloom.close()
+            self.bloom = None
+        self._file.close()
+
+    def fingerprint(self) -> bytes:
+        """
+        Short digest identifying this index, recorded in filters built from it.
+
+        Covers the header (algorithm and record count) and a fixed sample of
+        evenly spaced records, so opening a large index stays cheap.
+        """
+        fingerprint = hashlib.blake2b(self._header, digest_size=SOURCE_SIZE)
+        if self.count:
+            step = max(1, self.count // _FINGERPRINT_SAMPLES)
+            for index in list(range(0, self.count, step))[:_FINGERPRINT_SAMPLES] + [self.count - 1]:
+                offset = HEADER.size + index * self.record_size
+                fingerprint.update(self._mm[offset:offset + self.record_size])
+        return fingerprint.digest()
+
+    def iter_digests(self) -> Iterator[bytes]:
+        """Yield every digest in the index in sorted order."""
+        if not self.count:
+            return
+        mm = self._mm
+        for offset in range(HEADER.size, HEADER.size + self.count * self.record_size,
+                            self.record_size):
+            yield mm[offset:offset + self.digest_size]
+
+    def lookup(self, password: str) -> int:
+        """
+        Look up a plaintext password.
+
+        Args:
+            password (str): Password to check
+
+        Returns:
+            int: Number of times the password was seen in breaches (0 if never)
+        """
+        return self.lookup_digest(digest_password(password, self.algorithm))
+
+    def lookup_digest(self, digest: bytes) -> int:
+        """
+        Look up a raw digest with interpolation search over the mapped file.
+
+        Args:
+            digest (bytes): Digest produced with the index's algorithm
+
+        Returns:
+            int: Breach count for the digest (0 if absent)
+        """
+        if len(digest) != self.digest_size:
+            raise ValueError(f"Expected a {self.digest_size}-byte {self.algorithm} digest")
+        if metrics.enabled:
+            with metrics.timer(metrics.LOOKUP_SECONDS, 'breach'):
+                count = self._search(digest)
+            metrics.LOOKUPS.inc('breach', 'hit' if count else 'miss')
+            return count
+        return self._search(digest)
+
+    def _search(self, digest: bytes) -> int:
+        """Bloom pre-check, then the interpolation search proper."""
+        if not self.count:
+            return 0
+        if self.bloom is not None and not self.bloom.might_contain(digest):
+            return 0
+
+        mm = self._mm
+        record_size = self.record_size
+        digest_size = self.digest_size
+        target = int.from_bytes(digest[:8], 'big')
+
+        # Invariant: every record before lo sorts below the digest and every
+        # record after hi sorts above it; lo_key/hi_key bound the target key.
+        lo, hi = 0, self.count - 1
+        lo_key, hi_key = 0, (1 << 64) - 1
+        probes = 0
+        while lo <= hi:
+            probes += 1
+            if (hi - lo < _BISECT_THRESHOLD or hi_key <= lo_key or
+                    probes > _MAX_INTERPOLATION_PROBES):
+                pos = (lo + hi) // 2
+            else:
+                pos = lo + (target - lo_key) * (hi - lo + 1) // (hi_key - lo_key + 1)
+
+            offset = HEADER.size + pos * record_size
+            probe = mm[offset:offset + digest_size]
+            if probe == digest:
+                return COUNT.unpack_from(mm, offset + digest_size)[0]
+            if probe < digest:
+                lo = pos + 1
+                lo_key = int.from_bytes(probe[:8], 'big')
+            else:
+                hi = pos - 1
+                hi_key = int.from_bytes(probe[:8], 'big')
+        return 0
+
+def parse_hash_dump(path: str, digest_size: int) -> Iterator[Tuple[bytes, int]]:
+    """
+    Parse a plain-text HIBP-style dump into (digest, count) records.
+
+    Two layouts are accepted: full dumps with one `HASH:COUNT` per line, and
+    range files named after their 5-hex-digit prefix holding `SUFFIX:COUNT`
+    lines, as served by the range API. The count is optional.
+
+    Args:
+        path (str): Dump file to read
+        digest_size (int): Expected digest length in bytes
+
+    Yields:
+        Tuple[bytes, int]: (digest, breach_count)
+
+    Raises:
+        BreachIndexError: If a line is not a hash of the expected length
+    """
+    hex_length = digest_size * 2
+    name = os.path.splitext(os.path.basename(path))[0]
+    prefix = name if len(name) == 5 and _is_hex(name) else ''
+
+    with open(path, encoding='ascii', errors='replace') as handle:
+        for line_number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line:
+                continue
+            text, _, count = line.partition(':')
+            text = prefix + text if len(text) + len(prefix) == hex_length else text
+            try:
+                if len(text) != hex_length:
+                    raise ValueError
+                record = bytes.fromhex(text), int(count) if count else 1
+            except ValueError:
+                raise BreachIndexError(
+                    f"{path}:{line_number}: not a {hex_length}-digit hash") from None
+            yield record
+
+def parse_plaintext(path: str, algorithm: str) -> Iterator[Tuple[bytes, int]]:
+    """Hash a plaintext password list into (digest, 1) records."""
+    with open(path, encoding='utf-8', errors='replace') as handle:
+        for line in handle:
+            password = line.rstrip('\r\n')
+            if password:
+                yield digest_password(password, algorithm), 1
+
+def build_index(sources: Iterable[str], output: str, algorithm: str = 'sha1',
+                plaintext: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Build a sorted binary index from hash dumps or plaintext password lists.
+
+    Input does not need to be sorted or fit in memory: records are sorted in
+    chunks of `chunk_size`, spilled to temporary runs and merged. Duplicate
+    digests are merged by summing their counts.
+
+    Args:
+        sources (Iterable[str]): Dump files or directories of range files
+        output (str): Path of the index to write
+        algorithm (str): 'sha1' or 'sha256' (default: 'sha1')
+        plaintext (bool): Treat sources as plaintext password lists
+        chunk_size (int): Records sorted in memory per run
+
+    Returns:
+        int: Number of distinct digests written
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    algorithm_id, digest_size = ALGORITHMS[algorithm]
+    record_size = digest_size + COUNT.size
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+
+    def records():
+        for path in _expand_sources(sources):
+            if plaintext:
+                yield from parse_plaintext(path, algorithm)
+            else:
+                yield from parse_hash_dump(path, digest_size)
+
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        runs = write_sorted_runs(records(), tmp, record_size, chunk_size)
+        count = 0
+        with open(output, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, VERSION, algorithm_id, record_size, digest_size, 0))
+            for digest, total in merge_runs(runs, record_size, digest_size):
+                out.write(digest)
+                out.write(COUNT.pack(min(total, 0xFFFFFFFF)))
+                count += 1
+            out.seek(0)
+            out.write(HEADER.pack(MAGIC, VERSION, algorithm_id, record_size, digest_size, count))
+        for run in runs:
+            run.close()
+    return count
+
+def _expand_sources(sources: Iterable[str]) -> Iterator[str]:
+    """Yield files, expanding directories into their (sorted) contents."""
+    for source in sources:
+        if os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                path = os.path.join(source, name)
+                if os.path.isfile(path):
+                    yield path
+        else:
+            yield source
+
+def write_sorted_runs(records: Iterator[Tuple[bytes, int]], directory: str,
+                       record_size: int, chunk_size: int) -> List[IO[bytes]]:
+    """
+    Sort records in chunks and write each chunk to a temporary run file.
+
+    Args:
+        records (Iterator[Tuple[bytes, int]]): (digest, count) records
+        directory (str): Where to create the (anonymous) run files
+        record_size (int): Digest size plus COUNT.size
+        chunk_size (int): Records sorted in memory per run
+
+    Returns:
+        List[IO[bytes]]: Open runs, rewound; merge them with merge_runs
+    """
+    runs = []
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            runs.append(_spill(chunk, directory))
+            chunk = []
+    if chunk or not runs:
+        runs.append(_spill(chunk, directory))
+    return runs
+
+def _spill(chunk: List[Tuple[bytes, int]], directory: str) -> IO[bytes]:
+    chunk.sort()
+    run = tempfile.TemporaryFile(dir=directory)
+    run.write(b''.join(digest + COUNT.pack(min(count, 0xFFFFFFFF)) for digest, count in chunk))
+    run.seek(0)
+    return run
+
+def _read_run(run: IO[bytes], record_size: int, digest_size: int) -> Iterator[Tuple[bytes, int]]:
+    block_records = 4096
+    while True:
+        block = run.read(record_size * block_records)
+        if not block:
+            return
+        for offset in range(0, len(block), record_size):
+            yield (block[offset:offset + digest_size],
+                   COUNT.unpack_from(block, offset + digest_size)[0])
+
+def merge_runs(runs: List[IO[bytes]], record_size: int,
+                digest_size: int) -> Iterator[Tuple[bytes, int]]:
+    """Merge sorted runs, summing the counts of duplicate digests."""
+    current: Optional[bytes] = None
+    total = 0
+    for digest, count in heapq.merge(*(_read_run(run, record_size, digest_size) for run in runs)):
+        if digest == current:
+            total += count
+            continue
+        if current is not None:
+            yield current, total
+        current, total = digest, count
+    if current is not None:
+        yield current, total
+
+def _is_hex(text: str) -> bool:
+    try:
+        int(text, 16)
+        return True
+    except ValueError:
+        return False
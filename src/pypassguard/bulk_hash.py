@@ -0,0 +1,187 @@
+import hashlib
+import tempfile
+from typing import IO, Iterator, Optional, Tuple
+
+from .breach import COUNT, DEFAULT_CHUNK_SIZE, merge_runs, write_sorted_runs
+
+# Bytes read per block; each block is one unit of work for a worker, big
+# enough that pickling and scheduling are noise next to the hashing
+DEFAULT_BLOCK_SIZE = 4 << 20
+
+ALGORITHMS = ('sha256', 'sha1', 'sha512')
+OUTPUT_FORMATS = ('hex', 'binary')
+
+# Digests joined per write when emitting sorted output
+_WRITE_BATCH = 65536
+
+def read_blocks(stream: IO[bytes], block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Read a binary stream in large blocks that end on a line boundary.
+
+    The partial line at the end of each read is carried over to the next
+    block, so no line is ever split between blocks.
+
+    Args:
+        stream (IO[bytes]): Open binary stream (file or stdin.buffer)
+        block_size (int): Bytes per read (default: 4 MiB)
+
+    Yields:
+        bytes: Whole lines; only the last block may lack a trailing newline
+    """
+    tail = b''
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        if tail:
+            block = tail + block
+        cut = block.rfind(b'\n') + 1
+        if not cut:
+            tail = block
+            continue
+        tail = block[cut:]
+        yield block[:cut]
+    if tail:
+        yield tail
+
+def digest_block(block: bytes, algorithm: str = 'sha256', binary: bool = False) -> bytes:
+    """
+    Digest every non-empty line of a block, without decoding it.
+
+    Lines are hashed as raw bytes, which for UTF-8 input is exactly what
+    hash_password and digest_password hash. CRLF line endings are accepted.
+
+    Args:
+        block (bytes): Whole lines, e.g. from read_blocks
+        algorithm (str): One of ALGORITHMS (default: 'sha256')
+        binary (bool): Return concatenated raw digests instead of hex lines
+
+    Returns:
+        bytes: Fixed-width raw digests back to back, or one lowercase hex
+        digest per line
+    """
+    new = getattr(hashlib, algorithm)
+    if b'\r' in block:
+        block = block.replace(b'\r\n', b'\n')
+    lines = block.split(b'\n')
+    if binary:
+        return b''.join([new(line).digest() for line in lines if line])
+    hexes = [new(line).hexdigest() for line in lines if line]
+    if not hexes:
+        return b''
+    hexes.append('')
+    return '\n'.join(hexes).encode('ascii')
+
+def _digest_task(task: Tuple[bytes, str, bool]) -> bytes:
+    return digest_block(*task)
+
+def digest_blocks(source: IO[bytes], algorithm: str = 'sha256', binary: bool = False,
+                  workers: int = 1, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Digest a stream block by block, in worker processes if asked.
+
+    Args:
+        source (IO[bytes]): Binary stream with one password per line
+        algorithm (str): One of ALGORITHMS (default: 'sha256')
+        binary (bool): Yield raw digests instead of hex lines
+        workers (int): Worker processes; 1 hashes in this process
+        block_size (int): Bytes per block (default: 4 MiB)
+
+    Yields:
+        bytes: digest_block output for each block, in input order
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    blocks = read_blocks(source, block_size)
+    if workers <= 1:
+        for block in blocks:
+            yield digest_block(block, algorithm, binary)
+        return
+    from .parallel import parallel_map
+    # The parent only reads and writes; workers stay busy while it does
+    tasks = ((block, algorithm, binary) for block in blocks)
+    for _, result in parallel_map(_digest_task, tasks, workers):
+        yield result
+
+def hash_file(source: IO[bytes], out: IO[bytes], algorithm: str = 'sha256',
+              fmt: str = 'hex', workers: int = 1, sort: bool = False, unique: bool = False,
+              block_size: int = DEFAULT_BLOCK_SIZE, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              tmp_dir: Optional[str] = None) -> int:
+    """
+    Hash every line of a password file.
+
+    Without sorting, digests are written in input order as blocks complete,
+    so memory stays at a few blocks per worker. Sorting uses the breach
+    index's external merge sort: digests are sorted in chunks of
+    `chunk_size`, spilled to temporary runs and merged, so input of any
+    size can be sorted. Deduplication happens during that merge, so
+    `unique` output is always sorted too.
+
+    Args:
+        source (IO[bytes]): Binary stream with one password per line
+        out (IO[bytes]): Binary stream to write digests to
+        algorithm (str): One of ALGORITHMS (default: 'sha256')
+        fmt (str): 'hex' (one digest per line) or 'binary' (raw digests
+            back to back) (default: 'hex')
+        workers (int): Worker processes digesting blocks (default: 1)
+        sort (bool): Write digests in ascending order
+        unique (bool): Write each distinct digest once (implies sort)
+        block_size (int): Bytes read per block (default: 4 MiB)
+        chunk_size (int): Digests sorted in memory per run
+        tmp_dir (str, optional): Directory for the sort runs
+
+    Returns:
+        int: Number of digests written
+
+    Raises:
+        ValueError: If the algorithm or output format is not supported
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {fmt}")
+    binary = fmt == 'binary'
+    digest_size = getattr(hashlib, algorithm)().digest_size if algorithm in ALGORITHMS else 0
+    blocks = digest_blocks(source, algorithm, binary or sort or unique, workers, block_size)
+
+    if not (sort or unique):
+        written = 0
+        line_size = digest_size if binary else digest_size * 2 + 1
+        for data in blocks:
+            out.write(data)
+            written += len(data) // line_size
+        return written
+
+    def records():
+        for data in blocks:
+            for offset in range(0, len(data), digest_size):
+                yield data[offset:offset + digest_size], 1
+
+    record_size = digest_size + COUNT.size
+    written = 0
+    batch = []
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        runs = write_sorted_runs(records(), tmp, record_size, chunk_size)
+        try:
+            for digest, total in merge_runs(runs, record_size, digest_size):
+                if unique or total == 1:
+                    batch.append(digest)
+                else:
+                    batch.extend([digest] * total)
+                if len(batch) >= _WRITE_BATCH:
+                    written += _write_digests(out, batch, binary)
+                    batch = []
+            written += _write_digests(out, batch, binary)
+        finally:
+            for run in runs:
+                run.close()
+    return written
+
+def _write_digests(out: IO[bytes], digests: list, binary: bool) -> int:
+    if not digests:
+        return 0
+    if binary:
+        out.write(b''.join(digests))
+    else:
+        hexes = [digest.hex() for digest in digests]
+        hexes.append('')
+        out.write('\n'.join(hexes).encode('ascii'))
+    return len(digests)
@@ -0,0 +1,92 @@
+import os
+import pickle
+import sys
+import zlib
+from typing import Callable, Hashable, Iterable, Optional, Tuple, TypeVar
+
+from . import __version__
+from .config import CACHE_SETTINGS
+
+T = TypeVar('T')
+
+def cache_directory() -> Optional[str]:
+    """Directory holding the table cache, or None when caching is disabled."""
+    if not CACHE_SETTINGS['enabled']:
+        return None
+    directory = os.environ.get('PYPASSGUARD_CACHE_DIR') or CACHE_SETTINGS['directory']
+    if not directory:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        directory = os.path.join(base, 'pypassguard')
+    return directory
+
+def cache_stamp(key: Hashable = (), sources: Iterable[str] = ()) -> Tuple:
+    """
+    Everything a cached table depends on.
+
+    Covers the package and Python versions, the build parameters and the
+    path, size and mtime of every source file, so editing a word list or
+    the module that builds the table invalidates the cached copy.
+
+    Raises:
+        OSError: If a source file cannot be stat()ed
+    """
+    files = []
+    for path in sources:
+        stat = os.stat(path)
+        files.append((os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+    return __version__, sys.version_info[:2], key, tuple(files)
+
+def load_or_build(name: str, build: Callable[[], T], key: Hashable = (),
+                  sources: Iterable[str] = (), directory: Optional[str] = None) -> T:
+    """
+    Load a precompiled table from the cache, building and caching it on a miss.
+
+    Each entry holds its stamp followed by the pickled table, so a stale
+    entry is detected without unpickling the table. The cache is an
+    optimization only: an unreadable, corrupt or stale entry is rebuilt,
+    and a read-only cache directory just means every call builds. Entries
+    are written under a temporary name and renamed into place, so
+    concurrent processes never see a partial file.
+
+    Args:
+        name (str): Table name, used in the file name
+        build (Callable): Builds the table; its result must be picklable
+        key (Hashable): Build parameters; tables with different parameters
+            are cached side by side
+        sources (Iterable[str]): Files the table is derived from
+        directory (str, optional): Cache directory (default: cache_directory())
+
+    Returns:
+        The cached or freshly built table
+    """
+    directory = directory or cache_directory()
+    if directory is None:
+        return build()
+    try:
+        stamp = cache_stamp(key, sources)
+    except OSError:
+        return build()
+
+    path = os.path.join(directory, f'{name}-{zlib.crc32(repr(key).encode("utf-8")):08x}.pickle')
+    try:
+        with open(path, 'rb') as f:
+            if pickle.load(f) == stamp:
+                return pickle.load(f)
+    except Exception:
+        # Missing, truncated or written by an incompatible version; rebuild
+        pass
+
+    value = build()
+    temporary = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(temporary, 'wb') as f:
+            pickle.dump(stamp, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+    return value
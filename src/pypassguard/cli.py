@@ -0,0 +1,816 @@
+"""
+PyPassGuard - Comprehensive Password Security Toolkit
+
+Command-line entry point (`pypassguard`, `python -m pypassguard` or
+`python main.py`). Subcommands import their modules on demand, so a short
+call only pays for the code it runs.
+"""
+
+import argparse
+import atexit
+import io
+import math
+import sys
+import os
+
+# Lines of the --profile report
+PROFILE_LINES = 40
+
+def validate_stream(args):
+    """Validate passwords line by line from --file/--stdin"""
+    try:
+        from .validator import validate_many
+        from .batch import read_passwords, write_validation_results, Throughput
+    except ImportError:
+        print("Error: Validator module not available yet")
+        return
+    
+    if args.stdin:
+        source = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', errors='replace')
+    else:
+        source = open(args.file, encoding='utf-8', errors='replace')
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    
+    if args.workers > 1:
+        from .parallel import validate_many_parallel
+        results = validate_many_parallel(read_passwords(source), args.workers,
+                                         ordered=not args.unordered, blocklist=args.blocklist,
+                                         policy=args.policy)
+    else:
+        results = validate_many(read_passwords(source), args.policy)
+    
+    try:
+        with Throughput() as meter:
+            meter.count = write_validation_results(results, out, args.format)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if not args.stdin:
+            source.close()
+    
+    # Keep stdout machine-readable; the summary goes to stderr
+    print(meter.summary(), file=sys.stderr)
+
+def hash_stream(args):
+    """Hash every line from --file/--stdin into digests"""
+    from .bulk_hash import hash_file
+    from .batch import Throughput
+    
+    source = sys.stdin.buffer if args.stdin else open(args.file, 'rb')
+    try:
+        out = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    except OSError:
+        if not args.stdin:
+            source.close()
+        raise
+    
+    try:
+        with Throughput() as meter:
+            meter.count = hash_file(source, out, args.algorithm, args.format, args.workers,
+                                    sort=args.sort, unique=args.unique,
+                                    tmp_dir=os.path.dirname(os.path.abspath(args.output))
+                                    if args.output else None)
+    finally:
+        if out is sys.stdout.buffer:
+            out.flush()
+        else:
+            out.close()
+        if not args.stdin:
+            source.close()
+    
+    # Keep stdout machine-readable; the summary goes to stderr
+    summary = meter.summary('digests', 'Wrote')
+    if not args.stdin and meter.elapsed > 0:
+        summary += f", {os.path.getsize(args.file) / meter.elapsed / 1e6:,.1f} MB/s read"
+    print(summary, file=sys.stderr)
+
+def audit_dump(args):
+    """Sketch a password dump and write the JSON report"""
+    import json
+    from .audit import AuditSketch, audit_stream
+    from .batch import Throughput
+    
+    merge = list(args.merge)
+    with Throughput() as meter:
+        if args.file or args.stdin:
+            source = sys.stdin.buffer if args.stdin else open(args.file, 'rb')
+            try:
+                sketch = audit_stream(source, args.policy, args.workers, blocklist=args.blocklist)
+            finally:
+                if not args.stdin:
+                    source.close()
+            meter.count = sketch.total
+        else:
+            sketch = AuditSketch.load(merge.pop(0))
+        for path in merge:
+            sketch.merge(AuditSketch.load(path))
+    
+    report = sketch.report(args.top)
+    if args.file or args.stdin:
+        report['throughput'] = {
+            'passwords': meter.count,
+            'seconds': round(meter.elapsed, 3),
+            'passwords_per_sec': round(meter.rate),
+        }
+        summary = meter.summary(verb='Audited')
+        if args.file and meter.elapsed > 0:
+            rate = os.path.getsize(args.file) / meter.elapsed / 1e6
+            report['throughput']['mb_per_sec'] = round(rate, 2)
+            summary += f", {rate:,.1f} MB/s read"
+    else:
+        summary = f"Merged {len(args.merge)} audit states ({sketch.total:,} passwords)"
+    
+    if args.save_state:
+        sketch.save(args.save_state)
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        json.dump(report, out, indent=2, ensure_ascii=False)
+        out.write('\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    
+    # Keep stdout machine-readable; the summary goes to stderr
+    print(summary, file=sys.stderr)
+
+def generate_passphrases(args):
+    """Generate passphrases from a memory-mapped word list"""
+    from .passphrase import open_word_list
+    from .config import PASSPHRASE_SETTINGS
+    
+    words = PASSPHRASE_SETTINGS['words'] if args.words is None else args.words
+    with open_word_list(args.wordlist) as wordlist:
+        entropy = (f"Entropy: {wordlist.entropy(words):.1f} bits "
+                   f"({words} words from a {len(wordlist):,}-word list)")
+        if args.number == 1 and not args.output:
+            print(f"Generated Passphrase: {wordlist.passphrase(words, args.separator)}")
+            print(entropy)
+        elif args.output:
+            from .batch import Throughput, write_lines
+            with open(args.output, 'w', encoding='utf-8') as out, Throughput() as meter:
+                meter.count = write_lines(out, wordlist.passphrases_bulk(
+                    args.number, words, args.separator))
+            print(f"Wrote {meter.count} passphrases to {args.output}")
+            print(entropy)
+            print(meter.summary('passphrases', 'Generated'))
+        else:
+            phrases = list(wordlist.passphrases_bulk(args.number, words, args.separator))
+            print(f"Generated {args.number} passphrases:")
+            print("-" * 30)
+            for i, phrase in enumerate(phrases, 1):
+                print(f"{i:2d}. {phrase}")
+            print(entropy)
+
+def start_profile(path, sort):
+    """Profile the rest of the run; the report is written at exit"""
+    import cProfile
+    profiler = cProfile.Profile()
+    atexit.register(write_profile, profiler, path, sort)
+    profiler.enable()
+
+def write_profile(profiler, path, sort):
+    """Write a sorted text report, or raw pstats data for *.prof paths"""
+    profiler.disable()
+    if path.endswith('.prof'):
+        profiler.dump_stats(path)
+        print(f"Profile data written to {path}", file=sys.stderr)
+        return
+    import pstats
+    out = sys.stderr if path == '-' else open(path, 'w', encoding='utf-8')
+    try:
+        pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(PROFILE_LINES)
+    finally:
+        if out is not sys.stderr:
+            out.close()
+            print(f"Profile report written to {path}", file=sys.stderr)
+
+def write_metrics(path):
+    """Dump the metrics recorded during the run in Prometheus text format"""
+    from .metrics import render_prometheus
+    text = render_prometheus()
+    if path == '-':
+        sys.stderr.write(text)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+def main():
+    # Options shared by every subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    # Plain switches: an optional value would swallow a following password
+    common.add_argument('--profile', action='store_true',
+                        help='Run under cProfile and write a sorted report to stderr')
+    common.add_argument('--profile-output', metavar='PATH',
+                        help='Write the --profile report to PATH instead (implies --profile; '
+                             '*.prof: raw pstats data)')
+    common.add_argument('--profile-sort', default='cumulative',
+                        choices=['cumulative', 'tottime', 'calls', 'name'],
+                        help='Sort order of the --profile report (default: cumulative)')
+    common.add_argument('--metrics', action='store_true',
+                        help='Record metrics and dump them in Prometheus text format '
+                             'to stderr at exit')
+    common.add_argument('--metrics-output', metavar='PATH',
+                        help='Write the --metrics dump to PATH instead (implies --metrics)')
+    
+    parser = argparse.ArgumentParser(
+        description="PyPassGuard - Password Security Toolkit",
+        epilog="Example: python main.py validate 'MyP@ssw0rd'"
+    )
+    
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    
+    # Hash command
+    hash_parser = subparsers.add_parser('hash', parents=[common], help='Hash a password using SHA-256')
+    hash_parser.add_argument('password', nargs='?', help='Password to hash')
+    hash_parser.add_argument('--scheme', choices=['sha256', 'pbkdf2-sha256', 'scrypt'],
+                           default='sha256',
+                           help='Salted slow scheme for stored credentials (default: sha256)')
+    hash_source = hash_parser.add_mutually_exclusive_group()
+    hash_source.add_argument('--file', '-f', metavar='PATH',
+                           help='Hash every line of a file (read in large blocks)')
+    hash_source.add_argument('--stdin', action='store_true',
+                           help='Hash every line read from standard input')
+    hash_parser.add_argument('--algorithm', choices=['sha256', 'sha1', 'sha512'], default='sha256',
+                           help='Digest for --file/--stdin (default: sha256)')
+    hash_parser.add_argument('--format', choices=['hex', 'binary'], default='hex',
+                           help='Hex lines or raw digests back to back (default: hex)')
+    hash_parser.add_argument('--output', '-o', metavar='PATH',
+                           help='Write --file/--stdin digests to PATH instead of stdout')
+    hash_parser.add_argument('--workers', '-w', type=int, default=1,
+                           help='Worker processes for --file/--stdin (default: 1)')
+    hash_parser.add_argument('--sort', action='store_true',
+                           help='Write digests in sorted order (external merge sort)')
+    hash_parser.add_argument('--unique', action='store_true',
+                           help='Drop duplicate digests (output is sorted)')
+    
+    # Verify command
+    verify_parser = subparsers.add_parser('verify', parents=[common], help='Verify a password against a stored hash')
+    verify_parser.add_argument('password', help='Password to verify')
+    verify_parser.add_argument('encoded', help="Encoded hash, e.g. '$scrypt$ln=14,r=8,p=1$...'")
+    
+    # Calibrate command
+    cal_parser = subparsers.add_parser('calibrate', parents=[common],
+                                       help='Pick hashing work factors for a target latency')
+    cal_parser.add_argument('--target-ms', type=float, default=50.0,
+                          help='Target time per hash in milliseconds (default: 50)')
+    cal_parser.add_argument('--scheme', choices=['pbkdf2-sha256', 'scrypt'],
+                          help='Scheme to calibrate (default: from config)')
+    
+    # Generate command
+    gen_parser = subparsers.add_parser('generate', parents=[common], help='Generate random passwords')
+    gen_parser.add_argument('-l', '--length', type=int, default=12, 
+                          help='Password length (default: 12)')
+    gen_parser.add_argument('-n', '--number', type=int, default=1,
+                          help='Number of passwords to generate (default: 1)')
+    gen_parser.add_argument('--no-special', action='store_true',
+                          help='Exclude special characters')
+    gen_parser.add_argument('--output', '-o', metavar='PATH',
+                          help='Write passwords to PATH, one per line')
+    gen_parser.add_argument('--workers', '-w', type=int, default=1,
+                          help='Worker processes for bulk generation (default: 1)')
+    gen_parser.add_argument('--passphrase', action='store_true',
+                          help='Generate passphrases of random words instead')
+    gen_parser.add_argument('--words', type=int,
+                          help='Words per passphrase (default: from config)')
+    gen_parser.add_argument('--wordlist', metavar='PATH',
+                          help='Passphrase word list, plain text or compiled (default: from config)')
+    gen_parser.add_argument('--separator',
+                          help='Passphrase word separator (default: from config)')
+    
+    # Word list build command
+    wordlist_parser = subparsers.add_parser('wordlist-build', parents=[common],
+                                            help='Compile passphrase word lists into the memory-mapped format')
+    wordlist_parser.add_argument('sources', nargs='+',
+                               help='Plain-text word lists (one word per line, or diceware format)')
+    wordlist_parser.add_argument('--output', '-o', metavar='PATH', required=True,
+                               help='Word list file to write')
+    
+    # Blocklist publish command
+    publish_parser = subparsers.add_parser('blocklist-publish', parents=[common],
+                                           help='Publish the weak patterns as a shared, memory-mapped '
+                                                'blocklist for worker processes')
+    publish_parser.add_argument('--blocklist', metavar='PATH',
+                                help='Word list to include (default: from config or the policy)')
+    publish_parser.add_argument('--policy', metavar='NAME',
+                                help="Publish a policy profile's patterns and substitution setting")
+    publish_parser.add_argument('--output', '-o', metavar='PATH', required=True,
+                                help='Shared blocklist to write, e.g. /dev/shm/pypassguard.blocklist; '
+                                     'attach it with --blocklist PATH or blocklist_file')
+    
+    # Validate command
+    val_parser = subparsers.add_parser('validate', parents=[common], help='Validate password against criteria')
+    val_parser.add_argument('password', nargs='?', help='Password to validate')
+    val_parser.add_argument('--verbose', '-v', action='store_true',
+                          help='Show detailed validation results')
+    val_source = val_parser.add_mutually_exclusive_group()
+    val_source.add_argument('--file', '-f', metavar='PATH',
+                          help='Validate every line of a file (streamed)')
+    val_source.add_argument('--stdin', action='store_true',
+                          help='Validate every line read from standard input')
+    val_parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl',
+                          help='Output format for --file/--stdin (default: jsonl)')
+    val_parser.add_argument('--output', '-o', metavar='PATH',
+                          help='Write --file/--stdin results to PATH instead of stdout')
+    val_parser.add_argument('--blocklist', metavar='PATH',
+                          help='Also reject passwords containing any word from PATH')
+    val_parser.add_argument('--policy', metavar='NAME',
+                          help='Validate against a named policy profile from the policy directory')
+    val_parser.add_argument('--workers', '-w', type=int, default=1,
+                          help='Worker processes for --file/--stdin (default: 1)')
+    val_parser.add_argument('--unordered', action='store_true',
+                          help='With --workers, emit results as they complete')
+    
+    # Audit command
+    audit_parser = subparsers.add_parser('audit', parents=[common],
+                                         help='Aggregate statistics of a password dump as JSON')
+    audit_parser.add_argument('file', nargs='?', help='Password file, one per line (streamed)')
+    audit_parser.add_argument('--stdin', action='store_true',
+                              help='Audit every line read from standard input')
+    audit_parser.add_argument('--merge', metavar='STATE', nargs='+', default=[],
+                              help='Combine partial states saved with --save-state (e.g. one per shard)')
+    audit_parser.add_argument('--save-state', metavar='PATH',
+                              help='Also write the mergeable sketch state to PATH')
+    audit_parser.add_argument('--output', '-o', metavar='PATH',
+                              help='Write the JSON report to PATH instead of stdout')
+    audit_parser.add_argument('--top', type=int,
+                              help='Entries per top-k list (default: from config)')
+    audit_parser.add_argument('--blocklist', metavar='PATH',
+                              help='Also count passwords containing any word from PATH as weak')
+    audit_parser.add_argument('--policy', metavar='NAME',
+                              help='Validate against a named policy profile from the policy directory')
+    audit_parser.add_argument('--workers', '-w', type=int, default=1,
+                              help='Worker processes sketching blocks of the input (default: 1)')
+    
+    # Strength command
+    strength_parser = subparsers.add_parser('strength', parents=[common],
+                                            help='Estimate guesses and crack times for a password')
+    strength_parser.add_argument('password', help='Password to score')
+    strength_parser.add_argument('--verbose', '-v', action='store_true',
+                               help='Show the matched patterns')
+    
+    # Breach check command
+    breach_parser = subparsers.add_parser('breach-check', parents=[common],
+                                          help='Check a password against the offline breach index')
+    breach_parser.add_argument('password', help='Password to check')
+    breach_parser.add_argument('--index', metavar='PATH',
+                             help='Breach index file (default: from config)')
+    breach_parser.add_argument('--bloom', metavar='PATH',
+                             help='Bloom pre-filter file (default: from config, if present)')
+    breach_parser.add_argument('--api', metavar='URL', nargs='?', const='',
+                             help='Query a range API instead of the local index '
+                                  '(default URL: from config)')
+    
+    # Breach index build command
+    build_parser = subparsers.add_parser('breach-build', parents=[common],
+                                         help='Build the offline breach index from hash dumps')
+    build_parser.add_argument('sources', nargs='+',
+                            help='HIBP dump files or directories of range files')
+    build_parser.add_argument('--output', '-o', metavar='PATH',
+                            help='Index file to write (default: from config)')
+    build_parser.add_argument('--algorithm', choices=['sha1', 'sha256'],
+                            help='Digest algorithm of the dump (default: from config)')
+    build_parser.add_argument('--plaintext', action='store_true',
+                            help='Sources are plaintext password lists to hash')
+    
+    # Bloom filter build command
+    bloom_parser = subparsers.add_parser('bloom-build', parents=[common],
+                                         help='Build a Bloom pre-filter from the breach index')
+    bloom_parser.add_argument('--index', metavar='PATH',
+                            help='Breach index file (default: from config)')
+    bloom_parser.add_argument('--output', '-o', metavar='PATH',
+                            help='Filter file to write (default: from config)')
+    bloom_parser.add_argument('--fpr', type=float,
+                            help='Target false-positive rate (default: from config)')
+    
+    # Range server command
+    range_parser = subparsers.add_parser('range-serve', parents=[common],
+                                         help='Serve HIBP-style /range/<prefix> from local files')
+    range_parser.add_argument('store', help='Directory of 5-hex-prefix range files')
+    range_parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    range_parser.add_argument('--port', type=int, default=8080, help='Port (default: 8080)')
+    
+    # Daemon command
+    serve_parser = subparsers.add_parser('serve', parents=[common],
+                                         help='Run the long-lived JSON API daemon (Unix socket + HTTP)')
+    serve_parser.add_argument('--socket', metavar='PATH',
+                            help='Unix socket path (default: from config)')
+    serve_parser.add_argument('--host', help='HTTP bind address (default: from config)')
+    serve_parser.add_argument('--port', type=int, help='HTTP port (default: from config)')
+    serve_parser.add_argument('--no-socket', action='store_true', help='Do not listen on the Unix socket')
+    serve_parser.add_argument('--no-http', action='store_true', help='Do not listen on HTTP')
+    
+    # Stats command
+    stats_parser = subparsers.add_parser('stats', parents=[common],
+                                         help="Print a running daemon's metrics (Prometheus text format)")
+    stats_parser.add_argument('--socket', metavar='PATH',
+                            help='Daemon Unix socket (default: from config, if present)')
+    stats_parser.add_argument('--host', help='Daemon HTTP address, used without a socket (default: from config)')
+    stats_parser.add_argument('--port', type=int, help='Daemon HTTP port (default: from config)')
+    
+    args = parser.parse_args()
+    
+    if getattr(args, 'metrics', False) or getattr(args, 'metrics_output', None):
+        from . import metrics
+        metrics.enable()
+        atexit.register(write_metrics, args.metrics_output or '-')
+    if getattr(args, 'profile', False) or getattr(args, 'profile_output', None):
+        start_profile(args.profile_output or '-', args.profile_sort)
+    
+    if args.command == 'hash':
+        if args.file or args.stdin:
+            if args.scheme != 'sha256':
+                hash_parser.error("--scheme applies to single passwords; use --algorithm with --file/--stdin")
+            try:
+                hash_stream(args)
+            except OSError as e:
+                print(f"Error: {e}", file=sys.stderr)
+            return
+        if args.password is None:
+            hash_parser.error("a password, --file or --stdin is required")
+        try:
+            from .hasher import hash_password, encode_password
+            print(f"Password: {args.password}")
+            if args.scheme == 'sha256':
+                print(f"SHA-256 Hash: {hash_password(args.password)}")
+            else:
+                print(f"Encoded Hash: {encode_password(args.password, args.scheme)}")
+        except ImportError:
+            print("Error: Hasher module not available yet")
+    
+    elif args.command == 'verify':
+        try:
+            from .hasher import verify_password, needs_rehash
+            matches = verify_password(args.password, args.encoded)
+            print(f"Match: {'✅ YES' if matches else '❌ NO'}")
+            if matches and needs_rehash(args.encoded):
+                print("Note: hash uses outdated parameters and should be rehashed")
+        except ImportError:
+            print("Error: Hasher module not available yet")
+        except ValueError as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'calibrate':
+        try:
+            from .hasher import calibrate, get_hasher
+            from .config import HASHER_SETTINGS
+            import time
+            
+            scheme = args.scheme or HASHER_SETTINGS['scheme']
+            params = calibrate(args.target_ms, scheme)
+            hasher = get_hasher(scheme, **params)
+            start = time.perf_counter()
+            hasher.encode('calibration-password')
+            elapsed = (time.perf_counter() - start) * 1000
+            
+            print(f"Scheme: {scheme}")
+            print(f"Parameters: {', '.join(f'{k}={v}' for k, v in params.items())}")
+            print(f"Measured: {elapsed:.1f} ms per hash (target {args.target_ms:g} ms)")
+        except ImportError:
+            print("Error: Hasher module not available yet")
+        except ValueError as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'generate':
+        if args.passphrase:
+            if args.workers > 1:
+                gen_parser.error("--workers is not supported with --passphrase")
+            try:
+                generate_passphrases(args)
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}")
+            return
+        try:
+            from .generator import generate_password, generate_multiple_passwords, write_passwords
+            
+            if args.number == 1 and not args.output:
+                # Generate single password
+                password = generate_password(args.length, not args.no_special)
+                print(f"Generated Password: {password}")
+                print(f"Length: {len(password)} characters")
+                
+                # Show hash of the generated password
+                from .hasher import hash_password
+                print(f"SHA-256 Hash: {hash_password(password)}")
+            elif args.output:
+                # Stream straight to a file
+                from .batch import Throughput, write_lines
+                with open(args.output, 'w', encoding='utf-8') as out, Throughput() as meter:
+                    if args.workers > 1:
+                        from .parallel import generate_passwords_parallel
+                        meter.count = write_lines(out, generate_passwords_parallel(
+                            args.number, args.length, not args.no_special, args.workers))
+                    else:
+                        meter.count = write_passwords(out, args.number, args.length, not args.no_special)
+                print(f"Wrote {meter.count} passwords to {args.output}")
+                print(meter.summary(verb='Generated'))
+            else:
+                # Generate multiple passwords
+                from .batch import Throughput
+                with Throughput() as meter:
+                    if args.workers > 1:
+                        from .parallel import generate_passwords_parallel
+                        passwords = list(generate_passwords_parallel(
+                            args.number, args.length, not args.no_special, args.workers))
+                    else:
+                        passwords = generate_multiple_passwords(args.number, args.length, not args.no_special)
+                    meter.count = len(passwords)
+                print(f"Generated {args.number} passwords:")
+                print("-" * 30)
+                for i, pwd in enumerate(passwords, 1):
+                    print(f"{i:2d}. {pwd}")
+                print(meter.summary(verb='Generated'), file=sys.stderr)
+                    
+        except ImportError:
+            print("Error: Generator module not available yet")
+        except ValueError as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'validate':
+        if args.policy:
+            if args.blocklist:
+                val_parser.error("--blocklist cannot be combined with --policy; "
+                                 "set 'blocklist_file' in the profile instead")
+            try:
+                from .policy import get_policy, PolicyError
+                get_policy(args.policy)
+            except PolicyError as e:
+                print(f"Error: {e}")
+                return
+        
+        if args.blocklist:
+            try:
+                from .validator import load_blocklist
+                load_blocklist(args.blocklist)
+            except (OSError, ValueError) as e:
+                # ValueError: an undecodable word list or a malformed shared blocklist
+                print(f"Error: cannot load blocklist: {e}")
+                return
+        
+        if args.file or args.stdin:
+            validate_stream(args)
+            return
+        if args.password is None:
+            val_parser.error("a password, --file or --stdin is required")
+        
+        try:
+            from .validator import validate_password, get_validation_feedback, validate_password_with_feedback
+            
+            if args.verbose:
+                # Detailed validation
+                is_valid, results = validate_password(args.password, args.policy)
+                requirements = get_policy(args.policy).settings if args.policy else None
+                feedback = get_validation_feedback(results, requirements)
+                
+                print(f"Password: {args.password}")
+                if args.policy:
+                    print(f"Policy: {args.policy} (version {requirements['version']})")
+                print(f"Valid: {'✅ YES' if is_valid else '❌ NO'}")
+                print("\nValidation Details:")
+                print("-" * 30)
+                
+                for check, passed in results.items():
+                    status = "✅" if passed else "❌"
+                    print(f"{check:15}: {status}")
+                
+                if feedback:
+                    print(f"\nIssues found:")
+                    for issue in feedback:
+                        print(f"  • {issue}")
+                else:
+                    print(f"\nAll requirements met! 🎉")
+                    
+            else:
+                # Simple validation
+                is_valid, feedback = validate_password_with_feedback(args.password, args.policy)
+                status = "✅ Valid Password" if is_valid else "❌ Password does not meet requirements"
+                print(f"Password: {args.password}")
+                print(f"Status: {status}")
+                
+                if not is_valid:
+                    print("\nIssues:")
+                    for issue in feedback:
+                        print(f"  • {issue}")
+                
+        except ImportError:
+            print("Error: Validator module not available yet")
+    
+    elif args.command == 'audit':
+        if args.file and args.stdin:
+            audit_parser.error("a file and --stdin cannot be combined")
+        if not (args.file or args.stdin or args.merge):
+            audit_parser.error("a file, --stdin or --merge is required")
+        if args.policy and args.blocklist:
+            audit_parser.error("--blocklist cannot be combined with --policy; "
+                               "set 'blocklist_file' in the profile instead")
+        from .audit import AuditError
+        from .policy import PolicyError
+        from .shared_blocklist import SharedBlocklistError
+        try:
+            if args.blocklist:
+                from .validator import load_blocklist
+                load_blocklist(args.blocklist)
+            audit_dump(args)
+        except (OSError, AuditError, PolicyError, SharedBlocklistError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+    
+    elif args.command == 'strength':
+        try:
+            from .strength import estimate_strength
+            
+            result = estimate_strength(args.password)
+            print(f"Password: {args.password}")
+            print(f"Score: {result['score']}/4")
+            print(f"Guesses: {result['guesses']:.3g} (10^{result['guesses_log10']:.1f})")
+            print("\nCrack Times:")
+            print("-" * 30)
+            for scenario, display in result['crack_times_display'].items():
+                print(f"{scenario:40}: {display}")
+            
+            if args.verbose:
+                print("\nMatched Patterns:")
+                for match in result['sequence']:
+                    word = match.get('matched_word')
+                    detail = f" ({word}, rank {match['rank']})" if word else ""
+                    print(f"  • {match['pattern']:10} {match['token']!r}{detail}: {match['guesses']:.3g} guesses")
+        except ImportError:
+            print("Error: Strength module not available yet")
+    
+    elif args.command == 'breach-check' and args.api is not None:
+        try:
+            from .range_client import RangeClient
+            import requests
+            
+            with RangeClient(args.api or None) as client:
+                count = client.lookup(args.password)
+            
+            print(f"Password: {args.password}")
+            if count:
+                print(f"Status: ❌ Found in breach data ({count:,} occurrences)")
+            else:
+                print("Status: ✅ Not found in breach data")
+        except ImportError:
+            print("Error: Range client requires the 'requests' package")
+        except requests.RequestException as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'breach-check':
+        try:
+            from .breach import BreachIndex, BreachIndexError
+            from .bloom import BloomFilterError
+            from .config import BREACH_SETTINGS
+            
+            bloom_path = args.bloom
+            if bloom_path is None and os.path.exists(BREACH_SETTINGS['bloom_file']):
+                bloom_path = BREACH_SETTINGS['bloom_file']
+            
+            with BreachIndex(args.index or BREACH_SETTINGS['index_file'], bloom_path) as index:
+                count = index.lookup(args.password)
+            
+            print(f"Password: {args.password}")
+            if count:
+                print(f"Status: ❌ Found in breach data ({count:,} occurrences)")
+            else:
+                print("Status: ✅ Not found in breach data")
+        except ImportError:
+            print("Error: Breach module not available yet")
+        except (OSError, BreachIndexError, BloomFilterError) as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'wordlist-build':
+        from .passphrase import build_word_list, WordListError
+        from .batch import Throughput
+        try:
+            with Throughput() as meter:
+                meter.count = build_word_list(args.sources, args.output)
+            print(f"Wrote {meter.count:,} words ({math.log2(meter.count):.2f} bits each) "
+                  f"to {args.output}")
+        except (OSError, WordListError) as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'blocklist-publish':
+        from .shared_blocklist import publish_blocklist, SharedBlocklistError, SharedBlocklistFile
+        from .policy import PolicyError
+        from .batch import Throughput
+        from .config import BLOCKLIST_SETTINGS, COMMON_SUBSTITUTIONS, COMMON_WEAK_PATTERNS
+        try:
+            patterns, source = list(COMMON_WEAK_PATTERNS), BLOCKLIST_SETTINGS['blocklist_file']
+            substitutions = COMMON_SUBSTITUTIONS
+            if args.policy:
+                from .policy import get_policy
+                settings = get_policy(args.policy).settings
+                patterns += settings['blocklist']
+                source = settings['blocklist_file']
+                substitutions = COMMON_SUBSTITUTIONS if settings['leet'] else None
+            with Throughput() as meter:
+                generation = publish_blocklist(args.output, patterns, args.blocklist or source,
+                                               substitutions)
+            with SharedBlocklistFile(args.output) as published:
+                count = len(published)
+            print(f"Published generation {generation}: {count:,} patterns to {args.output} "
+                  f"({os.path.getsize(args.output):,} bytes) in {meter.elapsed:.2f}s")
+        except (OSError, SharedBlocklistError, PolicyError) as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'breach-build':
+        try:
+            from .breach import build_index, BreachIndexError
+            from .batch import Throughput
+            from .config import BREACH_SETTINGS
+            
+            output = args.output or BREACH_SETTINGS['index_file']
+            algorithm = args.algorithm or BREACH_SETTINGS['algorithm']
+            with Throughput() as meter:
+                meter.count = build_index(args.sources, output, algorithm, args.plaintext)
+            print(f"Wrote {meter.count:,} {algorithm} digests to {output}")
+            print(meter.summary('digests'))
+        except ImportError:
+            print("Error: Breach module not available yet")
+        except (OSError, BreachIndexError) as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'bloom-build':
+        try:
+            from .breach import BreachIndex
+            from .bloom import build_filter
+            from .batch import Throughput
+            from .config import BREACH_SETTINGS
+            
+            output = args.output or BREACH_SETTINGS['bloom_file']
+            fpr = args.fpr or BREACH_SETTINGS['bloom_fpr']
+            with BreachIndex(args.index or BREACH_SETTINGS['index_file']) as index:
+                with Throughput() as meter:
+                    size = build_filter(index.iter_digests(), len(index), output,
+                                        fpr, index.algorithm, index.fingerprint())
+                    meter.count = len(index)
+            
+            bits_per_entry = size * 8 / max(meter.count, 1)
+            print(f"Wrote {size:,}-byte filter for {meter.count:,} digests to {output}")
+            print(f"Target FPR: {fpr:g} ({bits_per_entry:.1f} bits/entry)")
+            print(meter.summary('digests'))
+        except ImportError:
+            print("Error: Bloom filter module not available yet")
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'range-serve':
+        try:
+            import asyncio
+            from .range_server import serve_forever
+            
+            print(f"Serving {args.store} on http://{args.host}:{args.port}/range/ (Ctrl+C to stop)")
+            asyncio.run(serve_forever(args.store, args.host, args.port))
+        except ImportError:
+            print("Error: Range server module not available yet")
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'serve':
+        if args.no_socket and args.no_http:
+            serve_parser.error("--no-socket and --no-http leave nothing to serve")
+        try:
+            import asyncio
+            from .daemon import serve
+            from .config import DAEMON_SETTINGS
+            
+            socket_path = None if args.no_socket else args.socket or DAEMON_SETTINGS['socket']
+            host = args.host or DAEMON_SETTINGS['host']
+            port = None if args.no_http else (args.port if args.port is not None
+                                              else DAEMON_SETTINGS['port'])
+            if socket_path:
+                os.makedirs(os.path.dirname(socket_path) or '.', exist_ok=True)
+                print(f"Listening on unix:{socket_path}")
+            if port is not None:
+                print(f"Listening on http://{host}:{port}/")
+            print("Endpoints: POST /validate /hash /generate /breach-check, GET /health /metrics "
+                  "(Ctrl+C to stop)")
+            asyncio.run(serve(socket_path, host, port))
+        except ImportError:
+            print("Error: Daemon module not available yet")
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            print(f"Error: {e}")
+    
+    elif args.command == 'stats':
+        try:
+            from .daemon_client import DaemonClient, DaemonError
+            from .config import DAEMON_SETTINGS
+            
+            socket_path = args.socket
+            if socket_path is None and args.host is None and args.port is None:
+                if os.path.exists(DAEMON_SETTINGS['socket']):
+                    socket_path = DAEMON_SETTINGS['socket']
+            with DaemonClient(socket_path, args.host, args.port, timeout=10) as client:
+                sys.stdout.write(client.metrics())
+        except ImportError:
+            print("Error: Daemon client module not available yet")
+        except (OSError, DaemonError) as e:
+            print(f"Error: cannot read metrics from the daemon: {e}")
+    
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,132 @@
+# Configuration settings for PyPassGuard
+
+# API settings (for future use with Have I Been Pwned)
+API_SETTINGS = {
+    'hibp_api_url': 'https://api.pwnedpasswords.com/range/',
+    'user_agent': 'PyPassGuard-Password-Checker'
+}
+
+# Offline breached-password index (built with `main.py breach-build`)
+BREACH_SETTINGS = {
+    'index_file': 'data/breach.idx',
+    'bloom_file': 'data/breach.bloom',  # Used by breach-check when present
+    'bloom_fpr': 0.001,
+    'algorithm': 'sha1'         # 'sha1' for HIBP dumps, or 'sha256'
+}
+
+# Slow password hashing for stored credentials (see `main.py calibrate`)
+HASHER_SETTINGS = {
+    'scheme': 'scrypt',         # 'scrypt' or 'pbkdf2-sha256'
+    'salt_size': 16,
+    'pbkdf2_iterations': 600000,
+    'scrypt_ln': 14,            # log2 of the scrypt cost parameter N
+    'scrypt_r': 8,
+    'scrypt_p': 1
+}
+
+# Password requirements
+PASSWORD_REQUIREMENTS = {
+    'min_length': 8,
+    'require_uppercase': True,
+    'require_lowercase': True,
+    'require_digits': True,
+    'require_special_chars': True,
+    'special_chars': '!@#$%^&*()_+-=[]{};:\'",.<>/?'
+}
+
+# Common weak patterns rejected by the validator
+COMMON_WEAK_PATTERNS = [
+    'password', '123456', 'qwerty', 'admin', 'welcome',
+    'letmein', 'monkey', 'dragon', 'baseball', 'football',
+    'iloveyou', 'master', 'superman', 'password1', 'hello'
+]
+
+# Sequence and keyboard-walk detection (the 'sequential' check)
+SEQUENCE_SETTINGS = {
+    'min_length': 3,            # abc, 321, ...
+    'keyboard_min_length': 4,   # qwer, 1qaz, ...; shorter walks are too common
+    'keyboards': ['qwerty', 'azerty', 'dvorak']
+}
+
+# Named policy profiles (`main.py validate --policy NAME`)
+POLICY_SETTINGS = {
+    'directory': 'policies',    # NAME.toml / NAME.json, relative to the package
+    'cache_size': 1024,         # Compiled policies kept in memory
+    'check_interval': 1.0       # Seconds between mtime checks per profile
+}
+
+# Long-running daemon (`main.py serve`)
+DAEMON_SETTINGS = {
+    'socket': 'data/pypassguard.sock',  # Unix socket for local clients
+    'host': '127.0.0.1',
+    'port': 8731,
+    'max_batch': 10000,         # Passwords per request / generate count
+    'max_length': 1024,         # Longest password from /generate
+    'metrics': True             # Record metrics for GET /metrics and `main.py stats`
+}
+
+# Opt-in instrumentation (counters and latency histograms) of the hot
+# paths; $PYPASSGUARD_METRICS=1 also enables it
+METRICS_SETTINGS = {
+    'enabled': False
+}
+
+# Optional LRU of validate_password_with_feedback results for repeated
+# passwords, keyed by a per-process MAC (see validation_cache)
+VALIDATION_CACHE_SETTINGS = {
+    'enabled': False,
+    'max_entries': 65536
+}
+
+# Blocklist settings
+BLOCKLIST_SETTINGS = {
+    'blocklist_file': None,     # Extra word list, one pattern per line, or a shared
+                                # blocklist from `main.py blocklist-publish`
+    'reload_interval': 5.0      # Seconds between checks for file changes
+}
+
+# Precompiled tables (keyboard pair tables, word frequency tables) are
+# pickled here on first use; $PYPASSGUARD_CACHE_DIR overrides the directory
+CACHE_SETTINGS = {
+    'enabled': True,
+    'directory': None           # Default: $XDG_CACHE_HOME/pypassguard or ~/.cache/pypassguard
+}
+
+# Strength estimator settings
+STRENGTH_SETTINGS = {
+    # Ranked word lists (most frequent first), relative to the package
+    'wordlists': ['wordlists/passwords.txt'],
+    'keyboard': 'qwerty'
+}
+
+# Passphrase generation (`main.py generate --passphrase`); plain-text
+# lists are compiled to the memory-mapped word list format in the cache
+# directory on first use, or ahead of time with `main.py wordlist-build`
+PASSPHRASE_SETTINGS = {
+    'wordlist': 'wordlists/passphrase.txt',  # Relative to the package, or absolute
+    'words': 6,
+    'separator': '-'
+}
+
+# Streaming dump audits (`main.py audit`); memory is fixed by these
+# sizes, however many passwords are read
+AUDIT_SETTINGS = {
+    'hll_precision': 14,        # 2**14 registers per distinct count, ~0.8% standard error
+    'top_k_capacity': 10000,    # Space-Saving counters per top-k list
+    'top_k': 25,                # Entries reported per top-k list
+    'max_length': 64            # Longer passwords share the last length bucket
+}
+
+# Common substitutions for password strengthening
+COMMON_SUBSTITUTIONS = {
+    'a': ['@', '4', 'á', 'à'],
+    'b': ['8', '6', 'ß'],
+    'e': ['3', '€', 'ë'],
+    'i': ['1', '!', 'í', 'ì'],
+    'o': ['0', 'ö', 'ó', 'ò'],
+    's': ['5', '$', 'š'],
+    't': ['7', '+'],
+    'g': ['9', '&'],
+    'l': ['1', '|'],
+    'z': ['2', '%']
+}
\ No newline at end of file
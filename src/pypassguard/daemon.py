@@ -0,0 +1,226 @@
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from . import metrics
+from .config import BREACH_SETTINGS, DAEMON_SETTINGS
+from .async_hasher import AsyncHasher, QueueFullError
+from .generator import generate_passwords_bulk
+from .hasher import hash_password
+from .httpd import start_server, start_unix_server
+from .policy import PolicyError, get_policy
+from .validator import FAILED_NAMES, validate_password_mask
+
+JSON = 'application/json'
+
+class RequestError(ValueError):
+    """A client error, reported as HTTP 400 with a JSON error body."""
+
+def _passwords(request: Dict, limit: int) -> Tuple[List[str], bool]:
+    """Extract `password` or a `passwords` batch; returns (passwords, batched)."""
+    if 'passwords' in request:
+        passwords = request['passwords']
+        if not isinstance(passwords, list) or not all(isinstance(p, str) for p in passwords):
+            raise RequestError("'passwords' must be a list of strings")
+        if len(passwords) > limit:
+            raise RequestError(f"At most {limit} passwords per request")
+        return passwords, True
+    password = request.get('password')
+    if not isinstance(password, str):
+        raise RequestError("Expected 'password' or 'passwords'")
+    return [password], False
+
+class PassGuardService:
+    """
+    JSON API over hashing, generation, validation and breach checks.
+
+    One instance lives for the life of the daemon, so the rule engine,
+    blocklists, policy profiles and the breach index are loaded once and
+    stay warm. Every endpoint takes either a single `password` or a
+    `passwords` batch in the JSON request body.
+
+        POST /validate      {"password(s)": ..., "policy": NAME}
+        POST /hash          {"password(s)": ..., "scheme": "sha256"|"scrypt"|"pbkdf2-sha256"}
+        POST /generate      {"count": N, "length": L, "special": true}
+        POST /breach-check  {"password(s)": ...}
+        GET  /health
+        GET  /metrics       Prometheus text format
+    """
+
+    def __init__(self, index_path: Optional[str] = None, bloom_path: Optional[str] = None,
+                 max_batch: int = 10000, max_length: int = 1024):
+        """
+        Args:
+            index_path (str, optional): Breach index (default: from config, if present)
+            bloom_path (str, optional): Bloom pre-filter (default: from config, if present)
+            max_batch (int): Largest accepted batch or generate count
+            max_length (int): Longest password /generate produces
+        """
+        self.max_batch = max_batch
+        self.max_length = max_length
+        self.started = time.time()
+        self.requests = 0
+        self.items = 0
+        # One pool per slow scheme, created on first use and kept until close()
+        self.hashers: Dict[str, AsyncHasher] = {}
+        self.breach_index = None
+        # Bound addresses, filled in by serve(): socket paths and (host, port)
+        self.listeners: List = []
+
+        index_path = index_path or BREACH_SETTINGS['index_file']
+        if os.path.exists(index_path):
+            from .breach import BreachIndex
+            if bloom_path is None and os.path.exists(BREACH_SETTINGS['bloom_file']):
+                bloom_path = BREACH_SETTINGS['bloom_file']
+            self.breach_index = BreachIndex(index_path, bloom_path)
+
+        self._routes = {
+            ('POST', '/validate'): self.validate,
+            ('POST', '/hash'): self.hash,
+            ('POST', '/generate'): self.generate,
+            ('POST', '/breach-check'): self.breach_check,
+            ('GET', '/health'): self.health,
+            ('GET', '/metrics'): self.export_metrics,
+        }
+
+    def close(self) -> None:
+        """Release the hashing pools and the breach index."""
+        for hasher in self.hashers.values():
+            hasher.close()
+        if self.breach_index is not None:
+            self.breach_index.close()
+
+    async def handle(self, method: str, path: str, headers: Dict[str, str],
+                     body: bytes) -> Tuple[int, str, bytes]:
+        """httpd handler: route, decode the JSON body and encode the result."""
+        path = path.split('?', 1)[0].rstrip('/') or '/'
+        route = self._routes.get((method, path))
+        if route is None:
+            if any(p == path for _, p in self._routes):
+                return 405, JSON, b'{"error": "Method not allowed"}'
+            return 404, JSON, b'{"error": "Unknown endpoint"}'
+
+        self.requests += 1
+        start = time.perf_counter()
+        try:
+            request = json.loads(body) if body else {}
+            if not isinstance(request, dict):
+                raise RequestError("Request body must be a JSON object")
+            status, result = await route(request)
+        except (RequestError, PolicyError, json.JSONDecodeError) as e:
+            status, result = 400, {'error': str(e)}
+        except QueueFullError as e:
+            status, result = 503, {'error': str(e)}
+        if metrics.enabled:
+            metrics.REQUEST_SECONDS.observe(time.perf_counter() - start, path)
+            metrics.REQUESTS.inc(path, str(status))
+        if isinstance(result, str):
+            return status, metrics.PROMETHEUS_CONTENT_TYPE, result.encode('utf-8')
+        return status, JSON, json.dumps(result).encode('utf-8')
+
+    async def validate(self, request: Dict) -> Tuple[int, Dict]:
+        passwords, batched = _passwords(request, self.max_batch)
+        policy = request.get('policy')
+        if policy is not None and not isinstance(policy, str):
+            raise RequestError("'policy' must be a string")
+        check = validate_password_mask if policy is None else get_policy(policy).check
+        results = []
+        for password in passwords:
+            mask = check(password)
+            results.append({'valid': not mask, 'failed': FAILED_NAMES[mask]})
+        self.items += len(results)
+        return 200, {'results': results} if batched else results[0]
+
+    async def hash(self, request: Dict) -> Tuple[int, Dict]:
+        passwords, batched = _passwords(request, self.max_batch)
+        scheme = request.get('scheme', 'sha256')
+        if not isinstance(scheme, str):
+            raise RequestError("'scheme' must be a string")
+        if scheme == 'sha256':
+            hashes = [hash_password(p) for p in passwords]
+        else:
+            hasher = self.hashers.get(scheme)
+            if hasher is None:
+                try:
+                    hasher = self.hashers[scheme] = AsyncHasher(scheme=scheme)
+                except ValueError as e:
+                    raise RequestError(str(e)) from e
+            hashes = await hasher.hash_many(passwords)
+        self.items += len(hashes)
+        return 200, {'hashes': hashes} if batched else {'hash': hashes[0]}
+
+    async def generate(self, request: Dict) -> Tuple[int, Dict]:
+        count = request.get('count', 1)
+        length = request.get('length', 12)
+        if not isinstance(count, int) or not isinstance(length, int) or not 0 < count <= self.max_batch:
+            raise RequestError(f"'count' must be an integer from 1 to {self.max_batch}")
+        if length > self.max_length:
+            raise RequestError(f"'length' must be at most {self.max_length}")
+        try:
+            passwords = list(generate_passwords_bulk(count, length, bool(request.get('special', True))))
+        except ValueError as e:
+            raise RequestError(str(e)) from e
+        self.items += len(passwords)
+        return 200, {'passwords': passwords}
+
+    async def breach_check(self, request: Dict) -> Tuple[int, Dict]:
+        passwords, batched = _passwords(request, self.max_batch)
+        if self.breach_index is None:
+            return 503, {'error': "No breach index loaded; build one with `main.py breach-build`"}
+        counts = [self.breach_index.lookup(p) for p in passwords]
+        self.items += len(counts)
+        return 200, {'counts': counts} if batched else {'count': counts[0]}
+
+    async def health(self, request: Dict) -> Tuple[int, Dict]:
+        return 200, {
+            'status': 'ok',
+            'uptime_seconds': round(time.time() - self.started, 3),
+            'requests': self.requests,
+            'items': self.items,
+            'breach_index': self.breach_index is not None,
+            'listeners': self.listeners,
+        }
+
+    async def export_metrics(self, request: Dict) -> Tuple[int, str]:
+        return 200, metrics.render_prometheus()
+
+async def serve(socket_path: Optional[str] = None, host: Optional[str] = None,
+                port: Optional[int] = None, service: Optional[PassGuardService] = None,
+                ready: Optional[asyncio.Event] = None) -> None:
+    """
+    Run the daemon on a Unix socket and/or a localhost HTTP port until cancelled.
+
+    Args:
+        socket_path (str, optional): Unix socket to listen on
+        host (str, optional): HTTP bind address; ignored when port is None
+        port (int, optional): HTTP port (0 picks a free one)
+        service (PassGuardService, optional): Service instance (default: new one)
+        ready (asyncio.Event, optional): Set once every listener is up
+    """
+    if socket_path is None and port is None:
+        raise ValueError("Nothing to listen on: give a socket path and/or a port")
+    if DAEMON_SETTINGS['metrics']:
+        metrics.enable()
+    service = service or PassGuardService(max_batch=DAEMON_SETTINGS['max_batch'],
+                                          max_length=DAEMON_SETTINGS['max_length'])
+    servers = []
+    bound = False
+    try:
+        if socket_path is not None:
+            servers.append(await start_unix_server(service.handle, socket_path))
+            bound = True
+        if port is not None:
+            servers.append(await start_server(service.handle, host or '127.0.0.1', port))
+        service.listeners = [sock.getsockname() for server in servers for sock in server.sockets]
+        if ready is not None:
+            ready.set()
+        await asyncio.gather(*(server.serve_forever() for server in servers))
+    finally:
+        for server in servers:
+            server.close()
+        # Only remove a socket this daemon created, never another one's
+        if bound and os.path.exists(socket_path):
+            os.unlink(socket_path)
+        service.close()
@@ -0,0 +1,153 @@
+import http.client
+import json
+import socket
+from typing import Dict, List, Optional, Tuple, Union
+
+from .config import DAEMON_SETTINGS
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon answers with an error status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+def _error_message(data: bytes) -> str:
+    """The 'error' of a JSON error body, or the body itself (httpd's plain-text errors)."""
+    text = data.decode('utf-8', 'replace')
+    try:
+        result = json.loads(text)
+    except ValueError:
+        return text.strip()
+    return result.get('error', text) if isinstance(result, dict) else text
+
+class _UnixConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, path: str, timeout: float):
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.path)
+        self.sock = sock
+
+class DaemonClient:
+    """
+    Thin client for a running `main.py serve` daemon.
+
+    Uses one keep-alive connection, over the Unix socket when a path is
+    given and over localhost HTTP otherwise. Every method takes a single
+    password or a list; lists go to the daemon as one batched request.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, host: Optional[str] = None,
+                 port: Optional[int] = None, timeout: float = 30.0):
+        """
+        Args:
+            socket_path (str, optional): Daemon's Unix socket
+            host (str, optional): HTTP host, used when no socket is given
+                (default: from config)
+            port (int, optional): HTTP port (default: from config)
+            timeout (float): Per-request timeout in seconds
+        """
+        if socket_path is not None:
+            self._connection = _UnixConnection(socket_path, timeout)
+        else:
+            self._connection = http.client.HTTPConnection(
+                host or DAEMON_SETTINGS['host'], port or DAEMON_SETTINGS['port'], timeout=timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def request(self, method: str, path: str, payload: Optional[Dict] = None) -> Dict:
+        """
+        Send one request and decode the JSON response.
+
+        Raises:
+            DaemonError: If the daemon answers with a non-200 status
+        """
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        status, data = self._send(method, path, body)
+        if status != 200:
+            raise DaemonError(status, _error_message(data))
+        return json.loads(data)
+
+    def _send(self, method: str, path: str, body: Optional[bytes] = None) -> Tuple[int, bytes]:
+        """Send one request; returns (status, response body)."""
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        try:
+            try:
+                self._connection.request(method, path, body, headers)
+                response = self._connection.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # The daemon may have answered before reading the whole body
+                # (e.g. 413) and closed; otherwise it closed an idle
+                # keep-alive connection, so retry once
+                response = self._early_response()
+                if response is None:
+                    self._connection.close()
+                    self._connection.request(method, path, body, headers)
+                    response = self._connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            # Reset so the next request starts on a fresh connection
+            self._connection.close()
+            raise
+
+    def _early_response(self) -> Optional[http.client.HTTPResponse]:
+        """A response the daemon sent while the request was still being sent, if any."""
+        try:
+            return self._connection.getresponse()
+        except (OSError, http.client.HTTPException):
+            return None
+
+    @staticmethod
+    def _passwords(passwords: Union[str, List[str]]) -> Dict:
+        if isinstance(passwords, str):
+            return {'password': passwords}
+        return {'passwords': list(passwords)}
+
+    def validate(self, passwords: Union[str, List[str]], policy: Optional[str] = None):
+        """{'valid', 'failed'} for one password, or a list of them for a batch."""
+        payload = self._passwords(passwords)
+        if policy is not None:
+            payload['policy'] = policy
+        result = self.request('POST', '/validate', payload)
+        return result['results'] if 'results' in result else result
+
+    def hash(self, passwords: Union[str, List[str]], scheme: str = 'sha256'):
+        """Hash string for one password, or a list of them for a batch."""
+        payload = self._passwords(passwords)
+        payload['scheme'] = scheme
+        result = self.request('POST', '/hash', payload)
+        return result['hashes'] if 'hashes' in result else result['hash']
+
+    def generate(self, count: int = 1, length: int = 12, include_special: bool = True) -> List[str]:
+        """Freshly generated passwords."""
+        payload = {'count': count, 'length': length, 'special': include_special}
+        return self.request('POST', '/generate', payload)['passwords']
+
+    def breach_check(self, passwords: Union[str, List[str]]):
+        """Breach count for one password, or a list of them for a batch."""
+        result = self.request('POST', '/breach-check', self._passwords(passwords))
+        return result['counts'] if 'counts' in result else result['count']
+
+    def health(self) -> Dict:
+        return self.request('GET', '/health')
+
+    def metrics(self) -> str:
+        """The daemon's metrics in the Prometheus text format."""
+        status, data = self._send('GET', '/metrics')
+        if status != 200:
+            raise DaemonError(status, _error_message(data))
+        return data.decode('utf-8')
@@ -0,0 +1,195 @@
+import os
+import random
+import string
+from time import perf_counter
+from typing import IO, Iterator, Optional
+
+from . import metrics
+
+# Special characters used by the generators
+SPECIAL_CHARS = '!@#$%^&*()_+-=[]{};:,.<>?'
+
+# Random bytes drawn from the OS per refill in bulk generation
+BULK_BLOCK_SIZE = 1 << 20
+
+def generate_password(length: int = 12, include_special: bool = True) -> str:
+    """
+    Generate a random password with specified length and character sets.
+    
+    Args:
+        length (int): Length of the password (default: 12)
+        include_special (bool): Whether to include special characters (default: True)
+        
+    Returns:
+        str: Generated password
+        
+    Raises:
+        ValueError: If length is less than 4
+        
+    Example:
+        >>> generate_password(12)
+        'aB3#xY7!pQ9@'
+        >>> generate_password(8, include_special=False)
+        'aB3xY7pQ'
+    """
+    if length < 4:
+        raise ValueError("Password length must be at least 4 characters")
+    if metrics.enabled:
+        with metrics.timer(metrics.GENERATE_SECONDS, 'single'):
+            password = _generate_password(length, include_special)
+        metrics.GENERATED.inc('single')
+        return password
+    return _generate_password(length, include_special)
+
+def _generate_password(length: int, include_special: bool) -> str:
+    """Body of generate_password, which has already checked the length."""
+    # Define character sets
+    lowercase = string.ascii_lowercase
+    uppercase = string.ascii_uppercase
+    digits = string.digits
+    special = SPECIAL_CHARS
+    
+    # Build the character pool based on requirements
+    char_pool = lowercase + uppercase + digits
+    if include_special:
+        char_pool += special
+    
+    # Ensure password contains at least one of each required character type
+    password_chars = [
+        random.choice(lowercase),
+        random.choice(uppercase),
+        random.choice(digits),
+    ]
+    
+    if include_special:
+        password_chars.append(random.choice(special))
+    
+    # Fill the rest of the password with random characters from the pool
+    remaining_length = length - len(password_chars)
+    password_chars.extend(random.choice(char_pool) for _ in range(remaining_length))
+    
+    # Shuffle the characters to randomize the order
+    random.shuffle(password_chars)
+    
+    return ''.join(password_chars)
+
+def generate_multiple_passwords(count: int = 5, length: int = 12, include_special: bool = True) -> list:
+    """
+    Generate multiple random passwords.
+    
+    Args:
+        count (int): Number of passwords to generate (default: 5)
+        length (int): Length of each password (default: 12)
+        include_special (bool): Whether to include special characters (default: True)
+        
+    Returns:
+        list: List of generated passwords
+    """
+    return list(generate_passwords_bulk(count, length, include_special))
+
+def generate_passwords_bulk(count: int, length: int = 12,
+                            include_special: bool = True) -> Iterator[str]:
+    """
+    Generate many passwords from large blocks of OS randomness.
+    
+    Random bytes are drawn from os.urandom a block at a time and mapped onto
+    the character pool with bytes.translate. Bytes at or above the largest
+    multiple of the pool size are rejected, so there is no modulo bias.
+    Candidates missing a required character type are rejected as a whole,
+    which keeps the output uniform over all valid passwords.
+    
+    Args:
+        count (int): Number of passwords to generate
+        length (int): Length of each password (default: 12)
+        include_special (bool): Whether to include special characters (default: True)
+        
+    Yields:
+        str: Generated passwords
+        
+    Raises:
+        ValueError: If length is less than 4
+    """
+    if length < 4:
+        raise ValueError("Password length must be at least 4 characters")
+    
+    classes = [string.ascii_lowercase, string.ascii_uppercase, string.digits]
+    if include_special:
+        classes.append(SPECIAL_CHARS)
+    pool = ''.join(classes)
+    lower, upper, digit = (frozenset(chars) for chars in classes[:3])
+    special = frozenset(SPECIAL_CHARS) if include_special else None
+    
+    # Map every accepted byte straight to a pool character and delete the rest
+    limit = 256 - 256 % len(pool)
+    table = bytes(ord(pool[b % len(pool)]) for b in range(256))
+    rejected = bytes(range(limit, 256))
+    
+    # Long passwords get blocks big enough to usually fill one in a single draw
+    block_size = max(min(BULK_BLOCK_SIZE, count * length * 2), length * 2, 256)
+    # Timed until the batch is exhausted, including time spent by the consumer
+    start = perf_counter() if metrics.enabled else None
+    remaining = count
+    leftover = ''
+    while remaining > 0:
+        chars = leftover + os.urandom(block_size).translate(table, rejected).decode('ascii')
+        usable = len(chars) - len(chars) % length
+        leftover = chars[usable:]
+        for offset in range(0, usable, length):
+            candidate = chars[offset:offset + length]
+            if (lower.isdisjoint(candidate) or upper.isdisjoint(candidate) or
+                    digit.isdisjoint(candidate) or
+                    (special is not None and special.isdisjoint(candidate))):
+                continue
+            yield candidate
+            remaining -= 1
+            if not remaining:
+                if start is not None:
+                    metrics.GENERATE_SECONDS.observe(perf_counter() - start, 'bulk')
+                    metrics.GENERATED.inc('bulk', amount=count)
+                return
+
+def write_passwords(out: IO[str], count: int, length: int = 12,
+                    include_special: bool = True) -> int:
+    """
+    Stream bulk-generated passwords to a text file, one per line.
+    
+    Args:
+        out (IO[str]): Stream to write to
+        count (int): Number of passwords to generate
+        length (int): Length of each password (default: 12)
+        include_special (bool): Whether to include special characters (default: True)
+        
+    Returns:
+        int: Number of passwords written
+    """
+    from .batch import write_lines
+    return write_lines(out, generate_passwords_bulk(count, length, include_special))
+
+if __name__ == "__main__":
+    # Test the generator
+    print("Testing Password Generator:")
+    print("=" * 30)
+    
+    # Test basic generation
+    print("1. Basic password (12 chars):")
+    print(f"   {generate_password()}")
+    
+    # Test without special characters
+    print("\n2. Password without special chars:")
+    print(f"   {generate_password(include_special=False)}")
+    
+    # Test custom length
+    print("\n3. Short password (8 chars):")
+    print(f"   {generate_password(8)}")
+    
+    # Test multiple passwords
+    print("\n4. Multiple passwords:")
+    for i, pwd in enumerate(generate_multiple_passwords(3, 10), 1):
+        print(f"   {i}. {pwd}")
+    
+    # Test error handling
+    print("\n5. Testing error handling:")
+    try:
+        generate_password(3)
+    except ValueError as e:
+        print(f"   Error (expected): {e}")
\ No newline at end of file
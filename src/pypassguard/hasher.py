@@ -0,0 +1,285 @@
+import abc
+import base64
+import hashlib
+import hmac
+import os
+import time
+from typing import Dict, Optional
+
+from . import metrics
+from .config import HASHER_SETTINGS
+
+def hash_password(password: str) -> str:
+    """
+    Hash a password using SHA-256 algorithm.
+    
+    Args:
+        password (str): The password to hash
+        
+    Returns:
+        str: SHA-256 hash as a hexadecimal string
+    """
+    if metrics.enabled:
+        with metrics.timer(metrics.HASH_SECONDS, 'sha256', 'hash'):
+            return hashlib.sha256(password.encode('utf-8')).hexdigest()
+    password_bytes = password.encode('utf-8')
+    hash_object = hashlib.sha256(password_bytes)
+    return hash_object.hexdigest()
+
+def digest_password(password: str, algorithm: str = 'sha256') -> bytes:
+    """
+    Return the raw digest of a password.
+    
+    Args:
+        password (str): The password to hash
+        algorithm (str): Any hashlib algorithm name (default: 'sha256')
+        
+    Returns:
+        bytes: Binary digest, e.g. 32 bytes for SHA-256 or 20 for SHA-1
+    """
+    return hashlib.new(algorithm, password.encode('utf-8')).digest()
+
+class PasswordHasher(abc.ABC):
+    """
+    Base class for salted, tunable password hashing schemes.
+    
+    Encoded hashes are self-describing: `$<scheme>$<params>$<salt>$<hash>`,
+    with salt and hash in unpadded base64. Subclasses implement _derive and
+    the parameter (de)serialization.
+    """
+    
+    scheme = ''
+    
+    def __init__(self, **params):
+        for name, value in params.items():
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"{self.scheme} parameter {name} must be a positive integer")
+        self.params = params
+    
+    @abc.abstractmethod
+    def _derive(self, password: bytes, salt: bytes, params: Dict[str, int]) -> bytes:
+        """Derive the raw hash of a password."""
+    
+    @abc.abstractmethod
+    def _format_params(self, params: Dict[str, int]) -> str:
+        """Serialize work factors for the encoded hash."""
+    
+    @abc.abstractmethod
+    def _parse_params(self, text: str) -> Dict[str, int]:
+        """Parse work factors from an encoded hash."""
+    
+    def encode(self, password: str, salt: Optional[bytes] = None) -> str:
+        """Hash a password with a fresh random salt and encode the result."""
+        if salt is None:
+            salt = os.urandom(HASHER_SETTINGS['salt_size'])
+        with metrics.timer(metrics.HASH_SECONDS, self.scheme, 'hash'):
+            derived = self._derive(password.encode('utf-8'), salt, self.params)
+        return '$'.join(('', self.scheme, self._format_params(self.params), _b64(salt), _b64(derived)))
+    
+    def verify(self, password: str, encoded: str) -> bool:
+        """Check a password against an encoded hash of this scheme in constant time."""
+        params, salt, expected = self.decode(encoded)
+        with metrics.timer(metrics.HASH_SECONDS, self.scheme, 'verify'):
+            derived = self._derive(password.encode('utf-8'), salt, params)
+        return hmac.compare_digest(derived, expected)
+    
+    def decode(self, encoded: str):
+        """Split an encoded hash into (params, salt, hash)."""
+        try:
+            _, scheme, params, salt, derived = encoded.split('$')
+            if scheme != self.scheme:
+                raise ValueError
+            return self._parse_params(params), _unb64(salt), _unb64(derived)
+        except (ValueError, KeyError):
+            raise ValueError(f"Not a valid {self.scheme} hash") from None
+    
+    def needs_update(self, encoded: str) -> bool:
+        """True if the hash was made with weaker parameters than the current ones."""
+        params = self.decode(encoded)[0]
+        return any(params.get(name, 0) < value for name, value in self.params.items())
+
+class Pbkdf2Hasher(PasswordHasher):
+    """PBKDF2-HMAC-SHA256: `$pbkdf2-sha256$i=<iterations>$<salt>$<hash>`."""
+    
+    scheme = 'pbkdf2-sha256'
+    
+    def __init__(self, i: Optional[int] = None):
+        """
+        Args:
+            i (int, optional): Iteration count (default: from HASHER_SETTINGS)
+        """
+        super().__init__(i=HASHER_SETTINGS['pbkdf2_iterations'] if i is None else i)
+    
+    def _derive(self, password, salt, params):
+        return hashlib.pbkdf2_hmac('sha256', password, salt, params['i'])
+    
+    def _format_params(self, params):
+        return f"i={params['i']}"
+    
+    def _parse_params(self, text):
+        return _parse_kv(text, ('i',))
+
+class ScryptHasher(PasswordHasher):
+    """scrypt: `$scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<hash>`."""
+    
+    scheme = 'scrypt'
+    
+    def __init__(self, ln: Optional[int] = None, r: Optional[int] = None, p: Optional[int] = None):
+        """
+        Args:
+            ln (int, optional): log2 of the CPU/memory cost N
+            r (int, optional): Block size
+            p (int, optional): Parallelization factor
+        """
+        super().__init__(ln=HASHER_SETTINGS['scrypt_ln'] if ln is None else ln,
+                         r=HASHER_SETTINGS['scrypt_r'] if r is None else r,
+                         p=HASHER_SETTINGS['scrypt_p'] if p is None else p)
+    
+    def _derive(self, password, salt, params):
+        n, r, p = 1 << params['ln'], params['r'], params['p']
+        # scrypt needs about 128 * N * r bytes; leave headroom for the rest
+        return hashlib.scrypt(password, salt=salt, n=n, r=r, p=p,
+                              maxmem=128 * r * (n + p + 2) + 2**20, dklen=32)
+    
+    def _format_params(self, params):
+        return f"ln={params['ln']},r={params['r']},p={params['p']}"
+    
+    def _parse_params(self, text):
+        return _parse_kv(text, ('ln', 'r', 'p'))
+
+# Registered hashing schemes, keyed by the name used in encoded hashes
+HASHERS = {
+    Pbkdf2Hasher.scheme: Pbkdf2Hasher,
+    ScryptHasher.scheme: ScryptHasher,
+}
+
+def get_hasher(scheme: Optional[str] = None, **params) -> PasswordHasher:
+    """
+    Instantiate a registered hashing scheme.
+    
+    Args:
+        scheme (str, optional): Scheme name (default: HASHER_SETTINGS['scheme'])
+        **params: Overrides for the scheme's work factors
+        
+    Returns:
+        PasswordHasher: Configured hasher
+        
+    Raises:
+        ValueError: If the scheme is not registered or a work factor is not a
+            positive integer
+    """
+    if scheme is None:
+        scheme = HASHER_SETTINGS['scheme']
+    if scheme not in HASHERS:
+        raise ValueError(f"Unknown hashing scheme: {scheme}")
+    return HASHERS[scheme](**params)
+
+def encode_password(password: str, scheme: Optional[str] = None) -> str:
+    """
+    Hash a password for storage with a salted, slow scheme.
+    
+    Args:
+        password (str): The password to hash
+        scheme (str, optional): Scheme name (default: HASHER_SETTINGS['scheme'])
+        
+    Returns:
+        str: Self-describing encoded hash, e.g. '$scrypt$ln=14,r=8,p=1$...$...'
+    """
+    return get_hasher(scheme).encode(password)
+
+def verify_password(password: str, encoded: str) -> bool:
+    """
+    Check a password against an encoded hash using a constant-time compare.
+    
+    Args:
+        password (str): Password to check
+        encoded (str): Hash produced by encode_password
+        
+    Returns:
+        bool: True if the password matches
+        
+    Raises:
+        ValueError: If the encoded hash is malformed or of an unknown scheme
+    """
+    return get_hasher(_scheme_of(encoded)).verify(password, encoded)
+
+def needs_rehash(encoded: str) -> bool:
+    """
+    Check whether a stored hash should be replaced on the next login.
+    
+    A hash needs rehashing when it uses a different scheme than the one
+    configured, or weaker work factors than the current settings.
+    
+    Args:
+        encoded (str): Hash produced by encode_password
+        
+    Returns:
+        bool: True if the hash is outdated
+    """
+    scheme = _scheme_of(encoded)
+    if scheme != HASHER_SETTINGS['scheme']:
+        return True
+    return get_hasher(scheme).needs_update(encoded)
+
+def calibrate(target_ms: float = 50.0, scheme: Optional[str] = None) -> Dict[str, int]:
+    """
+    Benchmark this host and pick work factors for a target hashing latency.
+    
+    Args:
+        target_ms (float): Desired time per hash in milliseconds (default: 50)
+        scheme (str, optional): Scheme name (default: HASHER_SETTINGS['scheme'])
+        
+    Returns:
+        Dict[str, int]: Parameters for the scheme, e.g. {'i': 310000}
+    """
+    if scheme is None:
+        scheme = HASHER_SETTINGS['scheme']
+    target = target_ms / 1000
+    
+    if scheme == Pbkdf2Hasher.scheme:
+        # PBKDF2 cost is linear in the iteration count
+        probe = 20000
+        elapsed = _time_hash(Pbkdf2Hasher(probe))
+        return {'i': max(1000, int(probe * target / elapsed) // 1000 * 1000)}
+    
+    if scheme == ScryptHasher.scheme:
+        # Double N until the next step would overshoot the target
+        ln = 10
+        while ln < 22 and _time_hash(ScryptHasher(ln + 1)) <= target:
+            ln += 1
+        return {'ln': ln, 'r': HASHER_SETTINGS['scrypt_r'], 'p': HASHER_SETTINGS['scrypt_p']}
+    
+    raise ValueError(f"Cannot calibrate scheme: {scheme}")
+
+def _time_hash(hasher: PasswordHasher, repeat: int = 3) -> float:
+    """Best-of-N seconds for one hash."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hasher.encode('calibration-password')
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def _scheme_of(encoded: str) -> str:
+    parts = encoded.split('$')
+    if len(parts) != 5 or parts[0]:
+        raise ValueError("Not an encoded password hash")
+    return parts[1]
+
+def _parse_kv(text: str, names) -> Dict[str, int]:
+    params = dict(item.split('=', 1) for item in text.split(','))
+    return {name: int(params[name]) for name in names}
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text + '=' * (-len(text) % 4))
+
+if __name__ == "__main__":
+    # Test the function
+    test_password = "password123"
+    hashed = hash_password(test_password)
+    print(f"Password: {test_password}")
+    print(f"SHA-256 Hash: {hashed}")
+    print(f"Hash length: {len(hashed)} characters")
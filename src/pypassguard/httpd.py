@@ -0,0 +1,136 @@
+import asyncio
+import errno
+import os
+import socket
+import stat
+from typing import Awaitable, Callable, Dict, Tuple
+
+# (method, path, headers, body) -> (status, content_type, body)
+Handler = Callable[[str, str, Dict[str, str], bytes], Awaitable[Tuple[int, str, bytes]]]
+
+REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable',
+}
+
+# Requests larger than this are rejected before the body is read
+MAX_BODY_SIZE = 16 * 2**20
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                            handler: Handler) -> None:
+    """
+    Serve HTTP/1.1 requests on one connection until the client closes it.
+
+    Connections are kept alive between requests unless the client asks
+    otherwise or speaks HTTP/1.0.
+    """
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+
+            lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, path, version = lines[0].split(' ', 2)
+            except ValueError:
+                await _respond(writer, 400, 'text/plain', b'Malformed request line\n', False)
+                return
+
+            headers = {}
+            for line in lines[1:]:
+                name, sep, value = line.partition(':')
+                if sep:
+                    headers[name.strip().lower()] = value.strip()
+
+            keep_alive = (version == 'HTTP/1.1' and
+                          headers.get('connection', '').lower() != 'close')
+            try:
+                length = int(headers.get('content-length') or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                await _respond(writer, 400, 'text/plain', b'Invalid Content-Length\n', False)
+                return
+            if length > MAX_BODY_SIZE:
+                await _respond(writer, 413, 'text/plain', b'Request body too large\n', False)
+                return
+            body = await reader.readexactly(length) if length else b''
+
+            try:
+                status, content_type, payload = await handler(method, path, headers, body)
+            except Exception:
+                status, content_type, payload = 500, 'text/plain', b'Internal server error\n'
+            await _respond(writer, status, content_type, payload, keep_alive)
+            if not keep_alive:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def _respond(writer: asyncio.StreamWriter, status: int, content_type: str,
+                   payload: bytes, keep_alive: bool) -> None:
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode('latin-1') + payload)
+    await writer.drain()
+
+async def start_server(handler: Handler, host: str = '127.0.0.1', port: int = 0) -> asyncio.AbstractServer:
+    """
+    Start an HTTP server on a TCP port.
+
+    Args:
+        handler (Handler): Coroutine handling each request
+        host (str): Interface to bind (default: localhost only)
+        port (int): Port to bind; 0 picks a free port
+
+    Returns:
+        asyncio.AbstractServer: The running server
+    """
+    return await asyncio.start_server(
+        lambda reader, writer: handle_connection(reader, writer, handler), host, port)
+
+async def start_unix_server(handler: Handler, path: str) -> asyncio.AbstractServer:
+    """
+    Start an HTTP server on a Unix domain socket.
+
+    Local clients skip the TCP stack entirely, e.g.
+    `curl --unix-socket PATH http://localhost/...`. A stale socket file
+    left behind by a previous run is replaced.
+
+    Args:
+        handler (Handler): Coroutine handling each request
+        path (str): Socket file to create
+
+    Returns:
+        asyncio.AbstractServer: The running server
+
+    Raises:
+        FileExistsError: If the path is not a socket, or a server is still
+            listening on it
+    """
+    _remove_stale_socket(path)
+    return await asyncio.start_unix_server(
+        lambda reader, writer: handle_connection(reader, writer, handler), path)
+
+def _remove_stale_socket(path: str) -> None:
+    """Unlink a socket file at `path` that nothing listens on any more."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, "Not a socket; refusing to replace it", path)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise FileExistsError(errno.EEXIST, "A server is already listening on this socket", path)
@@ -0,0 +1,137 @@
+from collections.abc import Mapping
+from typing import Dict, FrozenSet, Iterator, Sequence, Tuple
+
+# Key rows (unshifted, shifted) and each row's horizontal offset in key
+# widths, measured from the left edge of the number row.
+QWERTY = (
+    ("`1234567890-=", "~!@#$%^&*()_+"),
+    ("qwertyuiop[]\\", "QWERTYUIOP{}|"),
+    ("asdfghjkl;'", 'ASDFGHJKL:"'),
+    ("zxcvbnm,./", "ZXCVBNM<>?"),
+)
+ROW_OFFSETS = (0.0, 1.5, 1.75, 2.25)
+
+# French AZERTY on an ISO board; the extra '<' key starts the bottom row
+AZERTY = (
+    ("²&é\"'(-è_çà)=", "²1234567890°+"),
+    ("azertyuiop^$", "AZERTYUIOP¨£"),
+    ("qsdfghjklmù*", "QSDFGHJKLM%µ"),
+    ("<wxcvbn,;:!", ">WXCVBN?./§"),
+)
+AZERTY_OFFSETS = (0.0, 1.5, 1.75, 1.25)
+
+# US Dvorak
+DVORAK = (
+    ("`1234567890[]", "~!@#$%^&*(){}"),
+    ("',.pyfgcrl/=\\", '"<>PYFGCRL?+|'),
+    ("aoeuidhtns-", "AOEUIDHTNS_"),
+    (";qjkxbmwvz", ":QJKXBMWVZ"),
+)
+
+# Keys on neighbouring rows count as adjacent up to this horizontal distance
+_DIAGONAL_REACH = 0.75
+
+def key_positions(rows: Sequence, offsets: Sequence[float] = ROW_OFFSETS) -> Dict[str, Tuple[int, float]]:
+    """
+    Map every character of a layout to its key's (row, x) position.
+
+    Shifted characters share their key's position.
+
+    Args:
+        rows (Sequence): (unshifted, shifted) character strings per row
+        offsets (Sequence[float]): Horizontal offset of each row
+
+    Returns:
+        Dict[str, Tuple[int, float]]: Character -> (row, x)
+    """
+    positions = {}
+    for row, (plain, shifted) in enumerate(rows):
+        for column, chars in enumerate(zip(plain, shifted)):
+            for char in chars:
+                positions[char] = (row, column + offsets[row])
+    return positions
+
+def build_adjacency(rows: Sequence, offsets: Sequence[float] = ROW_OFFSETS) -> Dict[str, FrozenSet[str]]:
+    """
+    Build a key adjacency graph from a staggered keyboard layout.
+
+    Keys are adjacent when they are side by side on the same row, or on
+    neighbouring rows within three quarters of a key width. Shifted
+    characters share their key's position, so '!' neighbours 'q' and '2'.
+
+    Args:
+        rows (Sequence): (unshifted, shifted) character strings per row
+        offsets (Sequence[float]): Horizontal offset of each row
+
+    Returns:
+        Dict[str, FrozenSet[str]]: Character -> adjacent characters
+    """
+    keys = {}
+    for char, position in key_positions(rows, offsets).items():
+        keys.setdefault(position, []).append(char)
+
+    graph = {}
+    for (row, x), chars in keys.items():
+        neighbours = set()
+        for (other_row, other_x), other_chars in keys.items():
+            distance = abs(other_x - x)
+            if ((other_row == row and distance == 1) or
+                    (abs(other_row - row) == 1 and distance <= _DIAGONAL_REACH + 1e-9)):
+                neighbours.update(other_chars)
+        for char in chars:
+            graph[char] = frozenset(neighbours)
+    return graph
+
+def average_degree(graph: Dict[str, FrozenSet[str]]) -> float:
+    """Mean number of neighbouring keys per key."""
+    # Every key contributes two characters (unshifted and shifted)
+    return sum(len(n) for n in graph.values()) / len(graph) / 2
+
+class Layout:
+    """Precomputed adjacency, positions and shift state of one keyboard layout."""
+
+    __slots__ = ('name', 'graph', 'positions', 'shifted', 'keys', 'degree')
+
+    def __init__(self, name: str, rows: Sequence, offsets: Sequence[float] = ROW_OFFSETS):
+        self.name = name
+        self.graph = build_adjacency(rows, offsets)
+        self.positions = key_positions(rows, offsets)
+        self.shifted = frozenset(''.join(shifted for _, shifted in rows))
+        self.keys = len(set(self.positions.values()))
+        self.degree = average_degree(self.graph)
+
+    def direction(self, a: str, b: str) -> Tuple[int, int]:
+        """Coarse direction of travel from key `a` to adjacent key `b`."""
+        row_a, x_a = self.positions[a]
+        row_b, x_b = self.positions[b]
+        return row_b - row_a, (x_b > x_a) - (x_b < x_a)
+
+class _Layouts(Mapping):
+    """Layouts by name, each built on first access."""
+
+    def __init__(self, specs: Dict[str, Tuple[Sequence, Sequence[float]]]):
+        self._specs = specs
+        self._built: Dict[str, Layout] = {}
+
+    def __getitem__(self, name: str) -> Layout:
+        layout = self._built.get(name)
+        if layout is None:
+            rows, offsets = self._specs[name]
+            layout = self._built[name] = Layout(name, rows, offsets)
+        return layout
+
+    def __contains__(self, name) -> bool:
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+# Layouts by name; adjacency graphs are only built for the layouts used
+KEYBOARDS = _Layouts({
+    'qwerty': (QWERTY, ROW_OFFSETS),
+    'azerty': (AZERTY, AZERTY_OFFSETS),
+    'dvorak': (DVORAK, ROW_OFFSETS),
+})
@@ -0,0 +1,71 @@
+from typing import Dict, List
+
+def reverse_substitutions(substitutions: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """
+    Invert a letter -> substitutes mapping such as COMMON_SUBSTITUTIONS.
+
+    Args:
+        substitutions (Dict[str, List[str]]): Letter -> characters used for it
+
+    Returns:
+        Dict[str, List[str]]: Substitute -> letters it may stand for, in
+        mapping order; ambiguous substitutes such as '1' list several
+    """
+    choices: Dict[str, List[str]] = {}
+    for letter, subs in substitutions.items():
+        for sub in subs:
+            if sub != letter and letter not in choices.get(sub, ()):
+                choices.setdefault(sub, []).append(letter)
+    return choices
+
+def canonical_table(substitutions: Dict[str, List[str]]) -> Dict[int, str]:
+    """
+    Build a str.translate table mapping text to its de-leeted normal form.
+
+    Letters that share a substitute are merged into one class, represented
+    by the class's smallest letter: '1' stands for both 'i' and 'l', so
+    'i', 'l', '1', '!' and '|' all become 'i'. Canonicalizing both the
+    patterns and the password then catches every substitution combination
+    with a single translate call instead of enumerating variants; the price
+    is that words differing only within a class (e.g. 'i' vs 'l') match
+    each other. Digits and symbols fold into letters too, so a pattern with
+    no letters would match plain words ('123456' becomes 'izeasb');
+    blocklist.Blocklist keeps such patterns out of the normal form.
+
+    Args:
+        substitutions (Dict[str, List[str]]): Letter -> characters used for it
+
+    Returns:
+        Dict[int, str]: Translation table for lowercase text
+    """
+    choices = reverse_substitutions(substitutions)
+
+    # Union-find over letters joined by a shared substitute
+    parent: Dict[str, str] = {}
+
+    def find(letter: str) -> str:
+        parent.setdefault(letter, letter)
+        while parent[letter] != letter:
+            parent[letter] = parent[parent[letter]]
+            letter = parent[letter]
+        return letter
+
+    for letters in choices.values():
+        root = find(letters[0])
+        for letter in letters[1:]:
+            other = find(letter)
+            if other != root:
+                parent[max(root, other)] = min(root, other)
+                root = min(root, other)
+
+    table = {}
+    for letter in list(parent):
+        if find(letter) != letter:
+            table[ord(letter)] = find(letter)
+    for sub, letters in choices.items():
+        table[ord(sub)] = find(letters[0])
+    return table
+
+def canonicalize(text: str, table: Dict[int, str]) -> str:
+    """Lowercase and de-leet `text` with a table from canonical_table."""
+    return text.lower().translate(table)
@@ -0,0 +1,208 @@
+import bisect
+import os
+import threading
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from .config import METRICS_SETTINGS
+
+# Upper bounds (seconds) of the latency histogram buckets: single checks
+# take well under a microsecond, slow hashes tens of milliseconds
+LATENCY_BUCKETS = (1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4,
+                   2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Every Counter and Histogram, in creation order
+REGISTRY: List = []
+
+# Checked by the instrumented call sites before recording anything; while
+# False, timer() hands out a shared no-op hook and the validator runs the
+# uninstrumented rule engine
+enabled = bool(METRICS_SETTINGS['enabled'] or os.environ.get('PYPASSGUARD_METRICS', '') not in ('', '0'))
+
+def enable() -> None:
+    """Start recording metrics in this process."""
+    global enabled
+    enabled = True
+
+def disable() -> None:
+    """Stop recording; values recorded so far are kept."""
+    global enabled
+    enabled = False
+
+class Counter:
+    """Monotonic counter with an optional set of label names."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """Add `amount` to the series for the given label values."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        """(sample name, labels, value) for every series."""
+        with self._lock:
+            return [(self.name, tuple(zip(self.labels, key)), value)
+                    for key, value in sorted(self._values.items())]
+
+class Histogram:
+    """Fixed-bucket histogram of durations in seconds, per label set."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        # label values -> [per-bucket counts (last one is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Add one observation to the series for the given label values."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return sum(series[0]) if series else 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def samples(self) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        """Cumulative `_bucket` samples plus `_sum` and `_count`, per series."""
+        samples = []
+        with self._lock:
+            series = sorted((key, list(counts), total) for key, (counts, total) in self._series.items())
+        for key, counts, total in series:
+            labels = tuple(zip(self.labels, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                samples.append((self.name + '_bucket', labels + (('le', _format_value(bound)),),
+                                cumulative))
+            samples.append((self.name + '_sum', labels, total))
+            samples.append((self.name + '_count', labels, cumulative))
+        return samples
+
+class _Timer:
+    """Context manager recording its elapsed time into a histogram."""
+
+    __slots__ = ('histogram', 'label_values', 'start')
+
+    def __init__(self, histogram: Histogram, label_values: Tuple[str, ...]):
+        self.histogram = histogram
+        self.label_values = label_values
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(perf_counter() - self.start, *self.label_values)
+        return False
+
+class _NoOpTimer:
+    """Stand-in for _Timer while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NO_OP_TIMER = _NoOpTimer()
+
+def timer(histogram: Histogram, *label_values: str):
+    """
+    Time a `with` block into a histogram; a shared no-op when disabled.
+
+    Example:
+        >>> with timer(HASH_SECONDS, 'scrypt'):
+        ...     encoded = hasher.encode(password)
+    """
+    return _Timer(histogram, label_values) if enabled else _NO_OP_TIMER
+
+def reset() -> None:
+    """Zero every registered metric."""
+    for metric in REGISTRY:
+        metric.reset()
+
+def render_prometheus() -> str:
+    """
+    Every registered metric in the Prometheus text exposition format.
+
+    Returns:
+        str: '# HELP' / '# TYPE' headers followed by one line per sample
+    """
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            if labels:
+                text = ','.join(f'{label}="{_escape(text)}"' for label, text in labels)
+                name = f"{name}{{{text}}}"
+            lines.append(f"{name} {_format_value(value)}")
+    return '\n'.join(lines) + '\n'
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+VALIDATIONS = Counter('pypassguard_validations_total', 'Passwords validated, by outcome',
+                      ('result',))
+REJECTIONS = Counter('pypassguard_validation_failures_total',
+                     'Failed checks among rejected passwords, by check', ('check',))
+CHECK_SECONDS = Histogram('pypassguard_validation_stage_seconds',
+                          'Time spent in each stage of the rule engine', ('stage',))
+HASH_SECONDS = Histogram('pypassguard_hash_seconds', 'Time to hash or verify one password',
+                         ('scheme', 'operation'))
+GENERATE_SECONDS = Histogram('pypassguard_generate_seconds',
+                             'Time per generate call (a whole batch for bulk generation)',
+                             ('method',))
+GENERATED = Counter('pypassguard_generated_passwords_total', 'Passwords generated', ('method',))
+LOOKUPS = Counter('pypassguard_lookups_total',
+                  'Lookup store queries, by store and result (hit: listed, or served from cache)',
+                  ('store', 'result'))
+LOOKUP_SECONDS = Histogram('pypassguard_lookup_seconds', 'Time per lookup store query',
+                           ('store',))
+REQUESTS = Counter('pypassguard_daemon_requests_total', 'Daemon requests, by endpoint and status',
+                   ('endpoint', 'status'))
+REQUEST_SECONDS = Histogram('pypassguard_daemon_request_seconds', 'Daemon request handling time',
+                            ('endpoint',))
@@ -0,0 +1,163 @@
+import itertools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Items per task sent to a worker; large enough to amortize pickling
+DEFAULT_CHUNK_SIZE = 10000
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most `size` items, lazily."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def parallel_map(func: Callable[[T], R], items: Iterable[T], workers: int,
+                 ordered: bool = True, max_pending: Optional[int] = None,
+                 initializer: Optional[Callable] = None,
+                 initargs: tuple = ()) -> Iterator[Tuple[T, R]]:
+    """
+    Apply `func` to each item in a pool of worker processes.
+
+    At most `max_pending` items are in flight at once and the input is only
+    consumed as slots free up, so memory stays flat however long the input
+    is. Pass chunks of work as items to amortize inter-process overhead.
+
+    Args:
+        func (Callable): Picklable top-level function run in the workers
+        items (Iterable): Work items, typically chunks
+        workers (int): Number of worker processes
+        ordered (bool): Yield results in input order (default: True);
+            otherwise yield them as soon as they complete
+        max_pending (int, optional): In-flight limit (default: 2 * workers)
+        initializer (Callable, optional): Run once in each worker
+        initargs (tuple): Arguments for the initializer
+
+    Yields:
+        Tuple[T, R]: (item, func(item))
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    max_pending = max_pending or workers * 2
+    iterator = iter(items)
+
+    with ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs) as pool:
+        def submit() -> Optional[Tuple[T, Future]]:
+            for item in iterator:
+                return item, pool.submit(func, item)
+            return None
+
+        if ordered:
+            queue = deque()
+            for _ in range(max_pending):
+                task = submit()
+                if task is None:
+                    break
+                queue.append(task)
+            while queue:
+                item, future = queue.popleft()
+                result = future.result()
+                task = submit()
+                if task is not None:
+                    queue.append(task)
+                yield item, result
+        else:
+            pending = {}
+            for _ in range(max_pending):
+                task = submit()
+                if task is None:
+                    break
+                pending[task[1]] = task[0]
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    task = submit()
+                    if task is not None:
+                        pending[task[1]] = task[0]
+                    yield item, future.result()
+
+def validate_many_parallel(passwords: Iterable[str], workers: int,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE, ordered: bool = True,
+                           blocklist: Optional[str] = None,
+                           policy: Optional[str] = None) -> Iterator[Tuple[str, bool, Tuple[str, ...]]]:
+    """
+    Multi-process counterpart of validator.validate_many.
+
+    Workers only send back one failure-mask byte per password; the parent
+    pairs them with the passwords it already holds.
+
+    Args:
+        passwords (Iterable[str]): Passwords to validate
+        workers (int): Number of worker processes
+        chunk_size (int): Passwords per task (default: 10000)
+        ordered (bool): Preserve input order (default: True)
+        blocklist (str, optional): Word list loaded in every worker
+        policy (str, optional): Named policy profile compiled in every worker
+
+    Yields:
+        Tuple[str, bool, Tuple[str, ...]]: (password, is_valid, failed_checks)
+    """
+    from .rules import FAILED_NAMES
+
+    results = parallel_map(_validate_chunk, chunked(passwords, chunk_size), workers, ordered,
+                           initializer=_init_validator, initargs=(blocklist, policy))
+    for chunk, masks in results:
+        for password, mask in zip(chunk, masks):
+            yield password, not mask, FAILED_NAMES[mask]
+
+def generate_passwords_parallel(count: int, length: int = 12, include_special: bool = True,
+                                workers: int = 2, chunk_size: int = 100000) -> Iterator[str]:
+    """
+    Multi-process counterpart of generator.generate_passwords_bulk.
+
+    Args:
+        count (int): Number of passwords to generate
+        length (int): Length of each password (default: 12)
+        include_special (bool): Whether to include special characters (default: True)
+        workers (int): Number of worker processes
+        chunk_size (int): Passwords per task (default: 100000)
+
+    Yields:
+        str: Generated passwords, in no particular order
+    """
+    if length < 4:
+        raise ValueError("Password length must be at least 4 characters")
+    sizes = [chunk_size] * (count // chunk_size)
+    if count % chunk_size:
+        sizes.append(count % chunk_size)
+
+    tasks = ((size, length, include_special) for size in sizes)
+    for _, block in parallel_map(_generate_chunk, tasks, workers, ordered=False):
+        yield from block.split('\n')
+
+# Mask function used by _validate_chunk in worker processes
+_worker_check: Optional[Callable[[str], int]] = None
+
+def _init_validator(blocklist: Optional[str], policy: Optional[str] = None) -> None:
+    global _worker_check
+    from .validator import load_blocklist, validate_password_mask
+    if blocklist:
+        load_blocklist(blocklist)
+    if policy:
+        from .policy import get_policy
+        _worker_check = get_policy(policy).check
+    else:
+        _worker_check = validate_password_mask
+
+def _validate_chunk(passwords: List[str]) -> bytes:
+    check = _worker_check
+    if check is None:
+        from .validator import validate_password_mask as check
+    return bytes(map(check, passwords))
+
+def _generate_chunk(task: Tuple[int, int, bool]) -> str:
+    from .generator import generate_passwords_bulk
+    size, length, include_special = task
+    return '\n'.join(generate_passwords_bulk(size, length, include_special))
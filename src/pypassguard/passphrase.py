@@ -0,0 +1,336 @@
+import math
+import mmap
+import os
+import secrets
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from time import perf_counter
+from typing import Iterable, Iterator, Optional
+
+from . import metrics
+from .cache import cache_directory
+from .config import PASSPHRASE_SETTINGS
+
+# File layout: a fixed 24-byte header, then count + 1 little-endian uint32
+# offsets into the word data, then the UTF-8 words back to back. Word i is
+# data[offsets[i]:offsets[i + 1]].
+MAGIC = b'PPGWORD1'
+VERSION = 1
+HEADER = struct.Struct('<8sH6xQ')
+OFFSET = struct.Struct('<I')
+
+# Random bytes drawn from the OS per refill in bulk generation
+BULK_BLOCK_SIZE = 1 << 16
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class WordListError(ValueError):
+    """Raised when a word list file is malformed or empty."""
+
+class WordList:
+    """
+    Memory-mapped, offset-indexed word list for passphrase generation.
+
+    Opening one reads only the header: words are sliced out of the mapping
+    by index when drawn, so a million-word list costs no parsing, no
+    per-word objects and only the pages actually touched. Words are drawn
+    by uniform random index (secrets.randbelow, or rejection-sampled OS
+    randomness in bulk), so every word is equally likely.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): File written by build_word_list
+
+        Raises:
+            WordListError: If the file is not a valid word list
+        """
+        self.path = path
+        with open(path, 'rb') as handle:
+            header = handle.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise WordListError(f"{path}: file too short for a word list header")
+            magic, version, count = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise WordListError(f"{path}: not a PyPassGuard word list (v{VERSION})")
+            if not count:
+                raise WordListError(f"{path}: word list is empty")
+            self._data_start = HEADER.size + (count + 1) * OFFSET.size
+            size = os.fstat(handle.fileno()).st_size
+            if size < self._data_start:
+                raise WordListError(f"{path}: truncated word list")
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if OFFSET.unpack_from(self._mm, self._data_start - OFFSET.size)[0] > size - self._data_start:
+            self._mm.close()
+            raise WordListError(f"{path}: truncated word list")
+        self.count = count
+        self._offsets = self._load_offsets()
+
+    def _load_offsets(self):
+        """The offset table as a sequence of ints; a view, not a copy, on little-endian hosts."""
+        start, end = HEADER.size, self._data_start
+        if sys.byteorder == 'little':
+            return memoryview(self._mm)[start:end].cast('I')
+        offsets = array('I', self._mm[start:end])
+        offsets.byteswap()
+        return offsets
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < self.count:
+            raise IndexError("word index out of range")
+        return self.word_bytes(index).decode('utf-8')
+
+    def close(self) -> None:
+        """Unmap the word list."""
+        if self._mm is not None:
+            if isinstance(self._offsets, memoryview):
+                self._offsets.release()
+            self._offsets = None
+            self._mm.close()
+            self._mm = None
+
+    @property
+    def bits_per_word(self) -> float:
+        """Entropy contributed by each uniformly drawn word."""
+        return math.log2(self.count)
+
+    def entropy(self, words: int) -> float:
+        """Entropy in bits of a passphrase of `words` words."""
+        return words * self.bits_per_word
+
+    def word_bytes(self, index: int) -> bytes:
+        """UTF-8 bytes of word `index`."""
+        offsets, base = self._offsets, self._data_start
+        return self._mm[base + offsets[index]:base + offsets[index + 1]]
+
+    def passphrase(self, words: Optional[int] = None, separator: Optional[str] = None) -> str:
+        """
+        Generate one passphrase.
+
+        Args:
+            words (int, optional): Number of words (default: from config)
+            separator (str, optional): Joins the words (default: from config)
+
+        Returns:
+            str: Passphrase, e.g. 'otter-maple-crisp-lunar-vivid-oak'
+
+        Raises:
+            ValueError: If words is less than 1
+        """
+        words = PASSPHRASE_SETTINGS['words'] if words is None else words
+        separator = PASSPHRASE_SETTINGS['separator'] if separator is None else separator
+        if words < 1:
+            raise ValueError("A passphrase needs at least one word")
+        if metrics.enabled:
+            with metrics.timer(metrics.GENERATE_SECONDS, 'passphrase'):
+                phrase = self._passphrase(words, separator)
+            metrics.GENERATED.inc('passphrase')
+            return phrase
+        return self._passphrase(words, separator)
+
+    def _passphrase(self, words: int, separator: str) -> str:
+        word_bytes, count = self.word_bytes, self.count
+        return separator.encode('utf-8').join(
+            [word_bytes(secrets.randbelow(count)) for _ in range(words)]).decode('utf-8')
+
+    def random_indexes(self, count: int) -> Iterator[int]:
+        """
+        Uniform random word indexes from large blocks of OS randomness.
+
+        Each index comes from a random 32-bit value; values at or above the
+        largest multiple of the list size are rejected, so there is no
+        modulo bias.
+
+        Args:
+            count (int): Number of indexes
+
+        Yields:
+            int: Indexes in range(len(self))
+        """
+        size = self.count
+        limit = (1 << 32) - (1 << 32) % size
+        while count > 0:
+            values = array('I', os.urandom(4 * min(BULK_BLOCK_SIZE // 4, count + 16)))
+            indexes = [value % size for value in values if value < limit][:count]
+            yield from indexes
+            count -= len(indexes)
+
+    def passphrases_bulk(self, count: int, words: Optional[int] = None,
+                         separator: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate many passphrases from blocks of OS randomness.
+
+        Args:
+            count (int): Number of passphrases
+            words (int, optional): Words per passphrase (default: from config)
+            separator (str, optional): Joins the words (default: from config)
+
+        Yields:
+            str: Passphrases
+
+        Raises:
+            ValueError: If words is less than 1
+        """
+        words = PASSPHRASE_SETTINGS['words'] if words is None else words
+        separator = PASSPHRASE_SETTINGS['separator'] if separator is None else separator
+        if words < 1:
+            raise ValueError("A passphrase needs at least one word")
+        join = separator.encode('utf-8').join
+        data, offsets, base = self._mm, self._offsets, self._data_start
+        # Timed until the batch is exhausted, including time spent by the consumer
+        start = perf_counter() if metrics.enabled else None
+        # Draw indexes for a few thousand phrases at a time
+        per_batch = max(1, 4096 // words)
+        remaining = count
+        while remaining > 0:
+            batch = min(per_batch, remaining)
+            indexes = list(self.random_indexes(batch * words))
+            for first in range(0, batch * words, words):
+                yield join([data[base + offsets[i]:base + offsets[i + 1]]
+                            for i in indexes[first:first + words]]).decode('utf-8')
+            remaining -= batch
+        if start is not None:
+            metrics.GENERATE_SECONDS.observe(perf_counter() - start, 'passphrase_bulk')
+            metrics.GENERATED.inc('passphrase_bulk', amount=count)
+
+def parse_words(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Words from a plain-text list, one per line.
+
+    Blank lines and '#' comments are skipped. Diceware-style lines
+    ('11111<TAB>abacus', as in the EFF lists) yield just the word.
+    """
+    for line in lines:
+        word = line.strip()
+        if not word or word.startswith('#'):
+            continue
+        fields = word.split()
+        if len(fields) == 2 and fields[0].isdigit():
+            word = fields[1]
+        yield word
+
+def build_word_list(sources: Iterable[str], output: str) -> int:
+    """
+    Compile plain-text word lists into the memory-mapped format.
+
+    Duplicate words are dropped (they would be drawn more often than the
+    entropy estimate assumes); the first occurrence keeps its position.
+    The file is written under a temporary name and renamed into place.
+
+    Args:
+        sources (Iterable[str]): Plain-text lists, one word per line
+        output (str): Path of the word list to write
+
+    Returns:
+        int: Number of distinct words written
+
+    Raises:
+        WordListError: If the sources hold no words or more than 4 GiB of text
+    """
+    words = {}
+    for path in sources:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            for word in parse_words(f):
+                words.setdefault(word.encode('utf-8'), None)
+    if not words:
+        raise WordListError("no words found in the word list sources")
+
+    offsets = array('I', [0])
+    total = 0
+    for word in words:
+        total += len(word)
+        if total > 0xFFFFFFFF:
+            raise WordListError("word list exceeds 4 GiB of text")
+        offsets.append(total)
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, VERSION, len(words)))
+            out.write(offsets.tobytes())
+            out.write(b''.join(words))
+        os.replace(temporary, output)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+    return len(words)
+
+def is_word_list(path: str) -> bool:
+    """Whether `path` is a compiled word list (as opposed to plain text)."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def open_word_list(path: Optional[str] = None) -> WordList:
+    """
+    Open a compiled or plain-text word list.
+
+    Plain-text lists are compiled once into the cache directory, keyed on
+    the file's path, size and mtime, and mapped from there on later runs.
+    With caching disabled they are compiled into a temporary file instead.
+
+    Args:
+        path (str, optional): Word list (default: PASSPHRASE_SETTINGS,
+            relative to the package)
+
+    Returns:
+        WordList: Open word list; close it when done
+
+    Raises:
+        OSError: If the file cannot be read
+        WordListError: If the file is malformed or holds no words
+    """
+    if path is None:
+        path = PASSPHRASE_SETTINGS['wordlist']
+        if not os.path.isabs(path):
+            path = os.path.join(_PACKAGE_DIR, path)
+    if is_word_list(path):
+        return WordList(path)
+
+    stat = os.stat(path)
+    directory = cache_directory()
+    if directory is not None:
+        source = os.path.abspath(path)
+        name = f"wordlist-{zlib.crc32(source.encode('utf-8')):08x}-{stat.st_size}-{stat.st_mtime_ns}.ppw"
+        compiled = os.path.join(directory, name)
+        try:
+            return WordList(compiled)
+        except (OSError, WordListError):
+            pass
+        try:
+            build_word_list([path], compiled)
+            return WordList(compiled)
+        except OSError:
+            # Read-only cache directory; fall through to a temporary copy
+            pass
+
+    fd, temporary = tempfile.mkstemp(suffix='.ppw')
+    os.close(fd)
+    try:
+        build_word_list([path], temporary)
+        return WordList(temporary)
+    finally:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
@@ -0,0 +1,308 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .config import (PASSWORD_REQUIREMENTS, COMMON_WEAK_PATTERNS, COMMON_SUBSTITUTIONS,
+                     BLOCKLIST_SETTINGS, SEQUENCE_SETTINGS, POLICY_SETTINGS)
+from . import metrics
+from .shared_blocklist import open_blocklist
+from .rules import CompiledRules, FAILED_NAMES, results_from_mask
+from .sequences import SequenceDetector
+
+# Bundled data (policies/, wordlists/) lives next to the modules
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+POLICY_EXTENSIONS = ('.toml', '.json')
+
+# Settings a policy may override, with their defaults from config
+POLICY_DEFAULTS = dict(
+    PASSWORD_REQUIREMENTS,
+    version=1,
+    blocklist=[],                   # Extra patterns on top of COMMON_WEAK_PATTERNS
+    # Word list, or a shared blocklist (`main.py blocklist-publish --policy
+    # NAME`) that then holds all the policy's patterns
+    blocklist_file=BLOCKLIST_SETTINGS['blocklist_file'],
+    leet=True,                      # See through COMMON_SUBSTITUTIONS
+    sequence_min_length=SEQUENCE_SETTINGS['min_length'],
+    keyboard_min_length=SEQUENCE_SETTINGS['keyboard_min_length'],
+    keyboards=SEQUENCE_SETTINGS['keyboards'],
+)
+
+# Settings that may also be null, e.g. to drop a configured word list
+_OPTIONAL_SETTINGS = {'blocklist_file'}
+
+class PolicyError(ValueError):
+    """Raised when a policy cannot be found, parsed or compiled."""
+
+def _check_types(name: str, settings: Mapping) -> None:
+    """Reject settings whose value does not have the type of its default."""
+    for key, value in settings.items():
+        default = POLICY_DEFAULTS[key]
+        if value is None and key in _OPTIONAL_SETTINGS:
+            continue
+        if isinstance(default, bool):
+            valid, expected = isinstance(value, bool), "true or false"
+        elif isinstance(default, int):
+            valid = isinstance(value, int) and not isinstance(value, bool) and value >= 0
+            expected = "a non-negative integer"
+        elif isinstance(default, list):
+            valid = isinstance(value, list) and all(isinstance(item, str) for item in value)
+            expected = "a list of strings"
+        else:
+            valid, expected = isinstance(value, str), "a string"
+        if not valid:
+            raise PolicyError(f"Invalid policy {name!r}: {key} must be {expected}, got {value!r}")
+
+class Policy:
+    """
+    One password policy compiled into an immutable validator.
+
+    All settings are resolved when the policy is built: checks run through
+    the policy's own CompiledRules, blocklist and sequence tables, with no
+    per-call config lookups. Policies with identical settings share a
+    digest and can share one instance.
+    """
+
+    __slots__ = ('name', 'settings', 'digest', 'rules', 'blocklist', '_check')
+
+    def __init__(self, name: str, settings: Mapping):
+        """
+        Args:
+            name (str): Profile name, for display
+            settings (Mapping): Overrides of POLICY_DEFAULTS
+
+        Raises:
+            PolicyError: If a setting is unknown or invalid
+        """
+        unknown = set(settings) - set(POLICY_DEFAULTS)
+        if unknown:
+            raise PolicyError(f"Unknown policy settings in {name!r}: {', '.join(sorted(unknown))}")
+        _check_types(name, settings)
+        merged = dict(POLICY_DEFAULTS, **settings)
+
+        try:
+            blocklist = open_blocklist(merged['blocklist_file'],
+                                       list(COMMON_WEAK_PATTERNS) + list(merged['blocklist']),
+                                       BLOCKLIST_SETTINGS['reload_interval'],
+                                       COMMON_SUBSTITUTIONS if merged['leet'] else None)
+            sequences = _sequence_detector(merged['sequence_min_length'],
+                                           merged['keyboard_min_length'], tuple(merged['keyboards']))
+            rules = CompiledRules(merged, blocklist.contains_any, sequences)
+        except (KeyError, TypeError, ValueError, OSError) as e:
+            raise PolicyError(f"Invalid policy {name!r}: {e}") from e
+
+        set_slot = object.__setattr__
+        set_slot(self, 'name', name)
+        set_slot(self, 'settings', merged)
+        set_slot(self, 'digest', policy_digest(merged))
+        set_slot(self, 'rules', rules)
+        set_slot(self, 'blocklist', blocklist)
+        set_slot(self, '_check', rules.check)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Policy objects are immutable")
+
+    def __repr__(self) -> str:
+        return f"Policy({self.name!r}, version={self.settings['version']}, digest={self.digest[:12]})"
+
+    def check(self, password: str) -> int:
+        """Failure bitmask for a password; 0 means it is valid."""
+        if metrics.enabled:
+            return self.rules.check_instrumented(password)
+        return self._check(password)
+
+    def validate(self, password: str) -> Tuple[bool, Dict[str, bool]]:
+        """Same result shape as validator.validate_password."""
+        results = results_from_mask(self.check(password))
+        return all(results.values()), results
+
+    def validate_many(self, passwords: Iterable[str]) -> Iterator[Tuple[str, bool, Tuple[str, ...]]]:
+        """Same result shape as validator.validate_many."""
+        check = self.rules.check_instrumented if metrics.enabled else self._check
+        for password in passwords:
+            mask = check(password)
+            yield password, not mask, FAILED_NAMES[mask]
+
+@lru_cache(maxsize=64)
+def _sequence_detector(min_length: int, keyboard_min_length: int,
+                       keyboards: Tuple[str, ...]) -> SequenceDetector:
+    # Pair tables only depend on these three settings; share them across policies
+    return SequenceDetector(min_length, keyboard_min_length, keyboards)
+
+def policy_digest(settings: Mapping) -> str:
+    """SHA-256 of a policy's settings in canonical JSON form."""
+    canonical = json.dumps(settings, sort_keys=True, separators=(',', ':'), default=list)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def _toml_parser():
+    # Imported on first use; most calls never read a TOML profile
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise PolicyError("TOML policies need Python 3.11+ or the 'tomli' package") from None
+    return tomllib
+
+def parse_policy_file(path: str) -> Dict:
+    """
+    Read policy settings from a TOML or JSON file.
+
+    Raises:
+        PolicyError: If the file cannot be parsed
+    """
+    try:
+        if path.endswith('.toml'):
+            tomllib = _toml_parser()
+            with open(path, 'rb') as f:
+                settings = tomllib.load(f)
+        else:
+            with open(path, encoding='utf-8') as f:
+                settings = json.load(f)
+    except (ValueError, OSError) as e:
+        if isinstance(e, PolicyError):
+            raise
+        raise PolicyError(f"Cannot read policy {path}: {e}") from e
+    if not isinstance(settings, dict):
+        raise PolicyError(f"Policy {path} must contain a table of settings")
+    return settings
+
+class PolicyStore:
+    """
+    Named policy profiles from a directory of TOML/JSON files.
+
+    `get(name)` returns a compiled Policy. Each file is parsed once and
+    then only stat()ed, at most every `check_interval` seconds, to notice
+    edits. Compiled policies live in an LRU keyed by their settings digest,
+    so tenants with identical policies share one validator and memory stays
+    bounded however many profiles are served.
+    """
+
+    def __init__(self, directory: str, cache_size: int = 1024, check_interval: float = 1.0):
+        """
+        Args:
+            directory (str): Directory of NAME.toml / NAME.json files
+            cache_size (int): Compiled policies kept in memory
+            check_interval (float): Seconds between mtime checks per profile
+        """
+        self.directory = directory
+        self.cache_size = cache_size
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        # name -> [path, mtime_ns, next_check, settings, digest]
+        self._entries: Dict[str, list] = {}
+        self._compiled: 'OrderedDict[str, Policy]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _find(self, name: str) -> str:
+        if os.sep in name or (os.altsep and os.altsep in name):
+            raise PolicyError(f"Invalid policy name: {name!r}")
+        for extension in POLICY_EXTENSIONS:
+            path = os.path.join(self.directory, name + extension)
+            if os.path.exists(path):
+                return path
+        raise PolicyError(f"No policy named {name!r} in {self.directory}")
+
+    def _load(self, name: str, path: str) -> list:
+        """Parse and compile a profile file; raises before touching any state."""
+        mtime = os.stat(path).st_mtime_ns
+        settings = parse_policy_file(path)
+        digest = policy_digest(dict(POLICY_DEFAULTS, **settings))
+        if digest in self._compiled:
+            # Same settings as a policy already compiled (and so validated)
+            self.hits += 1
+            self._compiled.move_to_end(digest)
+        else:
+            self.misses += 1
+            self._remember(Policy(name, settings))
+        return [path, mtime, time.monotonic() + self.check_interval, settings, digest]
+
+    def _remember(self, policy: Policy) -> None:
+        self._compiled[policy.digest] = policy
+        self._compiled.move_to_end(policy.digest)
+        while len(self._compiled) > self.cache_size:
+            self._compiled.popitem(last=False)
+
+    def _entry(self, name: str) -> list:
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = self._entries[name] = self._load(name, self._find(name))
+            return entry
+
+        now = time.monotonic()
+        if now >= entry[2]:
+            entry[2] = now + self.check_interval
+            try:
+                changed = os.stat(entry[0]).st_mtime_ns != entry[1]
+            except OSError:
+                # Keep serving the last good version if the file is mid-rewrite
+                changed = False
+            if changed:
+                try:
+                    entry = self._entries[name] = self._load(name, entry[0])
+                except (PolicyError, OSError):
+                    pass
+        return entry
+
+    def get(self, name: str) -> Policy:
+        """
+        Compiled policy for a profile name.
+
+        Raises:
+            PolicyError: If the profile does not exist or is invalid
+        """
+        with self._lock:
+            hits, loads = self.hits, self.hits + self.misses
+            _, _, _, settings, digest = self._entry(name)
+            policy = self._compiled.get(digest)
+            if policy is None:
+                # Evicted from the LRU; recompile from the parsed settings
+                self.misses += 1
+                policy = Policy(name, settings)
+                self._remember(policy)
+            elif self.hits + self.misses == loads:
+                # Not just (re)loaded by _entry, which did its own accounting
+                self.hits += 1
+                self._compiled.move_to_end(digest)
+            if metrics.enabled:
+                metrics.LOOKUPS.inc('policy', 'hit' if self.hits > hits else 'miss')
+            return policy
+
+    def names(self) -> List[str]:
+        """Profile names available in the directory."""
+        return sorted(os.path.splitext(f)[0] for f in os.listdir(self.directory)
+                      if f.endswith(POLICY_EXTENSIONS))
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+_STORE: Optional[PolicyStore] = None
+
+def get_policy(name: str) -> Policy:
+    """
+    Compiled policy from the configured policy directory.
+
+    Args:
+        name (str): Profile name (file name without extension)
+
+    Returns:
+        Policy: Shared, immutable compiled validator
+
+    Raises:
+        PolicyError: If the profile does not exist or is invalid
+    """
+    global _STORE
+    if _STORE is None:
+        directory = POLICY_SETTINGS['directory']
+        if not os.path.isabs(directory):
+            directory = os.path.join(_PACKAGE_DIR, directory)
+        _STORE = PolicyStore(directory, POLICY_SETTINGS['cache_size'],
+                             POLICY_SETTINGS['check_interval'])
+    return _STORE.get(name)
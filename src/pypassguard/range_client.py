@@ -0,0 +1,153 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import metrics
+from .config import API_SETTINGS
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return the cached value, or None if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, value) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class RangeClient:
+    """
+    k-anonymity client for the HIBP range API or a local range server.
+
+    Only the first five hex digits of a password's SHA-1 ever leave the
+    host. Connections are pooled and kept alive, responses are cached with
+    an LRU + TTL, and batch lookups fetch each distinct prefix once.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, pool_size: int = 8,
+                 cache_size: int = 4096, ttl: float = 3600.0, timeout: float = 5.0):
+        """
+        Args:
+            base_url (str, optional): Range endpoint ending in '/range/'
+                (default: API_SETTINGS['hibp_api_url'])
+            pool_size (int): Keep-alive connections and concurrent fetches
+            cache_size (int): Range responses kept in the cache
+            ttl (float): Seconds before a cached range is refetched
+            timeout (float): Per-request timeout in seconds
+        """
+        self.base_url = base_url or API_SETTINGS['hibp_api_url']
+        if not self.base_url.endswith('/'):
+            self.base_url += '/'
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cache = TTLCache(cache_size, ttl)
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = API_SETTINGS['user_agent']
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def fetch_range(self, prefix: str) -> Dict[str, int]:
+        """
+        Fetch (or serve from cache) every suffix for a SHA-1 prefix.
+
+        Args:
+            prefix (str): 5 hex digits
+
+        Returns:
+            Dict[str, int]: Uppercase 35-digit suffix -> breach count
+
+        Raises:
+            requests.RequestException: If the range cannot be fetched
+        """
+        prefix = prefix.upper()
+        suffixes = self.cache.get(prefix)
+        if suffixes is not None:
+            if metrics.enabled:
+                metrics.LOOKUPS.inc('range', 'hit')
+            return suffixes
+
+        if metrics.enabled:
+            metrics.LOOKUPS.inc('range', 'miss')
+        with metrics.timer(metrics.LOOKUP_SECONDS, 'range'):
+            response = self.session.get(self.base_url + prefix, timeout=self.timeout)
+        response.raise_for_status()
+        suffixes = {}
+        for line in response.text.splitlines():
+            suffix, _, count = line.strip().partition(':')
+            if suffix:
+                suffixes[suffix.upper()] = int(count or 1)
+        self.cache.put(prefix, suffixes)
+        return suffixes
+
+    def lookup(self, password: str) -> int:
+        """
+        Args:
+            password (str): Password to check
+
+        Returns:
+            int: Breach count (0 if not found)
+        """
+        digest = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+        return self.fetch_range(digest[:5]).get(digest[5:], 0)
+
+    def lookup_many(self, passwords: Iterable[str]) -> List[int]:
+        """
+        Check a batch of passwords, fetching each distinct prefix once.
+
+        Uncached prefixes are fetched concurrently over the connection pool.
+
+        Args:
+            passwords (Iterable[str]): Passwords to check
+
+        Returns:
+            List[int]: Breach counts in input order
+        """
+        digests = [hashlib.sha1(p.encode('utf-8')).hexdigest().upper() for p in passwords]
+        prefixes = {digest[:5] for digest in digests}
+
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(prefixes) or 1)) as pool:
+            ranges = dict(zip(prefixes, pool.map(self.fetch_range, prefixes)))
+        return [ranges[digest[:5]].get(digest[5:], 0) for digest in digests]
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import re
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from .httpd import start_server
+
+_PREFIX = re.compile(r'^/range/([0-9A-Fa-f]{5})/?$')
+
+class RangeStore:
+    """
+    On-disk bucketed store laid out like the HIBP range API.
+
+    Each bucket is a file named after its 5-hex-digit SHA-1 prefix (with or
+    without a .txt extension) holding `SUFFIX:COUNT` lines, exactly as the
+    HIBP range dumps are distributed.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory (str): Directory holding the range files
+        """
+        if not os.path.isdir(directory):
+            raise NotADirectoryError(f"Range store not found: {directory}")
+        self.directory = directory
+
+    def _path(self, prefix: str) -> Optional[str]:
+        for name in (prefix, prefix + '.txt', prefix.lower(), prefix.lower() + '.txt'):
+            path = os.path.join(self.directory, name)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def read_bucket(self, prefix: str) -> bytes:
+        """
+        Return the response body for a prefix.
+
+        Args:
+            prefix (str): 5 hex digits, any case
+
+        Returns:
+            bytes: `SUFFIX:COUNT` lines separated by CRLF (empty if no bucket)
+        """
+        path = self._path(prefix.upper())
+        if path is None:
+            return b''
+        with open(path, 'rb') as handle:
+            return b'\r\n'.join(handle.read().upper().split())
+
+class RangeServer:
+    """
+    asyncio HTTP server answering `GET /range/<prefix>` from a RangeStore.
+
+    Bucket files are read off the event loop; recently served buckets stay
+    in a small in-memory LRU.
+    """
+
+    def __init__(self, store: RangeStore, cache_size: int = 1024):
+        """
+        Args:
+            store (RangeStore): Buckets to serve
+            cache_size (int): Buckets kept in memory (default: 1024)
+        """
+        self.store = store
+        self.cache_size = cache_size
+        self.requests_served = 0
+        self._cache: 'OrderedDict[str, bytes]' = OrderedDict()
+
+    async def handle(self, method: str, path: str, headers: Dict[str, str],
+                     body: bytes) -> Tuple[int, str, bytes]:
+        if method != 'GET':
+            return 405, 'text/plain', b'Only GET is supported\n'
+        match = _PREFIX.match(path)
+        if match is None:
+            return 404, 'text/plain', b'Expected /range/<5 hex digits>\n'
+
+        self.requests_served += 1
+        prefix = match.group(1).upper()
+        payload = self._cache.get(prefix)
+        if payload is None:
+            # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(None, self.store.read_bucket, prefix)
+            self._cache[prefix] = payload
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(prefix)
+        return 200, 'text/plain', payload
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> asyncio.AbstractServer:
+        """Start serving; port 0 picks a free port."""
+        return await start_server(self.handle, host, port)
+
+async def serve_forever(directory: str, host: str = '127.0.0.1', port: int = 8080) -> None:
+    """Serve a range store until cancelled."""
+    server = await RangeServer(RangeStore(directory)).start(host, port)
+    async with server:
+        await server.serve_forever()
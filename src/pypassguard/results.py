@@ -0,0 +1,177 @@
+import sys
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from .config import PASSWORD_REQUIREMENTS
+from .rules import CHECK_BITS, FAILED_NAMES, results_from_mask
+
+# Feedback per failed check, formatted with the requirements in force
+FEEDBACK_TEMPLATES = {
+    'length': "Password must be at least {min_length} characters long",
+    'uppercase': "Password must contain at least one uppercase letter",
+    'lowercase': "Password must contain at least one lowercase letter",
+    'digits': "Password must contain at least one digit",
+    'special': "Password must contain at least one special character ({special_chars})",
+    'common_patterns': "Password contains common weak patterns (like 'password', '123', etc.)",
+    'sequential': "Password contains sequential characters or keyboard walks (like 'abc', '321', 'qwer')",
+}
+
+# Check name -> failure bit
+_BITS = dict(CHECK_BITS)
+
+class ValidationResult:
+    """
+    Outcome of validating one password: the failure bitmask and its views.
+
+    Instances are immutable and shared: there is one per (mask, feedback
+    settings), with the failed check names and the interned feedback
+    messages computed once, so returning a result allocates nothing. Use
+    result_for_mask to get one.
+    """
+
+    __slots__ = ('mask', 'valid', 'failed', 'feedback')
+
+    def __init__(self, mask: int, feedback: Tuple[str, ...]):
+        set_slot = object.__setattr__
+        set_slot(self, 'mask', mask)
+        set_slot(self, 'valid', not mask)
+        set_slot(self, 'failed', FAILED_NAMES[mask])
+        set_slot(self, 'feedback', feedback)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ValidationResult objects are immutable")
+
+    def __repr__(self) -> str:
+        return f"ValidationResult(valid={self.valid}, failed={self.failed})"
+
+    def passed(self, check: str) -> bool:
+        """Whether the named check (see rules.CHECK_BITS) passed."""
+        return not self.mask & _BITS[check]
+
+    def as_dict(self) -> Dict[str, bool]:
+        """The dict returned by validate_password; a fresh copy."""
+        return results_from_mask(self.mask)
+
+# (mask, min_length, special_chars) -> shared ValidationResult
+_RESULTS: Dict[Tuple[int, int, str], ValidationResult] = {}
+
+def result_for_mask(mask: int, requirements: Optional[Mapping] = None) -> ValidationResult:
+    """
+    Shared result for a failure bitmask.
+
+    Args:
+        mask (int): Failure bitmask from CompiledRules.check
+        requirements (Mapping, optional): Settings the mask was checked
+            against, for the feedback text (default: PASSWORD_REQUIREMENTS)
+
+    Returns:
+        ValidationResult: Cached instance; built on first use
+    """
+    requirements = requirements or PASSWORD_REQUIREMENTS
+    key = (mask, requirements['min_length'], requirements['special_chars'])
+    result = _RESULTS.get(key)
+    if result is None:
+        feedback = tuple(sys.intern(FEEDBACK_TEMPLATES[name].format_map(requirements))
+                         for name in FAILED_NAMES[mask])
+        result = _RESULTS[key] = ValidationResult(mask, feedback)
+    return result
+
+def mask_from_results(validation_results: Mapping[str, bool]) -> int:
+    """Inverse of rules.results_from_mask."""
+    mask = 0
+    for name, bit in CHECK_BITS:
+        if not validation_results[name]:
+            mask |= bit
+    return mask
+
+class BatchResult:
+    """
+    Columnar results of a bulk run: one failure-mask byte per password.
+
+    Masks (7 bits) live in an array('B'), so a million results take a
+    megabyte and no per-password objects. Rows are materialized on access
+    as shared ValidationResult instances; aggregates are computed from a
+    histogram of the (at most 128) distinct masks.
+    """
+
+    __slots__ = ('masks', 'requirements')
+
+    def __init__(self, masks: Iterable[int] = (), requirements: Optional[Mapping] = None):
+        """
+        Args:
+            masks (Iterable[int]): Failure bitmasks, e.g. map(rules.check, passwords)
+            requirements (Mapping, optional): Settings the masks were checked
+                against, for feedback (default: PASSWORD_REQUIREMENTS)
+        """
+        self.masks = array('B', masks)
+        self.requirements = requirements
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def __getitem__(self, index: int) -> ValidationResult:
+        return result_for_mask(self.masks[index], self.requirements)
+
+    def __iter__(self) -> Iterator[ValidationResult]:
+        requirements = self.requirements
+        for mask in self.masks:
+            yield result_for_mask(mask, requirements)
+
+    def extend(self, masks: Iterable[int]) -> None:
+        """Append more failure bitmasks."""
+        self.masks.extend(masks)
+
+    def mask_counts(self) -> Dict[int, int]:
+        """Number of passwords per distinct failure bitmask."""
+        return dict(Counter(self.masks))
+
+    @property
+    def valid_count(self) -> int:
+        return self.masks.count(0)
+
+    def failure_counts(self) -> Dict[str, int]:
+        """Check name -> number of passwords that failed it."""
+        return count_failures(Counter(self.masks))
+
+    def summary(self) -> Dict:
+        """Totals, validity and per-check failure counts and rates."""
+        return summarize_masks(Counter(self.masks))
+
+    def as_dicts(self) -> Iterator[Dict[str, bool]]:
+        """validate_password-style dicts, one per password, built lazily."""
+        for mask in self.masks:
+            yield results_from_mask(mask)
+
+def count_failures(mask_counts: Mapping[int, int]) -> Dict[str, int]:
+    """Check name -> number of passwords that failed it, from a mask histogram."""
+    counts = dict.fromkeys((name for name, _ in CHECK_BITS), 0)
+    for mask, count in mask_counts.items():
+        for name in FAILED_NAMES[mask]:
+            counts[name] += count
+    return counts
+
+def summarize_masks(mask_counts: Mapping[int, int]) -> Dict:
+    """
+    BatchResult.summary for a histogram of failure masks.
+
+    Streaming callers that keep only the mask histogram (e.g. the audit
+    sketch) get the same totals and rates without keeping the masks.
+
+    Args:
+        mask_counts (Mapping[int, int]): Failure bitmask -> number of passwords
+
+    Returns:
+        Dict: Totals, validity and per-check failure counts and rates
+    """
+    total = sum(mask_counts.values())
+    failures = count_failures(mask_counts)
+    valid = mask_counts.get(0, 0)
+    return {
+        'total': total,
+        'valid': valid,
+        'invalid': total - valid,
+        'failures': failures,
+        'failure_rates': {name: count / total if total else 0.0
+                          for name, count in failures.items()},
+    }
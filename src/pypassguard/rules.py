@@ -0,0 +1,206 @@
+from time import perf_counter
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from . import metrics
+from .sequences import SequenceDetector
+
+# Failure bits, one per check in validator.VALIDATION_CHECKS order
+LENGTH = 1 << 0
+UPPERCASE = 1 << 1
+LOWERCASE = 1 << 2
+DIGITS = 1 << 3
+SPECIAL = 1 << 4
+COMMON_PATTERNS = 1 << 5
+SEQUENTIAL = 1 << 6
+
+CHECK_BITS = (
+    ('length', LENGTH),
+    ('uppercase', UPPERCASE),
+    ('lowercase', LOWERCASE),
+    ('digits', DIGITS),
+    ('special', SPECIAL),
+    ('common_patterns', COMMON_PATTERNS),
+    ('sequential', SEQUENTIAL),
+)
+ALL_CHECKS = (1 << len(CHECK_BITS)) - 1
+
+# Failure mask -> tuple of failed check names, precomputed for every mask
+FAILED_NAMES = tuple(
+    tuple(name for name, bit in CHECK_BITS if mask & bit)
+    for mask in range(ALL_CHECKS + 1)
+)
+
+# Upper bound on lazily classified non-ASCII characters kept in the table
+_MAX_TABLE_SIZE = 4096
+
+class CompiledRules:
+    """
+    Password requirements compiled into a single-pass checker.
+
+    Every character is classified once through a precomputed lookup table
+    that maps it to its class bits, so the class checks complete in one
+    walk over the password. The same walk looks up each adjacent pair in
+    the sequences.SequenceDetector pair table, so sequences and keyboard
+    walks are found from its result without a second pass.
+    """
+
+    __slots__ = ('min_length', 'required_classes', 'special_chars',
+                 '_table', '_weak_pattern_check', '_sequences')
+
+    def __init__(self, requirements: Mapping,
+                 weak_pattern_check: Optional[Callable[[str], bool]] = None,
+                 sequences: Optional[SequenceDetector] = None):
+        """
+        Args:
+            requirements (Mapping): Same shape as PASSWORD_REQUIREMENTS
+            weak_pattern_check (Callable, optional): Returns True when a
+                password contains a weak pattern; skipped when None
+            sequences (SequenceDetector, optional): Detector for the
+                sequential check (default: SequenceDetector())
+        """
+        self.min_length = requirements['min_length']
+        self.special_chars = frozenset(requirements['special_chars'])
+        self.required_classes = (
+            (UPPERCASE if requirements['require_uppercase'] else 0) |
+            (LOWERCASE if requirements['require_lowercase'] else 0) |
+            (DIGITS if requirements['require_digits'] else 0) |
+            (SPECIAL if requirements['require_special_chars'] else 0)
+        )
+        self._weak_pattern_check = weak_pattern_check
+        self._sequences = sequences or SequenceDetector()
+        self._table: Dict[str, int] = {}
+        for code in range(128):
+            self._classify(chr(code))
+        for char in self.special_chars:
+            self._classify(char)
+
+    def _classify(self, char: str) -> int:
+        """Compute and cache the class bits for a char."""
+        bits = 0
+        if char.isupper():
+            bits |= UPPERCASE
+        if char.islower():
+            bits |= LOWERCASE
+        if char.isdigit():
+            bits |= DIGITS
+        if char in self.special_chars:
+            bits |= SPECIAL
+
+        if len(self._table) < _MAX_TABLE_SIZE:
+            self._table[char] = bits
+        return bits
+
+    @property
+    def sequences(self) -> SequenceDetector:
+        """Detector behind the sequential check."""
+        return self._sequences
+
+    @property
+    def weak_pattern_check(self) -> Optional[Callable[[str], bool]]:
+        """Callable behind the common_patterns check, or None."""
+        return self._weak_pattern_check
+
+    def char_classes(self, char: str) -> int:
+        """Class bits (UPPERCASE, LOWERCASE, DIGITS, SPECIAL) of one character."""
+        bits = self._table.get(char)
+        return self._classify(char) if bits is None else bits
+
+    def classes(self, password: str) -> int:
+        """Class bits present anywhere in a password, OR'ed together."""
+        table = self._table
+        seen = 0
+        for char in password:
+            bits = table.get(char)
+            if bits is None:
+                bits = self._classify(char)
+            seen |= bits
+        return seen
+
+    def _walk(self, password: str) -> Tuple[int, bytes]:
+        """
+        Class and LENGTH failure bits plus the sequence pair bits, in one walk.
+
+        Each character is classified and paired with the one before it in
+        the same loop, so the sequential check needs no pass of its own.
+        Shared by check() and check_instrumented().
+        """
+        table = self._table
+        pairs = self._sequences.pairs
+        bits = []
+        pair = bits.append
+        seen = 0
+        previous = None
+        for char in password:
+            classes = table.get(char)
+            if classes is None:
+                classes = self._classify(char)
+            seen |= classes
+            if previous is not None:
+                pair(pairs.get(previous + char, 0))
+            previous = char
+        failures = self.required_classes & ~seen
+        if len(password) < self.min_length:
+            failures |= LENGTH
+        return failures, bytes(bits)
+
+    def check(self, password: str) -> int:
+        """
+        Validate a password and return its failure bitmask.
+
+        Args:
+            password (str): Password to validate
+
+        Returns:
+            int: OR of the failure bits; 0 means the password is valid
+        """
+        failures, pair_bits = self._walk(password)
+        if self._sequences.contains_pairs(pair_bits):
+            failures |= SEQUENTIAL
+        if self._weak_pattern_check is not None and self._weak_pattern_check(password):
+            failures |= COMMON_PATTERNS
+        return failures
+
+    def check_instrumented(self, password: str) -> int:
+        """
+        Same as check(), also recording outcomes and stage timings in metrics.
+
+        The class and length checks and the pair lookups share one walk over
+        the password, timed as the 'classes' stage; 'sequential' covers only
+        the run search over the pair bits. Kept separate from
+        check() so that the uninstrumented path pays nothing for metrics.
+        """
+        start = perf_counter()
+        failures, pair_bits = self._walk(password)
+        classified = perf_counter()
+        if self._sequences.contains_pairs(pair_bits):
+            failures |= SEQUENTIAL
+        sequenced = perf_counter()
+        if self._weak_pattern_check is not None:
+            found = self._weak_pattern_check(password)
+            if found:
+                failures |= COMMON_PATTERNS
+            end = perf_counter()
+            metrics.CHECK_SECONDS.observe(end - sequenced, 'common_patterns')
+            metrics.LOOKUPS.inc('blocklist', 'hit' if found else 'miss')
+        metrics.CHECK_SECONDS.observe(classified - start, 'classes')
+        metrics.CHECK_SECONDS.observe(sequenced - classified, 'sequential')
+
+        if failures:
+            metrics.VALIDATIONS.inc('rejected')
+            for name in FAILED_NAMES[failures]:
+                metrics.REJECTIONS.inc(name)
+        else:
+            metrics.VALIDATIONS.inc('valid')
+        return failures
+
+def results_from_mask(mask: int) -> Dict[str, bool]:
+    """
+    Expand a failure bitmask into the dict returned by validate_password.
+
+    Args:
+        mask (int): Failure bitmask from CompiledRules.check
+
+    Returns:
+        Dict[str, bool]: Check name -> passed
+    """
+    return {name: not mask & bit for name, bit in CHECK_BITS}
@@ -0,0 +1,301 @@
+import operator
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import keyboard
+from .cache import load_or_build
+from .keyboard import KEYBOARDS
+
+# Relation bits of an ordered character pair
+ASCENDING = 1 << 0
+DESCENDING = 1 << 1
+# Keyboard layouts take the following bits, in KEYBOARDS order; pair bits
+# are packed one byte per pair, which leaves room for six layouts
+_FIRST_LAYOUT_BIT = 2
+MAX_KEYBOARDS = 6
+
+# Passwords up to this long are checked against precomputed lane masks
+_MASK_LENGTH = 128
+
+# Runs in code point order (abc, 123, '()*', '+,-'), case-insensitive as
+# the original ord() check was; covers printable ASCII, not all of Unicode
+_ORDERED = [chr(code) for code in range(0x20, 0x7f) if not chr(code).isupper()]
+
+def _lanes(bits: int, count: int) -> int:
+    """`bits` repeated in each of `count` byte lanes."""
+    return int.from_bytes(bytes((bits,)) * count, 'little')
+
+def _case_variants(char: str) -> Tuple[str, ...]:
+    return (char, char.upper()) if char != char.upper() else (char,)
+
+def build_pair_table(keyboards: Iterable[str]) -> Tuple[Dict[str, int], Dict[int, str]]:
+    """
+    Precompute the relation bits of every related two-character string.
+
+    Args:
+        keyboards (Iterable[str]): Layout names from keyboard.KEYBOARDS
+
+    Returns:
+        Tuple[Dict[str, int], Dict[int, str]]: (pair -> relation bits,
+        bit -> kind name)
+    """
+    names = {ASCENDING: 'ascending', DESCENDING: 'descending'}
+    pairs: Dict[str, int] = {}
+
+    def relate(a: str, b: str, bit: int) -> None:
+        for x in _case_variants(a):
+            for y in _case_variants(b):
+                pairs[x + y] = pairs.get(x + y, 0) | bit
+
+    for a, b in zip(_ORDERED, _ORDERED[1:]):
+        # Dropping the capitals leaves '@' next to '[' but not adjacent
+        if ord(a) + 1 == ord(b):
+            relate(a, b, ASCENDING)
+            relate(b, a, DESCENDING)
+
+    for offset, name in enumerate(keyboards):
+        bit = 1 << (_FIRST_LAYOUT_BIT + offset)
+        names[bit] = name
+        for a, neighbours in KEYBOARDS[name].graph.items():
+            for b in neighbours:
+                pairs[a + b] = pairs.get(a + b, 0) | bit
+    return pairs, names
+
+class SequenceDetector:
+    """
+    Finds alphabetical, numerical and keyboard-walk runs in one pass.
+
+    Every related character pair (ab, BA, qw, 1q on each layout, ...) is
+    precomputed into a table of relation bits. A password is reduced to
+    the bits of its adjacent pairs, packed one byte per pair into a single
+    integer. A run of N characters is N - 1 consecutive pairs sharing a
+    bit, so every run in the password is found at once by AND-ing that
+    integer with copies of itself shifted by whole bytes.
+    """
+
+    __slots__ = ('min_length', 'keyboard_min_length', '_pairs', '_names', '_thresholds',
+                 '_run_pairs')
+
+    def __init__(self, min_length: int = 3, keyboard_min_length: Optional[int] = None,
+                 keyboards: Iterable[str] = ('qwerty', 'azerty', 'dvorak')):
+        """
+        Args:
+            min_length (int): Shortest ascending/descending run reported (default: 3)
+            keyboard_min_length (int, optional): Shortest keyboard walk reported
+                (default: min_length)
+            keyboards (Iterable[str]): Layouts to detect walks on
+        """
+        if min_length < 2 or (keyboard_min_length is not None and keyboard_min_length < 2):
+            raise ValueError("Minimum run length must be at least 2")
+        keyboards = tuple(keyboards)
+        if len(keyboards) > MAX_KEYBOARDS:
+            raise ValueError(f"At most {MAX_KEYBOARDS} keyboard layouts are supported")
+        self.min_length = min_length
+        self.keyboard_min_length = keyboard_min_length or min_length
+        # Building the tables means building every layout's adjacency graph;
+        # later runs load them precompiled from the cache instead
+        self._pairs, self._names = load_or_build(
+            'pairs', lambda: build_pair_table(keyboards), keyboards, (keyboard.__file__, __file__))
+
+        order = ASCENDING | DESCENDING
+        layouts = sum(self._names) & ~order
+        if self.keyboard_min_length == min_length:
+            thresholds = [(min_length, order | layouts)]
+        else:
+            thresholds = sorted([(min_length, order), (self.keyboard_min_length, layouts)])
+        # (run length, kinds, kinds repeated in every byte lane)
+        self._thresholds = tuple((length, kinds, _lanes(kinds, _MASK_LENGTH))
+                                 for length, kinds in thresholds if kinds)
+        # (pairs in a reportable run, kinds), shortest first, for trackers
+        self._run_pairs = tuple((length - 1, kinds) for length, kinds, _ in self._thresholds)
+
+    def _pair_bits(self, password: str) -> bytes:
+        return bytes(map(self._pairs.get, map(operator.add, password, password[1:]), repeat(0)))
+
+    def contains_any(self, password: str) -> bool:
+        """
+        Check whether the password contains any run.
+
+        Args:
+            password (str): Password to check
+
+        Returns:
+            bool: True if a sequence or keyboard walk is present
+        """
+        return self.contains_pairs(self._pair_bits(password))
+
+    @property
+    def pairs(self) -> Dict[str, int]:
+        """Two-character string -> relation bits, for callers building pair bits themselves."""
+        return self._pairs
+
+    def contains_pairs(self, pair_bits: bytes) -> bool:
+        """
+        contains_any for a password whose pair bits are already built.
+
+        Lets a caller that already walks the password (rules.CompiledRules)
+        look up each pair in `pairs` during that walk instead of paying for
+        a second one.
+
+        Args:
+            pair_bits (bytes): Relation bits of each adjacent pair, in order
+
+        Returns:
+            bool: True if a sequence or keyboard walk is present
+        """
+        packed = int.from_bytes(pair_bits, 'little')
+        if not packed:
+            return False
+        # Pairs are one fewer than the password's characters
+        size = len(pair_bits) + 1
+        shared = packed
+        span = 2
+        for length, kinds, lanes in self._thresholds:
+            if length > size:
+                break
+            # After this loop byte i of `shared` holds the bits common to
+            # the `length - 1` pairs starting at i
+            while span < length:
+                shared &= packed >> (8 * (span - 1))
+                span += 1
+            if size > _MASK_LENGTH:
+                lanes = _lanes(kinds, size)
+            if shared & lanes:
+                return True
+        return False
+
+    def tracker(self, password: str = '') -> 'SequenceTracker':
+        """Incremental contains_any for a password being edited (see SequenceTracker)."""
+        return SequenceTracker(self, password)
+
+    def find_all(self, password: str) -> List[Tuple[int, int, str]]:
+        """
+        Find every maximal run.
+
+        Args:
+            password (str): Password to search
+
+        Returns:
+            List[Tuple[int, int, str]]: (start, end, kind) sorted by position,
+            where kind is 'ascending', 'descending' or a layout name
+        """
+        matches = []
+        starts: Dict[int, int] = {}
+        active = 0
+        # A trailing 0 closes every run still open at the end
+        for index, bits in enumerate(self._pair_bits(password) + b'\0'):
+            for bit in self._names:
+                if bits & bit:
+                    if not active & bit:
+                        starts[bit] = index
+                elif active & bit:
+                    start = starts[bit]
+                    minimum = self.min_length if bit <= DESCENDING else self.keyboard_min_length
+                    if index + 1 - start >= minimum:
+                        matches.append((start, index + 1, self._names[bit]))
+            active = bits
+        matches.sort()
+        return matches
+
+class SequenceTracker:
+    """
+    Keeps SequenceDetector.contains_any up to date across edits.
+
+    Holds the relation bits of every adjacent pair and the number of
+    windows of pairs that make a reportable run. An edit only changes the
+    pairs touching the edited characters, so only windows within one run
+    length of the edit are recounted, whatever the password's length.
+    """
+
+    __slots__ = ('_pairs', '_thresholds', '_reach', '_bits', 'runs')
+
+    def __init__(self, detector: SequenceDetector, password: Sequence[str] = ''):
+        """
+        Args:
+            detector (SequenceDetector): Tables and run lengths to use
+            password (Sequence[str]): Initial text
+        """
+        self._pairs = detector._pairs
+        self._thresholds = detector._run_pairs
+        self._reach = self._thresholds[-1][0] if self._thresholds else 1
+        self._bits: List[int] = []
+        # (start, threshold) windows holding a reportable run
+        self.runs = 0
+        if password:
+            self.splice(password, 0, 0, len(password))
+
+    @property
+    def found(self) -> bool:
+        """Same as contains_any on the current text."""
+        return self.runs > 0
+
+    def _count(self, low: int, high: int) -> int:
+        """Reportable (start, run length) windows overlapping pair positions [low, high)."""
+        bits = self._bits
+        size = len(bits)
+        count = 0
+        for needed, kinds in self._thresholds:
+            first = low - needed + 1
+            last = size - needed + 1
+            if last > high:
+                last = high
+            for index in range(first if first > 0 else 0, last):
+                shared = kinds
+                for value in bits[index:index + needed]:
+                    shared &= value
+                if shared:
+                    count += 1
+        return count
+
+    def _count_tail(self) -> int:
+        """Reportable windows ending in the last pair."""
+        bits = self._bits
+        size = len(bits)
+        count = 0
+        for needed, kinds in self._thresholds:
+            if needed > size:
+                break
+            shared = kinds
+            for value in bits[size - needed:]:
+                shared &= value
+            if shared:
+                count += 1
+        return count
+
+    def splice(self, text: Sequence[str], start: int, removed: int, inserted: int) -> None:
+        """
+        Account for an edit that has already been applied to `text`.
+
+        Args:
+            text (Sequence[str]): The text after the edit
+            start (int): Index of the edit
+            removed (int): Characters removed at `start`
+            inserted (int): Characters inserted at `start`
+        """
+        new_size = len(text)
+        if start + inserted == new_size and inserted + removed == 1:
+            # Typing or deleting one character at the end: only the runs
+            # ending in the last pair change
+            if inserted:
+                if new_size > 1:
+                    self._bits.append(self._pairs.get(text[-2] + text[-1], 0))
+                    self.runs += self._count_tail()
+            elif self._bits:
+                self.runs -= self._count_tail()
+                self._bits.pop()
+            return
+        old_pairs = max(new_size - inserted + removed - 1, 0)
+        new_pairs = max(new_size - 1, 0)
+        # Pair i joins characters i and i + 1; pairs touching the edited
+        # characters are replaced, and runs overlapping them recounted.
+        # Typing or deleting at the end leaves no run to recount on one side
+        low = max(start - 1, 0)
+        old_high = max(min(start + removed, old_pairs), low)
+        new_high = max(min(start + inserted, new_pairs), low)
+        before = self._count(low, old_high) if low < old_pairs else 0
+        get = self._pairs.get
+        self._bits[low:old_high] = [get(text[i] + text[i + 1], 0) for i in range(low, new_high)]
+        if low < new_pairs:
+            self.runs += self._count(low, new_high) - before
+        else:
+            self.runs -= before
@@ -0,0 +1,184 @@
+from typing import Dict, List, Optional, Tuple
+
+from . import validator
+from .results import ValidationResult, result_for_mask
+from .rules import (COMMON_PATTERNS, DIGITS, LENGTH, LOWERCASE, SEQUENTIAL, SPECIAL, UPPERCASE,
+                    results_from_mask)
+
+_CLASSES = (UPPERCASE, LOWERCASE, DIGITS, SPECIAL)
+
+# Class bits -> the single class bits set in it, for every combination
+_SPLIT = tuple(tuple(bit for bit in _CLASSES if bits & bit) for bits in range(SPECIAL << 1))
+
+class ValidationSession:
+    """
+    Validation of a password as it is typed, updated edit by edit.
+
+    Instead of re-running the whole rule engine on every keystroke, a
+    session keeps per-class character counts, the sequence detector's pair
+    bits and run count (sequences.SequenceTracker) and the blocklist's
+    window matches (blocklist.BlocklistTracker). Each edit updates them in
+    time proportional to the edit and the longest run or pattern, not the
+    password, and the results, masks and feedback are the same as a
+    from-scratch validate_password call on the current text.
+
+    If the rules change (reload_requirements, load_blocklist, an edited
+    blocklist file or policy profile) the session rebuilds its state from
+    the current text on the next result.
+
+    Example:
+        >>> session = ValidationSession()
+        >>> for char in 'Passw0rd!x':
+        ...     session.append(char)
+        >>> session.result()
+        ValidationResult(valid=False, failed=('common_patterns',))
+        >>> session.backspace(10); session.update('Tr0ub4dor&3')
+        >>> session.result().valid
+        True
+    """
+
+    def __init__(self, password: str = '', policy: Optional[str] = None):
+        """
+        Args:
+            password (str): Initial text (default: empty)
+            policy (str, optional): Named policy profile (default: PASSWORD_REQUIREMENTS)
+        """
+        self.policy = policy
+        self._chars: List[str] = list(password)
+        self._bind()
+
+    def _bind(self) -> None:
+        """Resolve the rules in force and build the trackers from the current text."""
+        policy = self.policy
+        self._token = validator._ruleset_token(policy)
+        if policy is None:
+            rules, blocklist = validator._RULES, validator._BLOCKLIST
+        else:
+            from .policy import get_policy
+            compiled = get_policy(policy)
+            rules, blocklist = compiled.rules, compiled.blocklist
+        self._rules = rules
+        self._requirements = validator._requirements(policy)
+        self._counts = dict.fromkeys(_CLASSES, 0)
+        for char in self._chars:
+            for bit in _SPLIT[rules.char_classes(char)]:
+                self._counts[bit] += 1
+        self._sequences = rules.sequences.tracker(self._chars)
+        self._matches = blocklist.tracker(self._chars) if rules.weak_pattern_check else None
+
+    def __len__(self) -> int:
+        return len(self._chars)
+
+    def __repr__(self) -> str:
+        return f"ValidationSession(length={len(self._chars)}, policy={self.policy!r})"
+
+    @property
+    def password(self) -> str:
+        """The current text."""
+        return ''.join(self._chars)
+
+    def replace(self, start: int, end: int, text: str = '') -> None:
+        """
+        Replace characters [start, end) with `text`; the primitive edit.
+
+        Args:
+            start (int): First index replaced
+            end (int): Index after the last one replaced
+            text (str): Replacement (default: delete)
+
+        Raises:
+            IndexError: If the range is outside the current text
+        """
+        chars = self._chars
+        if not 0 <= start <= end <= len(chars):
+            raise IndexError("edit range outside the password")
+        counts, classes = self._counts, self._rules.char_classes
+        for char in chars[start:end]:
+            for bit in _SPLIT[classes(char)]:
+                counts[bit] -= 1
+        for char in text:
+            for bit in _SPLIT[classes(char)]:
+                counts[bit] += 1
+        chars[start:end] = text
+        self._sequences.splice(chars, start, end - start, len(text))
+        if self._matches is not None:
+            self._matches.splice(chars, start, end - start, len(text))
+
+    def append(self, text: str) -> None:
+        """Type `text` at the end."""
+        size = len(self._chars)
+        self.replace(size, size, text)
+
+    def insert(self, index: int, text: str) -> None:
+        """Type `text` at `index`."""
+        self.replace(index, index, text)
+
+    def delete(self, start: int, end: Optional[int] = None) -> None:
+        """Delete characters [start, end), or just the one at `start`."""
+        self.replace(start, start + 1 if end is None else end)
+
+    def backspace(self, count: int = 1) -> None:
+        """Delete up to `count` characters from the end."""
+        size = len(self._chars)
+        self.replace(max(size - count, 0), size)
+
+    def update(self, password: str) -> None:
+        """
+        Set the whole text, applying only what differs from the current one.
+
+        For callers that only see the field's value: the common prefix and
+        suffix are skipped, so one typed or deleted character is one small
+        edit.
+        """
+        chars = self._chars
+        size, new_size = len(chars), len(password)
+        start = 0
+        limit = min(size, new_size)
+        while start < limit and chars[start] == password[start]:
+            start += 1
+        end, new_end = size, new_size
+        while end > start and new_end > start and chars[end - 1] == password[new_end - 1]:
+            end -= 1
+            new_end -= 1
+        if start != end or start != new_end:
+            self.replace(start, end, password[start:new_end])
+
+    def clear(self) -> None:
+        """Delete everything."""
+        self.replace(0, len(self._chars))
+
+    def mask(self) -> int:
+        """
+        Failure bitmask of the current text, as CompiledRules.check.
+
+        Returns:
+            int: OR of the rules.* failure bits; 0 means the password is valid
+        """
+        if validator._ruleset_token(self.policy) != self._token:
+            self._bind()
+        rules, counts = self._rules, self._counts
+        seen = 0
+        for bit in _CLASSES:
+            if counts[bit]:
+                seen |= bit
+        failures = rules.required_classes & ~seen
+        if len(self._chars) < rules.min_length:
+            failures |= LENGTH
+        if self._sequences.found:
+            failures |= SEQUENTIAL
+        if self._matches is not None and self._matches.found(self._chars):
+            failures |= COMMON_PATTERNS
+        return failures
+
+    def result(self) -> ValidationResult:
+        """Shared result for the current text, as validator.validate_password_result."""
+        return result_for_mask(self.mask(), self._requirements)
+
+    def validate(self) -> Tuple[bool, Dict[str, bool]]:
+        """(is_valid, validation_details) for the current text, as validator.validate_password."""
+        mask = self.mask()
+        return not mask, results_from_mask(mask)
+
+    def feedback(self) -> List[str]:
+        """Feedback messages for the current text, as get_validation_feedback."""
+        return list(self.result().feedback)
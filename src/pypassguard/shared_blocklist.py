@@ -0,0 +1,442 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from operator import methodcaller
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Tuple
+from zlib import crc32
+
+from .blocklist import Blocklist, _is_literal, _normalize, _windows, canonical_patterns
+from .leet import canonical_table
+
+# File layout, all little-endian and pointer-free, so any process can map
+# it and use it in place:
+#   header       HEADER
+#   substitutions  `substitutions` (uint32 code point, uint32 replacement) pairs
+#   lengths      `lengths` uint32 distinct canonical pattern lengths, then
+#                `literal_lengths` for the patterns matched without
+#                de-leeting (see blocklist.canonical_patterns), ascending
+#   slots        2**slot_bits uint32 record offsets + 1 (0 = empty),
+#                an open-addressing hash table keyed by crc32 of the pattern
+#   filter       2**filter_bits bytes, 1 where some pattern's crc32 lands
+#   records      per pattern: RECORD (canonical and listed UTF-8 sizes,
+#                listed size 0 when the same), canonical bytes, listed bytes;
+#                literal patterns share the table, told apart by having no
+#                letters where canonical ones always have one
+MAGIC = b'PPGSHBL1'
+VERSION = 2
+HEADER = struct.Struct('<8sH2xIQQBB2xIIII')
+PAIR = struct.Struct('<II')
+RECORD = struct.Struct('<HH')
+
+# Filter bytes and hash slots per pattern; a window that matches nothing
+# passes the filter with probability about 1 / FILTER_RATIO
+FILTER_RATIO = 16
+SLOT_RATIO = 2
+
+# Patterns longer than this in UTF-8 cannot be stored (and never matter)
+MAX_PATTERN_BYTES = 0xFFFF
+
+# Text sizes whose window slices are kept per mapped file
+_MAX_CACHED_SIZES = 256
+
+_encode = methodcaller('encode', 'utf-8', 'surrogatepass')
+
+class SharedBlocklistError(ValueError):
+    """Raised when a shared blocklist file is malformed."""
+
+def is_shared_blocklist(path: str) -> bool:
+    """Whether `path` is a published shared blocklist (as opposed to a word list)."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def _bits_for(count: int, ratio: int, minimum: int = 10) -> int:
+    return max(minimum, (count * ratio - 1).bit_length())
+
+def publish_blocklist(output: str, patterns: Iterable[str] = (), source: Optional[str] = None,
+                      substitutions: Optional[Dict[str, List[str]]] = None) -> int:
+    """
+    Write patterns in the shared, memory-mappable layout as a new generation.
+
+    Patterns are normalized and canonicalized exactly as Blocklist does.
+    The file is written under a temporary name and renamed over `output`,
+    so processes attached to the previous generation keep their mapping
+    while every later attach or refresh sees the new one complete. Put it
+    on a RAM-backed filesystem (e.g. /dev/shm) to keep it out of the page
+    cache's eviction path.
+
+    Args:
+        output (str): Path of the shared blocklist
+        patterns (Iterable[str]): Patterns to include, e.g. COMMON_WEAK_PATTERNS
+        source (str, optional): Word list file to add, one pattern per line
+        substitutions (Dict[str, List[str]], optional): Letter -> leetspeak
+            substitutes to see through, e.g. COMMON_SUBSTITUTIONS
+
+    Returns:
+        int: Generation number of the published file (one more than the
+        one it replaces)
+
+    Raises:
+        OSError: If the source cannot be read or the output written
+        SharedBlocklistError: If the source is itself a shared blocklist
+    """
+    table = canonical_table(substitutions) if substitutions else None
+    normalized = set(_normalize(patterns))
+    if source is not None:
+        if is_shared_blocklist(source):
+            raise SharedBlocklistError(f"{source}: already a shared blocklist; "
+                                       f"publish from the word list instead")
+        with open(source, encoding='utf-8', errors='replace') as handle:
+            normalized.update(_normalize(handle))
+    canonical, originals, literal = canonical_patterns(frozenset(normalized), table)
+
+    records = bytearray()
+    entries = []
+    literal_count = 0
+    for pattern in sorted(canonical | literal):
+        key = _encode(pattern)
+        listed = _encode(originals[pattern]) if pattern in originals else b''
+        if len(key) > MAX_PATTERN_BYTES or len(listed) > MAX_PATTERN_BYTES:
+            continue
+        entries.append((crc32(key), len(records)))
+        records += RECORD.pack(len(key), len(listed))
+        records += key
+        records += listed
+        literal_count += pattern in literal
+    count = len(entries)
+    lengths = sorted({len(pattern) for pattern in canonical})
+    literal_lengths = sorted({len(pattern) for pattern in literal})
+
+    slot_bits = _bits_for(count, SLOT_RATIO)
+    filter_bits = _bits_for(count, FILTER_RATIO)
+    slots = array('I', bytes(4 << slot_bits))
+    flags = bytearray(1 << filter_bits)
+    slot_mask, filter_mask = (1 << slot_bits) - 1, (1 << filter_bits) - 1
+    for hashed, offset in entries:
+        flags[hashed & filter_mask] = 1
+        index = hashed & slot_mask
+        while slots[index]:
+            index = (index + 1) & slot_mask
+        slots[index] = offset + 1
+    if sys.byteorder != 'little':
+        slots.byteswap()
+
+    try:
+        with SharedBlocklistFile(output) as previous:
+            generation = previous.generation + 1
+    except (OSError, SharedBlocklistError):
+        generation = 1
+
+    pairs = sorted((table or {}).items())
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, VERSION, len(pairs), generation, count,
+                                  slot_bits, filter_bits, len(lengths), len(originals),
+                                  len(literal_lengths), literal_count))
+            for code, replacement in pairs:
+                out.write(PAIR.pack(code, ord(replacement)))
+            out.write(struct.pack(f'<{len(lengths) + len(literal_lengths)}I',
+                                  *lengths, *literal_lengths))
+            out.write(slots.tobytes())
+            out.write(flags)
+            out.write(records)
+        os.replace(temporary, output)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+    return generation
+
+class SharedBlocklistFile:
+    """
+    One generation of a published blocklist, mapped read-only.
+
+    Nothing is copied into the process heap: a lookup hashes each window
+    with crc32, checks the filter bytes for all windows at C speed, and
+    probes the hash table and compares bytes in the mapping only for
+    windows that pass the filter. It also stands in for the pattern
+    buckets (`in`) and the originals mapping (get) of a Blocklist state,
+    so find_all and BlocklistTracker work on it unchanged.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): File written by publish_blocklist
+
+        Raises:
+            SharedBlocklistError: If the file is not a valid shared blocklist
+        """
+        self.path = path
+        with open(path, 'rb') as handle:
+            header = handle.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise SharedBlocklistError(f"{path}: file too short for a shared blocklist header")
+            (magic, version, pair_count, self.generation, self.count, slot_bits,
+             filter_bits, length_count, self.original_count, literal_length_count,
+             self.literal_count) = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise SharedBlocklistError(f"{path}: not a PyPassGuard shared blocklist (v{VERSION})")
+            stat = os.fstat(handle.fileno())
+            self.identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            self._slots_start = (HEADER.size + pair_count * PAIR.size +
+                                 (length_count + literal_length_count) * 4)
+            self._filter_start = self._slots_start + (4 << slot_bits)
+            self._records_start = self._filter_start + (1 << filter_bits)
+            if stat.st_size < self._records_start:
+                raise SharedBlocklistError(f"{path}: truncated shared blocklist")
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        mm = self._mm
+        self.substitutions = {code: chr(replacement) for code, replacement
+                              in PAIR.iter_unpack(mm[HEADER.size:HEADER.size + pair_count * PAIR.size])}
+        lengths = struct.unpack_from(f'<{length_count + literal_length_count}I', mm,
+                                     HEADER.size + pair_count * PAIR.size)
+        self.lengths = lengths[:length_count]
+        self.literal_lengths = lengths[length_count:]
+        self._slot_mask = (1 << slot_bits) - 1
+        self._filter_mask = (1 << filter_bits) - 1
+        view = memoryview(mm)
+        if sys.byteorder == 'little':
+            self._slots = view[self._slots_start:self._filter_start].cast('I')
+        else:
+            self._slots = array('I', mm[self._slots_start:self._filter_start])
+            self._slots.byteswap()
+        self._filter = view[self._filter_start:self._records_start]
+        # (text size, literal) -> window slices, see _slices
+        self._windows: Dict[Tuple[int, bool], Tuple[slice, ...]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        """Unmap the file; only once no Blocklist state refers to it."""
+        if self._mm is not None:
+            if isinstance(self._slots, memoryview):
+                self._slots.release()
+            self._filter.release()
+            self._mm.close()
+            self._mm = None
+
+    def _record(self, key: bytes, hashed: int) -> Optional[int]:
+        """Offset of the record for canonical UTF-8 `key`, or None."""
+        mm, slots, mask = self._mm, self._slots, self._slot_mask
+        base = self._records_start
+        size = len(key)
+        index = hashed & mask
+        while True:
+            offset = slots[index]
+            if not offset:
+                return None
+            start = base + offset - 1
+            if RECORD.unpack_from(mm, start)[0] == size and \
+                    mm[start + RECORD.size:start + RECORD.size + size] == key:
+                return start
+            index = (index + 1) & mask
+
+    def has(self, pattern: str) -> bool:
+        """Whether `pattern` is stored, canonical or literal."""
+        key = _encode(pattern)
+        hashed = crc32(key)
+        return bool(self._filter[hashed & self._filter_mask]) and self._record(key, hashed) is not None
+
+    def __contains__(self, pattern: str) -> bool:
+        # The canonical patterns only, like a Blocklist bucket
+        return not _is_literal(pattern) and self.has(pattern)
+
+    def _slices(self, size: int, literal: bool) -> Tuple[slice, ...]:
+        """Every window of every (literal) pattern length in a text of `size` characters."""
+        slices = self._windows.get((size, literal))
+        if slices is None:
+            lengths = self.literal_lengths if literal else self.lengths
+            slices = tuple(window for length in lengths if length <= size
+                           for window in _windows(size, length))
+            if len(self._windows) < _MAX_CACHED_SIZES:
+                self._windows[size, literal] = slices
+        return slices
+
+    def contains_any(self, text: str, literal: bool = False) -> bool:
+        """
+        Whether any pattern occurs in canonical `text`, or any literal
+        pattern in lowercased `text` when `literal` is set.
+
+        All windows of all lengths are sliced, hashed and run through the
+        filter in one pass of C-level map calls; only windows that pass
+        the filter are looked up in the hash table.
+        """
+        slices = self._slices(len(text), literal)
+        if text.isascii():
+            keys = list(map(text.encode('ascii').__getitem__, slices))
+        else:
+            keys = list(map(_encode, map(text.__getitem__, slices)))
+        passed = list(map(self._filter.__getitem__,
+                          map(self._filter_mask.__and__, map(crc32, keys))))
+        if not any(passed):
+            return False
+        record = self._record
+        for key in compress(keys, passed):
+            if record(key, crc32(key)) is not None and \
+                    _is_literal(key.decode('utf-8', 'surrogatepass')) == literal:
+                return True
+        return False
+
+    def get(self, pattern: str, default: Optional[str] = None) -> Optional[str]:
+        """Pattern as listed for a canonical one (the Blocklist originals mapping)."""
+        key = _encode(pattern)
+        start = self._record(key, crc32(key))
+        if start is None:
+            return default
+        size, listed = RECORD.unpack_from(self._mm, start)
+        if not listed:
+            return default
+        start += RECORD.size + size
+        return self._mm[start:start + listed].decode('utf-8', 'surrogatepass')
+
+    def __bool__(self) -> bool:
+        # Truthiness of the originals mapping: whether any pattern was de-leeted
+        return self.original_count > 0
+
+class SharedBlocklist(Blocklist):
+    """
+    Blocklist served from a published, memory-mapped file.
+
+    Every process attaching the same file shares one copy of the
+    patterns in the page cache instead of building its own sets, so
+    worker startup is a header read and per-worker memory does not grow
+    with the list. A republished file (publish_blocklist) is picked up
+    like an edited word list: checked at most every `reload_interval`
+    seconds and swapped in whole, with generation() reporting the
+    published generation.
+
+    Lookups hash and probe the mapping instead of Python sets, so they
+    cost a few times more than a Blocklist's, in exchange for the memory.
+    """
+
+    def __init__(self, path: str, reload_interval: float = 5.0):
+        """
+        Args:
+            path (str): File written by publish_blocklist
+            reload_interval (float): Seconds between checks for a new generation
+
+        Raises:
+            OSError: If the file cannot be read
+            SharedBlocklistError: If it is not a valid shared blocklist
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+        self._next_check = 0.0
+        self._windowed = None
+        self._attach(SharedBlocklistFile(path))
+
+    def _attach(self, mapped: SharedBlocklistFile) -> None:
+        # The old file stays mapped for as long as a reader holds its state
+        self._file = mapped
+        self._table = mapped.substitutions or None
+        literal = _SharedLiterals(mapped) if mapped.literal_lengths else None
+        self._state = (mapped.lengths, dict.fromkeys(mapped.lengths, mapped), None,
+                       len(mapped), mapped, literal)
+        self._generation = mapped.generation
+
+    def contains_any(self, password: str) -> bool:
+        """
+        Check whether any pattern occurs in the password.
+
+        Args:
+            password (str): Password to check
+
+        Returns:
+            bool: True if at least one pattern matches
+        """
+        self._maybe_refresh()
+        _, _, _, _, mapped, literal = self._state
+        text = password.lower()
+        if literal is not None and mapped.contains_any(text, literal=True):
+            return True
+        if self._table is not None:
+            text = text.translate(self._table)
+        return mapped.contains_any(text)
+
+    def refresh(self) -> bool:
+        """
+        Attach the published file if it was replaced by a new generation.
+
+        Returns:
+            bool: True if a new generation was attached
+
+        Raises:
+            OSError: If the file cannot be read
+            SharedBlocklistError: If it was replaced by an invalid file; the
+                current generation stays attached
+        """
+        stat = os.stat(self.path)
+        if (stat.st_ino, stat.st_mtime_ns, stat.st_size) == self._file.identity:
+            return False
+        self._attach(SharedBlocklistFile(self.path))
+        return True
+
+class _LiteralPatterns:
+    """The literal patterns of a mapped file, as a pattern bucket (`in`)."""
+
+    __slots__ = ('mapped',)
+
+    def __init__(self, mapped: SharedBlocklistFile):
+        self.mapped = mapped
+
+    def __contains__(self, pattern: str) -> bool:
+        return _is_literal(pattern) and self.mapped.has(pattern)
+
+class _SharedLiterals(Blocklist):
+    """The literal patterns of a shared blocklist, as its state's `literal` Blocklist."""
+
+    def __init__(self, mapped: SharedBlocklistFile):
+        self.path = None
+        self.reload_interval = 0.0
+        self._next_check = 0.0
+        self._windowed = None
+        self._table = None
+        self._file = mapped
+        self._generation = mapped.generation
+        self._state = (mapped.literal_lengths,
+                       dict.fromkeys(mapped.literal_lengths, _LiteralPatterns(mapped)), None,
+                       mapped.literal_count, {}, None)
+
+    def contains_any(self, password: str) -> bool:
+        return self._file.contains_any(password.lower(), literal=True)
+
+def open_blocklist(path: Optional[str], patterns: Iterable[str] = (), reload_interval: float = 5.0,
+                   substitutions: Optional[Dict[str, List[str]]] = None) -> Blocklist:
+    """
+    Blocklist for a word list or a published shared blocklist.
+
+    A shared blocklist already holds every pattern and its substitution
+    table as published, so `patterns` and `substitutions` only apply to
+    plain word lists.
+
+    Args:
+        path (str, optional): Word list or shared blocklist file
+        patterns (Iterable[str]): Patterns always included with a word list
+        reload_interval (float): Seconds between file change checks
+        substitutions (Dict[str, List[str]], optional): Letter -> leetspeak
+            substitutes, for word lists
+
+    Returns:
+        Blocklist: A SharedBlocklist for published files, else a Blocklist
+    """
+    if path is not None and is_shared_blocklist(path):
+        return SharedBlocklist(path, reload_interval)
+    return Blocklist(patterns, path, reload_interval, substitutions)
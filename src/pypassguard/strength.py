@@ -0,0 +1,429 @@
+import itertools
+import math
+import os
+import re
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cache import load_or_build
+from .config import COMMON_SUBSTITUTIONS, STRENGTH_SETTINGS
+from .keyboard import KEYBOARDS
+from .leet import reverse_substitutions
+
+# Bundled data (policies/, wordlists/) lives next to the modules
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Guessing model, after zxcvbn (Wheeler, USENIX Security 2016)
+BRUTEFORCE_CARDINALITY = 10
+MIN_GUESSES_SINGLE_CHAR = 10
+MIN_GUESSES_MULTI_CHAR = 50
+MIN_GUESSES_BEFORE_GROWING_SEQUENCE = 10000
+# Guess counts are floats; longer passwords are capped here instead of overflowing
+MAX_GUESSES_LOG10 = 308.0
+MAX_SEQUENCE_DELTA = 5
+MIN_YEAR_SPACE = 20
+REFERENCE_YEAR = time.localtime().tm_year
+
+# Upper guess bounds (exclusive) of scores 0-3; anything above scores 4
+SCORE_THRESHOLDS = (1e3 + 5, 1e6 + 5, 1e8 + 5, 1e10 + 5)
+
+# Attack scenarios, in guesses per second
+ATTACK_RATES = {
+    'online_throttling_100_per_hour': 100 / 3600,
+    'online_no_throttling_10_per_second': 10,
+    'offline_slow_hashing_1e4_per_second': 1e4,
+    'offline_fast_hashing_1e10_per_second': 1e10,
+}
+
+# Leet variant tables tried per password; the product of ambiguous
+# substitutes ('1' -> i or l) is capped at this many
+MAX_LEET_VARIANTS = 8
+
+_TIME_UNITS = (('second', 1), ('minute', 60), ('hour', 3600), ('day', 86400),
+               ('month', 86400 * 31), ('year', 86400 * 365))
+
+_YEAR_RE = re.compile(r'19\d\d|20[0-3]\d')
+_GREEDY_REPEAT_RE = re.compile(r'(.+)\1+', re.S)
+_LAZY_REPEAT_RE = re.compile(r'(.+?)\1+', re.S)
+_LAZY_ANCHORED_REPEAT_RE = re.compile(r'^(.+?)\1+$', re.S)
+
+class FrequencyTable:
+    """
+    Ranked word list compiled for substring matching.
+
+    Words map to their frequency rank (1 = most common). A companion set
+    of every proper prefix lets the matcher stop extending a candidate as
+    soon as no word can start that way, so each position of a password is
+    only probed for a handful of lengths.
+    """
+
+    __slots__ = ('ranks', 'prefixes', 'max_length')
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Args:
+            words (Iterable[str]): Words, most frequent first; duplicates keep
+                their best rank
+        """
+        ranks = {}
+        for word in words:
+            word = word.strip().lower()
+            if word and not word.startswith('#') and word not in ranks:
+                ranks[word] = len(ranks) + 1
+        self.ranks = ranks
+        self.prefixes = frozenset(word[:end] for word in ranks for end in range(1, len(word)))
+        self.max_length = max(map(len, ranks), default=0)
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str]) -> 'FrequencyTable':
+        """Build one table from ranked word list files, in order."""
+        def words():
+            for path in paths:
+                with open(_resolve(path), encoding='utf-8') as f:
+                    yield from f
+        return cls(words())
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.ranks
+
+    def find_all(self, text: str) -> Iterator[Tuple[int, int, str, int]]:
+        """
+        Yield every listed word occurring in lowercase `text`.
+
+        Yields:
+            Tuple[int, int, str, int]: (start, end, word, rank)
+        """
+        ranks = self.ranks
+        prefixes = self.prefixes
+        length = len(text)
+        for start in range(length):
+            limit = min(length, start + self.max_length)
+            for end in range(start + 1, limit + 1):
+                token = text[start:end]
+                rank = ranks.get(token)
+                if rank is not None:
+                    yield start, end, token, rank
+                if token not in prefixes:
+                    break
+
+def _resolve(path: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(_PACKAGE_DIR, path)
+
+_TABLE: Optional[FrequencyTable] = None
+
+def get_frequency_table() -> FrequencyTable:
+    """
+    The ranked word table from STRENGTH_SETTINGS, loaded on first use.
+
+    The compiled table is cached on disk, keyed on the word list files,
+    so only the first run after a list changes pays for parsing it.
+    """
+    global _TABLE
+    if _TABLE is None:
+        paths = [_resolve(path) for path in STRENGTH_SETTINGS['wordlists']]
+        _TABLE = load_or_build('frequency', lambda: FrequencyTable.from_files(paths),
+                               tuple(paths), paths + [__file__])
+    return _TABLE
+
+def _build_leet_tables(substitutions: Dict[str, List[str]]) -> Tuple[frozenset, List[Dict[int, int]]]:
+    # One translation table per combination of ambiguous substitutes; the
+    # estimator needs the actual word to look up its rank, so it cannot use
+    # the merged classes of leet.canonical_table.
+    choices = reverse_substitutions(substitutions)
+    ambiguous = sorted(sub for sub, letters in choices.items() if len(letters) > 1)
+    fixed = {ord(sub): letters[0] for sub, letters in choices.items() if len(letters) == 1}
+
+    tables = []
+    for picks in itertools.product(*(choices[sub] for sub in ambiguous)):
+        table = dict(fixed)
+        table.update((ord(sub), letter) for sub, letter in zip(ambiguous, picks))
+        tables.append(table)
+        if len(tables) == MAX_LEET_VARIANTS:
+            break
+    return frozenset(choices), tables
+
+_LEET_CHARS, _LEET_TABLES = _build_leet_tables(COMMON_SUBSTITUTIONS)
+
+def _lower(password: str) -> str:
+    lowered = password.lower()
+    if len(lowered) != len(password):
+        # A few characters lowercase to two code points; keep indexes aligned
+        lowered = ''.join(c.lower() if len(c.lower()) == 1 else c for c in password)
+    return lowered
+
+def _variations(changed: int, unchanged: int) -> int:
+    # Ways to choose which of the characters were changed, as in zxcvbn
+    return sum(math.comb(changed + unchanged, k) for k in range(1, min(changed, unchanged) + 1))
+
+def _uppercase_variations(token: str) -> int:
+    upper = sum(1 for c in token if c.isupper())
+    if not upper:
+        return 1
+    lower = sum(1 for c in token if c.islower())
+    if not lower or (upper == 1 and (token[0].isupper() or token[-1].isupper())):
+        return 2
+    return _variations(upper, lower)
+
+def _leet_variations(token: str, word: str) -> int:
+    result = 1
+    for letter in set(word):
+        subbed = sum(1 for t, w in zip(token, word) if w == letter and t != w)
+        if subbed:
+            unsubbed = sum(1 for t, w in zip(token, word) if w == letter and t == w)
+            result *= 2 if not unsubbed else _variations(subbed, unsubbed)
+    return result
+
+def _dictionary_matches(password: str, lowered: str, table: FrequencyTable) -> List[tuple]:
+    matches = []
+    for start, end, word, rank in table.find_all(lowered):
+        token = password[start:end]
+        matches.append((start, end, rank * _uppercase_variations(token), 'dictionary',
+                        {'matched_word': word, 'rank': rank, 'l33t': False}))
+
+    if _LEET_CHARS.isdisjoint(lowered):
+        return matches
+    seen = set()
+    for leet_table in _LEET_TABLES:
+        translated = lowered.translate(leet_table)
+        for start, end, word, rank in table.find_all(translated):
+            original = lowered[start:end]
+            if original == word or (start, end, word) in seen:
+                continue
+            seen.add((start, end, word))
+            token = password[start:end]
+            guesses = rank * _uppercase_variations(token) * _leet_variations(original, word)
+            matches.append((start, end, guesses, 'dictionary',
+                            {'matched_word': word, 'rank': rank, 'l33t': True}))
+    return matches
+
+def _spatial_guesses(length: int, turns: int, shifted: int, layout) -> float:
+    guesses = 0.0
+    for i in range(2, length + 1):
+        for j in range(1, min(turns, i - 1) + 1):
+            guesses += math.comb(i - 1, j - 1) * layout.keys * layout.degree ** j
+    if shifted:
+        unshifted = length - shifted
+        guesses *= 2 if not unshifted else _variations(shifted, unshifted)
+    return guesses
+
+def _spatial_matches(password: str, layout) -> List[tuple]:
+    matches = []
+    graph = layout.graph
+    length = len(password)
+    start = 0
+    while start < length - 2:
+        end = start + 1
+        turns = 0
+        direction = None
+        while end < length and password[end] in graph.get(password[end - 1], ()):
+            step = layout.direction(password[end - 1], password[end])
+            if step != direction:
+                turns += 1
+                direction = step
+            end += 1
+        if end - start > 2:
+            shifted = sum(1 for c in password[start:end] if c in layout.shifted)
+            matches.append((start, end, _spatial_guesses(end - start, turns, shifted, layout),
+                            'spatial', {'graph': layout.name, 'turns': turns}))
+        start = end
+    return matches
+
+def _sequence_matches(password: str) -> List[tuple]:
+    matches = []
+    length = len(password)
+    start = 0
+    while start < length - 2:
+        delta = ord(password[start + 1]) - ord(password[start])
+        end = start + 2
+        while end < length and ord(password[end]) - ord(password[end - 1]) == delta:
+            end += 1
+        if end - start > 2 and 0 < abs(delta) <= MAX_SEQUENCE_DELTA:
+            first = password[start]
+            if first in 'aAzZ019':
+                base = 4
+            elif first.isdigit():
+                base = 10
+            else:
+                base = 26
+            if delta < 0:
+                base *= 2
+            matches.append((start, end, base * (end - start), 'sequence', {'ascending': delta > 0}))
+        start = end - 1
+    return matches
+
+def _repeat_matches(password: str) -> List[tuple]:
+    matches = []
+    position = 0
+    while True:
+        greedy = _GREEDY_REPEAT_RE.search(password, position)
+        if greedy is None:
+            return matches
+        lazy = _LAZY_REPEAT_RE.search(password, position)
+        if len(greedy.group(0)) > len(lazy.group(0)):
+            match = greedy
+            base = _LAZY_ANCHORED_REPEAT_RE.match(match.group(0)).group(1)
+        else:
+            match = lazy
+            base = match.group(1)
+        start, end = match.span()
+        count = (end - start) // len(base)
+        guesses = _minimum_guesses(base)[0] * count
+        matches.append((start, end, guesses, 'repeat', {'base_token': base, 'repeat_count': count}))
+        position = end
+
+def _year_matches(password: str) -> List[tuple]:
+    return [(m.start(), m.end(), max(abs(int(m.group()) - REFERENCE_YEAR), MIN_YEAR_SPACE),
+             'regex', {'regex_name': 'recent_year'})
+            for m in _YEAR_RE.finditer(password)]
+
+def find_matches(password: str) -> List[tuple]:
+    """
+    Run every matcher over a password.
+
+    Args:
+        password (str): Password to analyse
+
+    Returns:
+        List[tuple]: (start, end, guesses, pattern, details) per match
+    """
+    lowered = _lower(password)
+    layout = KEYBOARDS[STRENGTH_SETTINGS['keyboard']]
+    return (_dictionary_matches(password, lowered, get_frequency_table()) +
+            _spatial_matches(password, layout) +
+            _sequence_matches(password) +
+            _repeat_matches(password) +
+            _year_matches(password))
+
+def _minimum_guesses(password: str) -> Tuple[float, List[tuple]]:
+    # Linear-time approximation of zxcvbn's most-guessable-sequence search:
+    # per position keep the cheapest cover ending in a pattern match and the
+    # cheapest ending in a bruteforce run, in log10 guesses. The l! term for
+    # a sequence of l matches is charged incrementally as log10(l).
+    length = len(password)
+    if not length:
+        return 1.0, []
+    by_start = [[] for _ in range(length)]
+    for match in find_matches(password):
+        by_start[match[0]].append(match)
+
+    infinity = float('inf')
+    # (log10 guesses, matches so far, back pointer)
+    ended_match = [(infinity, 0, None)] * (length + 1)
+    ended_brute = [(infinity, 0, None)] * (length + 1)
+    ended_match[0] = (0.0, 0, None)
+    log_brute = math.log10(BRUTEFORCE_CARDINALITY)
+
+    for k in range(length):
+        match_cost, match_count, _ = ended_match[k]
+        brute_cost, brute_count, _ = ended_brute[k]
+        if match_cost <= brute_cost:
+            cost, count, via = match_cost, match_count, 'match'
+        else:
+            cost, count, via = brute_cost, brute_count, 'brute'
+
+        # Extend the running bruteforce segment, or start a new one
+        extend = (brute_cost + log_brute, brute_count, ('extend', k))
+        start = (match_cost + log_brute + math.log10(match_count + 1), match_count + 1, ('start', k))
+        ended_brute[k + 1] = min(extend, start, key=lambda state: state[0])
+
+        penalty = math.log10(count + 1)
+        for match in by_start[k]:
+            end, guesses = match[1], match[2]
+            minimum = MIN_GUESSES_SINGLE_CHAR if end - k == 1 else MIN_GUESSES_MULTI_CHAR
+            candidate = cost + math.log10(max(guesses, minimum)) + penalty
+            if candidate < ended_match[end][0]:
+                ended_match[end] = (candidate, count + 1, (via, match))
+
+    # Walk the back pointers to recover the chosen sequence
+    sequence = []
+    state = 'match' if ended_match[length][0] <= ended_brute[length][0] else 'brute'
+    cost, count = (ended_match if state == 'match' else ended_brute)[length][:2]
+    position = length
+    brute_end = None
+    while position > 0:
+        if state == 'match':
+            via, match = ended_match[position][2]
+            sequence.append(match)
+            position = match[0]
+            state = via
+        else:
+            kind, k = ended_brute[position][2]
+            if brute_end is None:
+                brute_end = position
+            if kind == 'start':
+                sequence.append((k, brute_end, _from_log10((brute_end - k) * log_brute),
+                                 'bruteforce', {}))
+                brute_end = None
+                state = 'match'
+            position = k
+    sequence.reverse()
+
+    if count > 1:
+        # log10(10**cost + MIN_GUESSES_BEFORE_GROWING_SEQUENCE**(count - 1))
+        growing = (count - 1) * math.log10(MIN_GUESSES_BEFORE_GROWING_SEQUENCE)
+        high, low = max(cost, growing), min(cost, growing)
+        cost = high + math.log10(1 + 10 ** (low - high))
+    return _from_log10(min(cost, length * log_brute)), sequence
+
+def _from_log10(value: float) -> float:
+    return 10 ** min(value, MAX_GUESSES_LOG10)
+
+def _score(guesses: float) -> int:
+    for score, threshold in enumerate(SCORE_THRESHOLDS):
+        if guesses < threshold:
+            return score
+    return len(SCORE_THRESHOLDS)
+
+def display_time(seconds: float) -> str:
+    """Human-readable duration, e.g. '3 hours' or 'centuries'."""
+    if seconds < 1:
+        return 'less than a second'
+    if seconds >= 100 * _TIME_UNITS[-1][1]:
+        return 'centuries'
+    for unit, size in reversed(_TIME_UNITS):
+        if seconds >= size:
+            value = round(seconds / size)
+            return f"{value} {unit}{'s' if value != 1 else ''}"
+
+def estimate_strength(password: str) -> Dict:
+    """
+    Estimate how many guesses an attacker needs for a password.
+
+    Dictionary (including leetspeak via COMMON_SUBSTITUTIONS), keyboard
+    walk, sequence, repeat and year patterns are matched, and the cheapest
+    way to cover the password with them (and bruteforce runs) gives the
+    guess count.
+
+    Args:
+        password (str): Password to score
+
+    Returns:
+        Dict: guesses, guesses_log10, score (0-4), crack_times_seconds,
+        crack_times_display and the matched sequence
+
+    Example:
+        >>> estimate_strength("p@ssw0rd")['score']
+        0
+    """
+    guesses, sequence = _minimum_guesses(password)
+    crack_times = {name: guesses / rate for name, rate in ATTACK_RATES.items()}
+    return {
+        'guesses': guesses,
+        'guesses_log10': math.log10(guesses),
+        'score': _score(guesses),
+        'crack_times_seconds': crack_times,
+        'crack_times_display': {name: display_time(s) for name, s in crack_times.items()},
+        'sequence': [dict(details, pattern=pattern, token=password[start:end],
+                          start=start, end=end, guesses=guesses)
+                     for start, end, guesses, pattern, details in sequence],
+    }
+
+if __name__ == "__main__":
+    for password in ["password", "p@ssw0rd", "qwertyuiop", "abcdef1990", "Tr0ub4dor&3",
+                     "correcthorsebatterystaple", "xK9#mP2$vL5@"]:
+        result = estimate_strength(password)
+        print(f"{password}: score {result['score']}, {result['guesses']:.3g} guesses, "
+              f"{result['crack_times_display']['offline_slow_hashing_1e4_per_second']} offline")
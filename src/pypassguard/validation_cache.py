@@ -0,0 +1,128 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from . import metrics
+
+# Rough per-entry footprint: 16-byte key, result tuple and OrderedDict slot
+ENTRY_BYTES = 200
+
+class ValidationCache:
+    """
+    Bounded LRU of validation results for frequently repeated passwords.
+
+    Entries are keyed by a 16-byte keyed BLAKE2b MAC of the policy name and
+    password under a random per-process secret, so no plaintext (or plain,
+    dictionary-attackable hash) is ever held. Every lookup carries a token
+    describing the rules in force; when the token for a policy changes
+    (requirements reloaded, profile edited, blocklist file reloaded) the
+    whole cache is dropped rather than serving stale verdicts.
+
+    All entries cost about the same (a fixed-size key and a tuple of
+    interned feedback strings), so the bound is a plain entry count.
+    """
+
+    def __init__(self, max_entries: int = 65536, secret: Optional[bytes] = None):
+        """
+        Args:
+            max_entries (int): Results kept before the least recently used
+                are evicted
+            secret (bytes, optional): MAC key, up to 64 bytes (default: 32
+                random bytes, so keys are useless outside this process)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._mac = hashlib.blake2b(key=secret or os.urandom(32), digest_size=16)
+        # policy name -> MAC state with the name already absorbed; copying
+        # it is cheaper than keying a fresh hash for every lookup. Callers
+        # resolve the policy (for its token) first, so only real names land here
+        self._policy_macs: Dict[Optional[str], 'hashlib.blake2b'] = {}
+        self._entries: 'OrderedDict[bytes, Tuple[bool, Tuple[str, ...]]]' = OrderedDict()
+        # policy name -> token of the rules the cached results were made with
+        self._tokens: Dict[Optional[str], Hashable] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, password: str, policy: Optional[str]) -> bytes:
+        mac = self._policy_macs.get(policy)
+        if mac is None:
+            mac = self._mac.copy()
+            mac.update(f"{policy or ''}\0".encode('utf-8'))
+            self._policy_macs[policy] = mac
+        mac = mac.copy()
+        mac.update(password.encode('utf-8', 'surrogatepass'))
+        return mac.digest()
+
+    def get_or_validate(self, password: str, policy: Optional[str], token: Hashable,
+                        validate: Callable[[str, Optional[str]], Tuple[bool, List[str]]]
+                        ) -> Tuple[bool, List[str]]:
+        """
+        Cached (is_valid, feedback) for a password, computing it on a miss.
+
+        Args:
+            password (str): Password to validate
+            policy (str, optional): Policy name, part of the key
+            token (Hashable): Identifies the rules in force for the policy
+            validate (Callable): Computes the result on a miss
+
+        Returns:
+            Tuple[bool, List[str]]: (is_valid, feedback_messages); the list
+            is a fresh copy the caller may modify
+        """
+        key = self._key(password, policy)
+        with self._lock:
+            if self._tokens.get(policy, token) != token:
+                self._entries.clear()
+                self._tokens.clear()
+                self.invalidations += 1
+            self._tokens[policy] = token
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if metrics.enabled:
+            metrics.LOOKUPS.inc('validation_cache', 'miss' if entry is None else 'hit')
+        if entry is not None:
+            return entry[0], list(entry[1])
+
+        is_valid, feedback = validate(password, policy)
+        with self._lock:
+            self.misses += 1
+            # Skip the insert if the rules changed while validating
+            if self._tokens.get(policy) == token:
+                # Feedback messages repeat across entries; keep one copy of each
+                self._entries[key] = (is_valid, tuple(map(sys.intern, feedback)))
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return is_valid, feedback
+
+    def clear(self) -> None:
+        """Drop every entry; statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._tokens.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for sizing the cache."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'approx_bytes': len(self._entries) * ENTRY_BYTES,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
@@ -0,0 +1,305 @@
+import re
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .config import (PASSWORD_REQUIREMENTS, COMMON_WEAK_PATTERNS, COMMON_SUBSTITUTIONS,
+                     BLOCKLIST_SETTINGS, SEQUENCE_SETTINGS, VALIDATION_CACHE_SETTINGS)
+from . import metrics
+from .blocklist import Blocklist
+from .sequences import SequenceDetector
+from .rules import CHECK_BITS, CompiledRules, FAILED_NAMES, results_from_mask
+from .results import BatchResult, ValidationResult, mask_from_results, result_for_mask
+
+# Names of the individual checks, in the order they are evaluated
+VALIDATION_CHECKS = tuple(name for name, _ in CHECK_BITS)
+
+def validate_password(password: str, policy: Optional[str] = None) -> Tuple[bool, Dict]:
+    """
+    Validate a password against security criteria.
+    
+    Args:
+        password (str): Password to validate
+        policy (str, optional): Named policy profile (default: PASSWORD_REQUIREMENTS)
+        
+    Returns:
+        Tuple[bool, Dict]: (is_valid, validation_details)
+        
+    Example:
+        >>> validate_password("Weak1!")
+        (False, {'length': False, 'uppercase': True, ...})
+    """
+    mask = _checker(policy)(password)
+    return not mask, results_from_mask(mask)
+
+def validate_password_result(password: str, policy: Optional[str] = None) -> ValidationResult:
+    """
+    Validate a password and return a shared, immutable result object.
+    
+    Nothing is allocated per call: the result carries the failure mask,
+    failed check names and interned feedback messages, with the
+    validate_password dict available through as_dict().
+    
+    Args:
+        password (str): Password to validate
+        policy (str, optional): Named policy profile (default: PASSWORD_REQUIREMENTS)
+        
+    Returns:
+        ValidationResult: e.g. ValidationResult(valid=False, failed=('length',))
+    """
+    return result_for_mask(_checker(policy)(password), _requirements(policy))
+
+def validate_batch(passwords: Iterable[str], policy: Optional[str] = None) -> BatchResult:
+    """
+    Validate many passwords into a columnar result.
+    
+    Only one byte per password is kept, so this suits bulk audits that
+    need aggregate statistics (BatchResult.failure_counts, summary)
+    rather than a record per password.
+    
+    Args:
+        passwords (Iterable[str]): Passwords to validate
+        policy (str, optional): Named policy profile (default: PASSWORD_REQUIREMENTS)
+        
+    Returns:
+        BatchResult: Failure masks in input order
+    """
+    return BatchResult(map(_checker(policy), passwords), _requirements(policy))
+
+def validate_password_mask(password: str, policy: Optional[str] = None) -> int:
+    """
+    Validate a password and return a compact failure bitmask.
+    
+    This is the fast path: no dict is built. Use rules.results_from_mask
+    to expand the mask into the dict view when details are needed.
+    
+    Args:
+        password (str): Password to validate
+        policy (str, optional): Named policy profile (default: PASSWORD_REQUIREMENTS)
+        
+    Returns:
+        int: OR of the rules.* failure bits; 0 means the password is valid
+    """
+    return _checker(policy)(password)
+
+def validate_many(passwords: Iterable[str],
+                  policy: Optional[str] = None) -> Iterator[Tuple[str, bool, Tuple[str, ...]]]:
+    """
+    Lazily validate a stream of passwords.
+    
+    Passwords are consumed one at a time, so memory stays bounded no matter
+    how large the input is. No per-password dict is built; each result only
+    carries the names of the checks that failed.
+    
+    Args:
+        passwords (Iterable[str]): Passwords to validate, e.g. lines of a file
+        policy (str, optional): Named policy profile, resolved once for the
+            whole stream (default: PASSWORD_REQUIREMENTS)
+        
+    Yields:
+        Tuple[str, bool, Tuple[str, ...]]: (password, is_valid, failed_checks)
+        
+    Example:
+        >>> list(validate_many(["Weak1!"]))
+        [('Weak1!', False, ('length', ...))]
+    """
+    check = _checker(policy)
+    for password in passwords:
+        mask = check(password)
+        yield password, not mask, FAILED_NAMES[mask]
+
+def _checker(policy: Optional[str]):
+    """The mask function for a policy name, or the default rule engine."""
+    if policy is None:
+        rules = _RULES
+    else:
+        # Profiles (and the TOML parser) are only loaded when one is asked for
+        from .policy import get_policy
+        rules = get_policy(policy).rules
+    return rules.check_instrumented if metrics.enabled else rules.check
+
+def reload_requirements() -> None:
+    """Recompile the rule engine after PASSWORD_REQUIREMENTS has been modified."""
+    global _RULES
+    _RULES = CompiledRules(PASSWORD_REQUIREMENTS, _has_common_weak_patterns, _SEQUENCES)
+
+def get_validation_feedback(validation_results: Dict,
+                            requirements: Optional[Mapping] = None) -> List[str]:
+    """
+    Generate user-friendly feedback based on validation results.
+    
+    Args:
+        validation_results (Dict): Results from validate_password
+        requirements (Mapping, optional): Settings the results were checked
+            against, e.g. Policy.settings (default: PASSWORD_REQUIREMENTS)
+        
+    Returns:
+        List[str]: List of feedback messages
+    """
+    # Messages are formatted once per requirements and shared (see results.py)
+    return list(result_for_mask(mask_from_results(validation_results), requirements).feedback)
+
+def load_blocklist(path: str) -> int:
+    """
+    Add a word list file to the weak patterns checked by the validator.
+    
+    The file is matched together with COMMON_WEAK_PATTERNS, sees through
+    COMMON_SUBSTITUTIONS and is reloaded automatically when it changes on disk.
+    A shared blocklist published with `main.py blocklist-publish` is mapped
+    instead of loaded; it already holds all the patterns, and new
+    generations are picked up the same way.
+    
+    Args:
+        path (str): Word list file, one pattern per line, or shared blocklist
+        
+    Returns:
+        int: Number of patterns now loaded
+    """
+    global _BLOCKLIST
+    _BLOCKLIST = _open_blocklist(path)
+    return len(_BLOCKLIST)
+
+def _open_blocklist(path: Optional[str]) -> Blocklist:
+    """The configured weak patterns plus a word list or shared blocklist file."""
+    if path is None:
+        return Blocklist(COMMON_WEAK_PATTERNS, None, BLOCKLIST_SETTINGS['reload_interval'],
+                         COMMON_SUBSTITUTIONS)
+    # Only needed (and imported) when a file is configured
+    from .shared_blocklist import open_blocklist
+    return open_blocklist(path, COMMON_WEAK_PATTERNS, BLOCKLIST_SETTINGS['reload_interval'],
+                          COMMON_SUBSTITUTIONS)
+
+def _has_common_weak_patterns(password: str) -> bool:
+    """Check for common weak password patterns."""
+    return _BLOCKLIST.contains_any(password)
+
+def _has_sequential_chars(password: str) -> bool:
+    """Check for sequential characters (abc, 321, qwer, 1qaz, etc.)."""
+    return _SEQUENCES.contains_any(password)
+
+def find_sequences(password: str) -> List[Tuple[int, int, str]]:
+    """
+    Locate the runs that make a password fail the sequential check.
+    
+    Args:
+        password (str): Password to search
+        
+    Returns:
+        List[Tuple[int, int, str]]: (start, end, kind) per run, where kind is
+        'ascending', 'descending' or a keyboard layout name
+    """
+    return _SEQUENCES.find_all(password)
+
+def validate_password_with_feedback(password: str,
+                                    policy: Optional[str] = None) -> Tuple[bool, List[str]]:
+    """
+    Validate password and return feedback in one function.
+    
+    Args:
+        password (str): Password to validate
+        policy (str, optional): Named policy profile (default: PASSWORD_REQUIREMENTS)
+        
+    Returns:
+        Tuple[bool, List[str]]: (is_valid, feedback_messages)
+        
+    Repeated passwords are answered from the validation cache when one is
+    configured (see configure_validation_cache).
+    """
+    if _CACHE is not None:
+        return _CACHE.get_or_validate(password, policy, _ruleset_token(policy),
+                                      _validate_with_feedback)
+    return _validate_with_feedback(password, policy)
+
+def _validate_with_feedback(password: str, policy: Optional[str]) -> Tuple[bool, List[str]]:
+    result = validate_password_result(password, policy)
+    return result.valid, list(result.feedback)
+
+def _requirements(policy: Optional[str]) -> Optional[Mapping]:
+    """Settings behind a policy name, for feedback; None for the defaults."""
+    if policy is None:
+        return None
+    from .policy import get_policy
+    return get_policy(policy).settings
+
+def _ruleset_token(policy: Optional[str]) -> Tuple:
+    """Changes whenever the rules a policy name resolves to do."""
+    if policy is None:
+        return _RULES, _BLOCKLIST, _BLOCKLIST.generation()
+    from .policy import get_policy
+    compiled = get_policy(policy)
+    return compiled, compiled.blocklist.generation()
+
+def configure_validation_cache(max_entries: Optional[int] = None):
+    """
+    Put a bounded cache in front of validate_password_with_feedback.
+    
+    Args:
+        max_entries (int, optional): Results to keep; 0 removes the cache
+            (default: VALIDATION_CACHE_SETTINGS['max_entries'])
+        
+    Returns:
+        ValidationCache: The new, empty cache, or None when removed
+    """
+    global _CACHE
+    if max_entries is None:
+        max_entries = VALIDATION_CACHE_SETTINGS['max_entries']
+    if max_entries <= 0:
+        _CACHE = None
+    else:
+        from .validation_cache import ValidationCache
+        _CACHE = ValidationCache(max_entries)
+    return _CACHE
+
+def validation_cache_stats() -> Optional[Dict]:
+    """Hit/miss counters of the validation cache, or None when there is none."""
+    return _CACHE.stats() if _CACHE is not None else None
+
+# Weak-pattern matcher, built once from the configured lists; leetspeak
+# variants such as 'p@$$w0rd' are matched through COMMON_SUBSTITUTIONS
+_BLOCKLIST = _open_blocklist(BLOCKLIST_SETTINGS['blocklist_file'])
+
+# Sequence and keyboard-walk tables, precomputed once
+_SEQUENCES = SequenceDetector(SEQUENCE_SETTINGS['min_length'],
+                              SEQUENCE_SETTINGS['keyboard_min_length'],
+                              SEQUENCE_SETTINGS['keyboards'])
+
+# PASSWORD_REQUIREMENTS compiled once into the single-pass rule engine
+_RULES = CompiledRules(PASSWORD_REQUIREMENTS, _has_common_weak_patterns, _SEQUENCES)
+
+# Results of validate_password_with_feedback for repeated passwords
+_CACHE = None
+if VALIDATION_CACHE_SETTINGS['enabled']:
+    configure_validation_cache()
+
+if __name__ == "__main__":
+    # Test the validator
+    test_passwords = [
+        "StrongP@ss123!",
+        "weak",
+        "Password123",
+        "abc123!@#",
+        "123456789",
+        "qwertyuiop",
+        "Admin123!",
+        "aB1!aB1!aB1!",
+        "sequential123",
+        "password1!"
+    ]
+    
+    print("Password Validator Test:")
+    print("=" * 50)
+    
+    for password in test_passwords:
+        is_valid, results = validate_password(password)
+        feedback = get_validation_feedback(results)
+        
+        status = "✅ VALID" if is_valid else "❌ INVALID"
+        print(f"\nPassword: {password}")
+        print(f"Status: {status}")
+        
+        if not is_valid:
+            print("Issues:")
+            for issue in feedback:
+                print(f"  - {issue}")
+        else:
+            print("All requirements met!")
+        
+        print("-" * 30)
\ No newline at end of file
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+import asyncio
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.async_hasher import AsyncHasher, LatencyHistogram, QueueFullError, async_verify
+from pypassguard.hasher import ScryptHasher
+
+class TestAsyncHasher(unittest.TestCase):
+    
+    def test_hash_and_verify(self):
+        """Test offloaded hashing and verification"""
+        async def run():
+            async with AsyncHasher(max_workers=2, scheme='pbkdf2-sha256', i=1000) as hasher:
+                encoded = await hasher.hash_password("s3cret")
+                self.assertTrue(await hasher.verify("s3cret", encoded))
+                self.assertFalse(await hasher.verify("wrong", encoded))
+                self.assertTrue(await async_verify("s3cret", encoded))
+                
+                batch = await hasher.hash_many(["a", "b", "c"])
+                self.assertEqual(await hasher.verify_many(zip("abc", batch)), [True] * 3)
+                
+                stats = hasher.stats()
+                self.assertEqual(stats['hash']['count'], 4)
+                self.assertEqual(stats['verify']['count'], 5)
+                self.assertEqual(stats['pending'], 0)
+        asyncio.run(run())
+    
+    def test_queue_limit(self):
+        """Test that requests beyond the queue depth are rejected"""
+        async def run():
+            encoded = ScryptHasher(ln=10).encode("s3cret")
+            async with AsyncHasher(max_workers=1, max_queue=2) as hasher:
+                results = await asyncio.gather(
+                    *(hasher.verify("s3cret", encoded) for _ in range(5)),
+                    return_exceptions=True)
+                rejected = [r for r in results if isinstance(r, QueueFullError)]
+                self.assertEqual(len(rejected), 3)
+                self.assertEqual(hasher.stats()['rejected'], 3)
+        asyncio.run(run())
+    
+    def test_batch_larger_than_queue(self):
+        """Test that a batch beyond the queue depth is throttled, not cut short"""
+        async def run():
+            async with AsyncHasher(max_workers=2, max_queue=3, scheme='pbkdf2-sha256', i=1000) as hasher:
+                batch = await hasher.hash_many(str(i) for i in range(20))
+                self.assertEqual(len(batch), 20)
+                self.assertEqual(await hasher.verify_many(zip(map(str, range(20)), batch)), [True] * 20)
+                self.assertEqual(hasher.stats()['pending'], 0)
+                
+                # A full queue rejects the batch before any of it is submitted
+                hasher.pending = hasher.max_queue
+                with self.assertRaises(QueueFullError):
+                    await hasher.hash_many(["a", "b"])
+                hasher.pending = 0
+                self.assertEqual(hasher.stats()['hash']['count'], 20)
+        asyncio.run(run())
+    
+    def test_histogram(self):
+        """Test latency histogram percentiles"""
+        histogram = LatencyHistogram()
+        for ms in [1] * 98 + [40, 400]:
+            histogram.record(ms / 1000)
+        self.assertEqual(histogram.percentile(0.5), 1)
+        self.assertEqual(histogram.percentile(0.99), 50)
+        self.assertEqual(histogram.percentile(1.0), 500)
+        self.assertEqual(histogram.snapshot()['count'], 100)
+
+if __name__ == '__main__':
+    unittest.main()
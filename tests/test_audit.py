@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+import io
+import tempfile
+from collections import Counter
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.audit import (AuditError, AuditSketch, HyperLogLog, SpaceSaving, audit_stream,
+                               base_word)
+from pypassguard.validator import validate_batch
+
+PASSWORDS = (['password'] * 50 + ['P@ssw0rd1!'] * 30 + ['Xq7!mZp2wKv9'] * 20 +
+             ['123456'] * 10 + [f'user{i}Pass!' for i in range(200)])
+
+class TestAudit(unittest.TestCase):
+
+    def test_hyperloglog_estimate_and_merge(self):
+        """Test distinct counts within a few standard errors, and union by merge"""
+        first, second, whole = HyperLogLog(12), HyperLogLog(12), HyperLogLog(12)
+        first.update(f'pw{i}' for i in range(30000))
+        second.update(f'pw{i}' for i in range(20000, 50000))
+        whole.update(f'pw{i}' for i in range(50000))
+        first.merge(second)
+
+        self.assertEqual(first.registers, whole.registers)
+        self.assertLess(abs(whole.count() - 50000) / 50000, 4 * whole.standard_error)
+        small = HyperLogLog(12)
+        small.update(['a', 'b', 'c', 'a'])
+        self.assertEqual(small.count(), 3)
+        with self.assertRaises(AuditError):
+            first.merge(HyperLogLog(10))
+
+    def test_space_saving_bounds(self):
+        """Test that heavy hitters are kept and true counts lie within the error"""
+        stream = ['common'] * 500 + ['frequent'] * 300 + [f'rare{i}' for i in range(2000)]
+        summary = SpaceSaving(capacity=50)
+        for start in range(0, len(stream), 100):
+            summary.update(Counter(stream[start:start + 100]))
+
+        truth = Counter(stream)
+        top = summary.top(2)
+        self.assertEqual([item for item, _, _ in top], ['common', 'frequent'])
+        for item, count, error in summary.top(50):
+            self.assertTrue(count - error <= truth[item] <= count, item)
+        self.assertEqual(len(summary), 50)
+
+    def test_base_word(self):
+        """Test decoration stripping and substitution reversal"""
+        self.assertEqual(base_word('P@ssw0rd123!'), 'password')
+        self.assertEqual(base_word('!!Monkey2024'), 'monkey')
+        self.assertEqual(base_word('123456'), '')
+
+    def test_sketch_matches_batch_summary(self):
+        """Test failure rates, histograms and top-k against exact values"""
+        sketch = AuditSketch(capacity=100)
+        sketch.update(PASSWORDS)
+        report = sketch.report(top=3)
+
+        summary = validate_batch(PASSWORDS).summary()
+        for key in ('total', 'valid', 'invalid', 'failures', 'failure_rates'):
+            self.assertEqual(report[key], summary[key])
+        self.assertEqual(report['distinct_passwords'], len(set(PASSWORDS)))
+        self.assertEqual(report['length_histogram']['8'], 50)
+        self.assertEqual(report['class_histogram']['lowercase'], 50)
+        self.assertEqual(report['top_passwords'][0], {'password': 'password', 'count': 50, 'error': 0})
+        self.assertEqual(report['top_base_words'][0]['base_word'], 'password')
+        self.assertEqual(report['top_base_words'][0]['count'], 80)
+
+    def test_shards_merge_into_whole(self):
+        """Test that shard states saved to disk merge into the whole-input sketch"""
+        whole = AuditSketch()
+        whole.update(PASSWORDS)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for index, shard in enumerate((PASSWORDS[::2], PASSWORDS[1::2])):
+                sketch = AuditSketch()
+                sketch.update(shard)
+                paths.append(os.path.join(tmp, f'shard{index}.json'))
+                sketch.save(paths[-1])
+            merged = AuditSketch.load(paths[0])
+            merged.merge(AuditSketch.load(paths[1]))
+
+            self.assertEqual(merged.report(), whole.report())
+            with open(paths[0], 'w') as f:
+                f.write('{"format": "something-else"}')
+            with self.assertRaises(AuditError):
+                AuditSketch.load(paths[0])
+        with self.assertRaises(AuditError):
+            merged.merge(AuditSketch(policy='strict'))
+
+    def test_stream_blocks_and_workers(self):
+        """Test that block-wise and parallel audits give the single-batch report"""
+        data = ('\r\n'.join(PASSWORDS) + '\n\n').encode('utf-8')
+        expected = AuditSketch()
+        expected.update(PASSWORDS)
+
+        serial = audit_stream(io.BytesIO(data), block_size=256)
+        parallel = audit_stream(io.BytesIO(data), workers=2, block_size=256)
+        self.assertEqual(serial.report(), expected.report())
+        self.assertEqual(parallel.report(), expected.report())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import sys
+import os
+import io
+import json
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.batch import read_passwords, write_validation_results, Throughput
+
+class TestBatch(unittest.TestCase):
+    
+    def test_read_passwords(self):
+        """Test that lines are stripped and blank lines skipped"""
+        stream = io.StringIO("first\r\nsecond\n\nthird")
+        self.assertEqual(list(read_passwords(stream)), ["first", "second", "third"])
+    
+    def test_write_jsonl(self):
+        """Test JSON Lines output"""
+        out = io.StringIO()
+        results = [('a"b', False, ('length', 'digits')), ('Ok', True, ())]
+        count = write_validation_results(results, out, 'jsonl')
+        
+        self.assertEqual(count, 2)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(lines[0], {"password": 'a"b', "valid": False, "failed": ["length", "digits"]})
+        self.assertEqual(lines[1], {"password": "Ok", "valid": True, "failed": []})
+    
+    def test_write_csv(self):
+        """Test CSV output"""
+        out = io.StringIO()
+        count = write_validation_results([('x,y', False, ('length', 'digits'))], out, 'csv')
+        
+        self.assertEqual(count, 1)
+        self.assertEqual(out.getvalue(), 'password,valid,failed\n"x,y",0,length;digits\n')
+    
+    def test_invalid_format(self):
+        """Test error handling for unknown formats"""
+        with self.assertRaises(ValueError):
+            write_validation_results([], io.StringIO(), 'xml')
+    
+    def test_throughput(self):
+        """Test throughput measurement"""
+        with Throughput() as meter:
+            meter.count = 10
+        self.assertGreaterEqual(meter.rate, 0)
+        self.assertIn("10 passwords", meter.summary())
+
+if __name__ == '__main__':
+    unittest.main()
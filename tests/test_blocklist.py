@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.blocklist import Blocklist, SMALL_LIST_SIZE
+from pypassguard.config import COMMON_SUBSTITUTIONS
+from pypassguard.leet import canonical_table, canonicalize
+
+class TestBlocklist(unittest.TestCase):
+    
+    def setUp(self):
+        self.small = Blocklist(['password', 'admin', 'qwerty'])
+        # Enough patterns to use the length-bucketed sets
+        self.large = Blocklist(['password', 'admin', 'qwerty'] +
+                               [f'word{i:04d}' for i in range(SMALL_LIST_SIZE * 2)])
+    
+    def test_contains_any(self):
+        """Test case-insensitive substring matching in both modes"""
+        for blocklist in (self.small, self.large):
+            self.assertTrue(blocklist.contains_any("MyPassWord!1"))
+            self.assertTrue(blocklist.contains_any("xxadminxx"))
+            self.assertFalse(blocklist.contains_any("Tr0ub4dor&3"))
+            self.assertFalse(blocklist.contains_any(""))
+        self.assertTrue(self.large.contains_any("1word0042!"))
+    
+    def test_find_all(self):
+        """Test that every occurrence is reported with its span"""
+        expected = [(0, 5, 'admin'), (5, 13, 'password'), (13, 18, 'admin')]
+        for blocklist in (self.small, self.large):
+            self.assertEqual(blocklist.find_all("adminPASSWORDadmin"), expected)
+    
+    def test_short_patterns_ignored(self):
+        """Test that patterns too short to be meaningful are dropped"""
+        blocklist = Blocklist(['ab', ' ', '# comment', 'abc'])
+        self.assertEqual(len(blocklist), 1)
+    
+    def test_file_reload(self):
+        """Test loading from a file and reloading after it changes"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'words.txt')
+            with open(path, 'w') as f:
+                f.write("corpname\n")
+            
+            blocklist = Blocklist(['admin'], path, reload_interval=0)
+            self.assertTrue(blocklist.contains_any("corpname2024"))
+            self.assertTrue(blocklist.contains_any("admin!"))
+            self.assertFalse(blocklist.refresh())
+            
+            with open(path, 'w') as f:
+                f.write("newterm\n")
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+            
+            self.assertTrue(blocklist.contains_any("newterm!"))
+            self.assertFalse(blocklist.contains_any("corpname2024"))
+            self.assertTrue(blocklist.contains_any("admin!"))
+
+class TestLeetBlocklist(unittest.TestCase):
+    
+    SUBSTITUTIONS = {'a': ['@', '4'], 'i': ['1', '!'], 'l': ['1', '|'],
+                     'o': ['0'], 's': ['5', '$']}
+    
+    def test_canonical_table_merges_ambiguous_letters(self):
+        """Test that letters sharing a substitute collapse into one class"""
+        table = canonical_table(self.SUBSTITUTIONS)
+        self.assertEqual(canonicalize("P@$$W0rd", table), "password")
+        self.assertEqual(canonicalize("1|!Li", table), "iiiii")
+        self.assertEqual(canonicalize("xyz", table), "xyz")
+    
+    def test_leet_variants_match(self):
+        """Test that substituted passwords hit their plain patterns in both modes"""
+        patterns = ['password', 'letmein', 'admin']
+        small = Blocklist(patterns, substitutions=self.SUBSTITUTIONS)
+        large = Blocklist(patterns + [f'word{i:04d}' for i in range(SMALL_LIST_SIZE * 2)],
+                          substitutions=self.SUBSTITUTIONS)
+        for blocklist in (small, large):
+            self.assertTrue(blocklist.contains_any("p@$$w0rd"))
+            self.assertTrue(blocklist.contains_any("1etme!n2024"))
+            self.assertTrue(blocklist.contains_any("x4dm1nx"))
+            self.assertFalse(blocklist.contains_any("Tr0ub4dor&3"))
+            self.assertEqual(blocklist.find_all("my-p@55word"), [(3, 11, 'password')])
+    
+    def test_letter_free_patterns_stay_literal(self):
+        """Test that digit patterns match digits only, not letters that share their class"""
+        patterns = ['123456', 'password']
+        small = Blocklist(patterns, substitutions=COMMON_SUBSTITUTIONS)
+        large = Blocklist(patterns + [f'word{i:04d}' for i in range(SMALL_LIST_SIZE * 2)],
+                          substitutions=COMMON_SUBSTITUTIONS)
+        for blocklist in (small, large):
+            self.assertFalse(blocklist.contains_any("Izeasb!Qx9"))
+            self.assertTrue(blocklist.contains_any("Xq123456!"))
+            self.assertTrue(blocklist.contains_any("p@55w0rd"))
+            self.assertEqual(blocklist.find_all("ab123456izeasb"), [(2, 8, '123456')])
+
+            tracker = blocklist.tracker()
+            typed = ''
+            for char in 'Izeasb123456x':
+                typed += char
+                tracker.splice(typed, len(typed) - 1, 0, 1)
+                self.assertEqual(tracker.found(typed), blocklist.contains_any(typed), typed)
+        self.assertEqual(len(small), 2)
+
+    def test_plain_blocklist_ignores_leet(self):
+        """Test that substitutions are only applied when configured"""
+        self.assertFalse(Blocklist(['password']).contains_any("p@$$w0rd"))
+
+if __name__ == '__main__':
+    unittest.main()
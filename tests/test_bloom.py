@@ -0,0 +1,81 @@
+import unittest
+import sys
+import os
+import hashlib
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.bloom import BloomFilter, BloomFilterError, build_filter, optimal_parameters
+from pypassguard.breach import BreachIndex, BreachIndexError, build_index
+
+def sha1(text):
+    return hashlib.sha1(text.encode('utf-8')).digest()
+
+class TestBloom(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'test.bloom')
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_optimal_parameters(self):
+        """Test filter sizing for a target false-positive rate"""
+        bits, hash_count = optimal_parameters(1000, 0.01)
+        self.assertAlmostEqual(bits / 1000, 9.59, places=1)
+        self.assertEqual(hash_count, 7)
+        with self.assertRaises(ValueError):
+            optimal_parameters(1000, 1.5)
+    
+    def test_no_false_negatives(self):
+        """Test that every added digest is reported as possibly present"""
+        digests = [sha1(f"member{i}") for i in range(2000)]
+        build_filter(digests, len(digests), self.path, fpr=0.01)
+        
+        with BloomFilter(self.path) as bloom:
+            self.assertEqual(bloom.entries, 2000)
+            self.assertEqual(bloom.algorithm, 'sha1')
+            self.assertTrue(all(bloom.might_contain(d) for d in digests))
+            
+            false_positives = sum(bloom.might_contain(sha1(f"other{i}")) for i in range(20000))
+            self.assertLess(false_positives / 20000, 0.03)
+    
+    def test_invalid_file(self):
+        """Test error handling for files that are not filters"""
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 64)
+        with self.assertRaises(BloomFilterError):
+            BloomFilter(self.path)
+    
+    def test_breach_prefilter(self):
+        """Test the filter in front of the breach index"""
+        words = os.path.join(self.tmp.name, 'words.txt')
+        index_path = os.path.join(self.tmp.name, 'breach.idx')
+        with open(words, 'w') as f:
+            f.write("hunter2\nletmein\n")
+        build_index([words], index_path, plaintext=True)
+        
+        with BreachIndex(index_path) as index:
+            build_filter(index.iter_digests(), len(index), self.path, algorithm=index.algorithm,
+                         source=index.fingerprint())
+        
+        with BreachIndex(index_path, self.path) as index:
+            self.assertEqual(index.lookup("hunter2"), 1)
+            self.assertEqual(index.lookup("correct horse"), 0)
+        
+        # Rebuilding the index without the filter must not silently miss new entries
+        with open(words, 'a') as f:
+            f.write("dragon\n")
+        build_index([words], index_path, plaintext=True)
+        with self.assertRaises(BreachIndexError):
+            BreachIndex(index_path, self.path)
+        
+        build_filter([], 1, self.path, algorithm='sha256')
+        with self.assertRaises(BreachIndexError):
+            BreachIndex(index_path, self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import hashlib
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.breach import BreachIndex, BreachIndexError, build_index
+
+def sha1_hex(password):
+    return hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+
+class TestBreach(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmp.name, 'breach.idx')
+        self.breached = {f"leaked{i}": i + 1 for i in range(200)}
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def write(self, name, lines):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        return path
+    
+    def test_full_dump(self):
+        """Test building from an unsorted HASH:COUNT dump using several runs"""
+        dump = self.write('dump.txt', [f"{sha1_hex(p)}:{c}" for p, c in self.breached.items()])
+        count = build_index([dump], self.index_path, chunk_size=16)
+        self.assertEqual(count, len(self.breached))
+        
+        with BreachIndex(self.index_path) as index:
+            self.assertEqual(len(index), len(self.breached))
+            for password, expected in self.breached.items():
+                self.assertEqual(index.lookup(password), expected)
+            self.assertEqual(index.lookup("not-leaked"), 0)
+            self.assertNotIn("not-leaked", index)
+            self.assertIn("leaked7", index)
+    
+    def test_range_files(self):
+        """Test building from a directory of prefix-named range files"""
+        range_dir = os.path.join(self.tmp.name, 'ranges')
+        os.mkdir(range_dir)
+        ranges = {}
+        for password, count in self.breached.items():
+            digest = sha1_hex(password)
+            ranges.setdefault(digest[:5], []).append(f"{digest[5:]}:{count}")
+        for prefix, lines in ranges.items():
+            with open(os.path.join(range_dir, prefix + '.txt'), 'w') as f:
+                f.write('\r\n'.join(lines))
+        
+        build_index([range_dir], self.index_path)
+        with BreachIndex(self.index_path) as index:
+            self.assertEqual(index.lookup("leaked42"), 43)
+    
+    def test_duplicates_merged(self):
+        """Test that duplicate digests are merged by summing counts"""
+        digest = sha1_hex("dup")
+        dump = self.write('dump.txt', [f"{digest}:2", f"{sha1_hex('x')}:1", f"{digest}:3"])
+        self.assertEqual(build_index([dump], self.index_path, chunk_size=1), 2)
+        with BreachIndex(self.index_path) as index:
+            self.assertEqual(index.lookup("dup"), 5)
+    
+    def test_sha256_plaintext(self):
+        """Test a SHA-256 index built from a plaintext list"""
+        source = self.write('words.txt', list(self.breached))
+        build_index([source], self.index_path, algorithm='sha256', plaintext=True)
+        with BreachIndex(self.index_path) as index:
+            self.assertEqual(index.algorithm, 'sha256')
+            self.assertEqual(index.lookup("leaked3"), 1)
+            self.assertEqual(index.lookup("leaked"), 0)
+    
+    def test_empty_index(self):
+        """Test that an empty index answers every lookup with 0"""
+        build_index([self.write('empty.txt', [])], self.index_path)
+        with BreachIndex(self.index_path) as index:
+            self.assertEqual(index.lookup("anything"), 0)
+    
+    def test_invalid_input(self):
+        """Test error handling for malformed dumps and index files"""
+        with self.assertRaises(BreachIndexError):
+            build_index([self.write('bad.txt', ["nothex:1"])], self.index_path)
+        with self.assertRaises(BreachIndexError):
+            BreachIndex(self.write('bogus.idx', ["not an index file at all, really"]))
+
+if __name__ == '__main__':
+    unittest.main()
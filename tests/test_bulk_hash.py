@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+import io
+import hashlib
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.bulk_hash import read_blocks, digest_block, hash_file
+from pypassguard.hasher import hash_password
+
+PASSWORDS = ['MyP@ssw0rd', 'hunter2', 'pässwörd', 'hunter2', 'abc']
+
+def _source(text):
+    return io.BytesIO(text.encode('utf-8'))
+
+class TestBulkHash(unittest.TestCase):
+
+    def test_read_blocks_keeps_lines_whole(self):
+        """Test that small blocks never split a line"""
+        data = b'alpha\nbeta\ngamma\ndelta'
+        blocks = list(read_blocks(io.BytesIO(data), block_size=4))
+
+        self.assertEqual(b''.join(blocks), data)
+        for block in blocks[:-1]:
+            self.assertTrue(block.endswith(b'\n'))
+
+    def test_digest_block_matches_hash_password(self):
+        """Test that raw line digests equal hash_password of the decoded line"""
+        block = '\r\n'.join(PASSWORDS + ['']).encode('utf-8') + b'\n'
+        lines = digest_block(block).decode('ascii').splitlines()
+
+        self.assertEqual(lines, [hash_password(p) for p in PASSWORDS])
+
+    def test_binary_output(self):
+        """Test fixed-width raw digests"""
+        out = io.BytesIO()
+        count = hash_file(_source('\n'.join(PASSWORDS)), out, 'sha1', 'binary')
+
+        self.assertEqual(count, len(PASSWORDS))
+        self.assertEqual(out.getvalue(),
+                         b''.join(hashlib.sha1(p.encode('utf-8')).digest() for p in PASSWORDS))
+
+    def test_sort_and_unique(self):
+        """Test sorted output with and without duplicates, across several runs"""
+        expected = sorted(hash_password(p) for p in PASSWORDS)
+        out = io.BytesIO()
+        count = hash_file(_source('\n'.join(PASSWORDS)), out, sort=True, chunk_size=2)
+        self.assertEqual(count, len(PASSWORDS))
+        self.assertEqual(out.getvalue().decode('ascii').splitlines(), expected)
+
+        out = io.BytesIO()
+        count = hash_file(_source('\n'.join(PASSWORDS)), out, unique=True, chunk_size=2)
+        self.assertEqual(count, len(set(PASSWORDS)))
+        self.assertEqual(out.getvalue().decode('ascii').splitlines(), sorted(set(expected)))
+
+    def test_parallel_matches_serial(self):
+        """Test that worker processes produce the same output in the same order"""
+        text = '\n'.join(f'password{i}' for i in range(2000))
+        serial, parallel = io.BytesIO(), io.BytesIO()
+        hash_file(_source(text), serial, block_size=1024)
+        hash_file(_source(text), parallel, workers=2, block_size=1024)
+
+        self.assertEqual(parallel.getvalue(), serial.getvalue())
+
+    def test_invalid_options(self):
+        """Test error handling for unknown algorithms and formats"""
+        with self.assertRaises(ValueError):
+            hash_file(_source('abc'), io.BytesIO(), algorithm='md4')
+        with self.assertRaises(ValueError):
+            hash_file(_source('abc'), io.BytesIO(), fmt='base64')
+
+if __name__ == '__main__':
+    unittest.main()
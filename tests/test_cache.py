@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.cache import load_or_build
+from pypassguard.strength import FrequencyTable
+
+class TestTableCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'cache')
+        self.source = os.path.join(self.tmp.name, 'words.txt')
+        with open(self.source, 'w') as f:
+            f.write("password\nletmein\n")
+        self.builds = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self):
+        self.builds += 1
+        return FrequencyTable.from_files([self.source])
+
+    def load(self, key=()):
+        return load_or_build('words', self.build, key, [self.source], self.directory)
+
+    def test_builds_once(self):
+        """Test that a cached table is loaded instead of rebuilt"""
+        first = self.load()
+        second = self.load()
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(second.ranks, first.ranks)
+        self.assertEqual(second.prefixes, first.prefixes)
+
+    def test_source_change_invalidates(self):
+        """Test that editing a source file rebuilds the table"""
+        self.load()
+        with open(self.source, 'a') as f:
+            f.write("dragon\n")
+        self.assertIn("dragon", self.load())
+        self.assertEqual(self.builds, 2)
+
+    def test_keys_cached_side_by_side(self):
+        """Test that tables built with different parameters do not evict each other"""
+        self.load('a')
+        self.load('b')
+        self.load('a')
+        self.assertEqual(self.builds, 2)
+
+    def test_corrupt_entry_rebuilt(self):
+        """Test that a damaged cache file is ignored and replaced"""
+        self.load()
+        for name in os.listdir(self.directory):
+            with open(os.path.join(self.directory, name), 'wb') as f:
+                f.write(b'\x80garbage')
+        self.assertIn("letmein", self.load())
+        self.assertIn("letmein", self.load())
+        self.assertEqual(self.builds, 2)
+
+    def test_unwritable_directory(self):
+        """Test that an unusable cache directory falls back to building"""
+        blocker = os.path.join(self.tmp.name, 'file')
+        open(blocker, 'w').close()
+        table = load_or_build('words', self.build, (), [self.source], os.path.join(blocker, 'cache'))
+        self.assertIn("password", table)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+import unittest
+import sys
+import os
+import asyncio
+import socket
+import tempfile
+import threading
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard import metrics
+from pypassguard.async_hasher import AsyncHasher
+from pypassguard.daemon import PassGuardService, serve
+from pypassguard.daemon_client import DaemonClient, DaemonError
+from pypassguard.httpd import start_unix_server
+from pypassguard.breach import build_index
+from pypassguard.hasher import hash_password, verify_password
+
+class TestDaemon(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Serve a daemon on a Unix socket and an HTTP port from a background loop"""
+        cls.tmp = tempfile.TemporaryDirectory()
+        source = os.path.join(cls.tmp.name, 'breached.txt')
+        with open(source, 'w') as f:
+            f.write("hunter2\nhunter2\nletmein\n")
+        index = os.path.join(cls.tmp.name, 'breach.idx')
+        build_index([source], index, 'sha1', plaintext=True)
+
+        cls.socket_path = os.path.join(cls.tmp.name, 'daemon.sock')
+        cls.service = PassGuardService(index_path=index, max_batch=100)
+        cls.loop = asyncio.new_event_loop()
+        ready = asyncio.Event()
+        cls.task = cls.loop.create_task(
+            serve(cls.socket_path, '127.0.0.1', 0, cls.service, ready))
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+        asyncio.run_coroutine_threadsafe(ready.wait(), cls.loop).result(5)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.call_soon_threadsafe(cls.task.cancel)
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.loop.run_until_complete(asyncio.gather(cls.task, return_exceptions=True))
+        cls.loop.close()
+        cls.tmp.cleanup()
+        metrics.disable()
+
+    def client(self):
+        return DaemonClient(self.socket_path)
+
+    def test_validate(self):
+        """Test single and batched validation over the Unix socket"""
+        with self.client() as client:
+            result = client.validate("MyStr0ng!Pass")
+            self.assertTrue(result['valid'])
+            self.assertEqual(result['failed'], [])
+
+            results = client.validate(["MyStr0ng!Pass", "short", "Abc12345!"])
+            self.assertEqual([r['valid'] for r in results], [True, False, False])
+            self.assertIn('length', results[1]['failed'])
+            self.assertIn('sequential', results[2]['failed'])
+
+    def test_validate_policy(self):
+        """Test that a named policy is applied and unknown ones are rejected"""
+        with self.client() as client:
+            self.assertFalse(client.validate("MyStr0ng!Pass", policy="strict")['valid'])
+            with self.assertRaises(DaemonError) as cm:
+                client.validate("MyStr0ng!Pass", policy="no-such-policy")
+            self.assertEqual(cm.exception.status, 400)
+            with self.assertRaises(DaemonError) as cm:
+                client.validate("MyStr0ng!Pass", policy=["strict"])
+            self.assertEqual(cm.exception.status, 400)
+
+    def test_hash(self):
+        """Test SHA-256 and slow-scheme hashing"""
+        with self.client() as client:
+            self.assertEqual(client.hash("secret"), hash_password("secret"))
+            self.assertEqual(client.hash(["a", "b"]), [hash_password("a"), hash_password("b")])
+            encoded = client.hash("secret", scheme="pbkdf2-sha256")
+            self.assertTrue(verify_password("secret", encoded))
+            with self.assertRaises(DaemonError):
+                client.hash("secret", scheme="md5")
+
+    def test_hash_batch_beyond_queue(self):
+        """Test slow-scheme batches larger than the pool's queue, and one pool per scheme"""
+        service = PassGuardService(index_path=os.path.join(self.tmp.name, 'missing.idx'))
+        service.hashers['pbkdf2-sha256'] = AsyncHasher(max_queue=4, scheme='pbkdf2-sha256', i=1000)
+        passwords = [f"pw{i}" for i in range(50)]
+        try:
+            status, result = asyncio.run(service.hash({'passwords': passwords,
+                                                       'scheme': 'pbkdf2-sha256'}))
+            self.assertEqual(status, 200)
+            self.assertTrue(verify_password(passwords[-1], result['hashes'][-1]))
+            asyncio.run(service.hash({'password': 'a', 'scheme': 'scrypt'}))
+            self.assertEqual(sorted(service.hashers), ['pbkdf2-sha256', 'scrypt'])
+        finally:
+            service.close()
+
+    def test_generate(self):
+        """Test generation and the batch limit"""
+        with self.client() as client:
+            passwords = client.generate(5, 16)
+            self.assertEqual(len(passwords), 5)
+            self.assertTrue(all(len(p) == 16 for p in passwords))
+            with self.assertRaises(DaemonError):
+                client.generate(101)
+            with self.assertRaises(DaemonError) as cm:
+                client.generate(1, 2000000)
+            self.assertEqual(cm.exception.status, 400)
+
+    def test_breach_check(self):
+        """Test lookups against the daemon's breach index"""
+        with self.client() as client:
+            self.assertEqual(client.breach_check("hunter2"), 2)
+            self.assertEqual(client.breach_check(["letmein", "not breached"]), [1, 0])
+
+    def test_http_and_errors(self):
+        """Test the HTTP listener and error statuses"""
+        host, port = next(a for a in self.service.listeners if isinstance(a, tuple))
+        with DaemonClient(host=host, port=port) as client:
+            self.assertEqual(client.health()['status'], 'ok')
+            with self.assertRaises(DaemonError) as cm:
+                client.request('GET', '/validate')
+            self.assertEqual(cm.exception.status, 405)
+            with self.assertRaises(DaemonError) as cm:
+                client.request('POST', '/nope', {})
+            self.assertEqual(cm.exception.status, 404)
+            with self.assertRaises(DaemonError) as cm:
+                client.request('POST', '/validate', {'passwords': 'not a list'})
+            self.assertEqual(cm.exception.status, 400)
+
+    def test_server_errors(self):
+        """Test that plain-text 500 and 413 responses surface as DaemonError"""
+        async def broken(request):
+            raise RuntimeError("handler bug")
+        self.service._routes[('POST', '/broken')] = broken
+        try:
+            with self.client() as client:
+                with self.assertRaises(DaemonError) as cm:
+                    client.request('POST', '/broken', {})
+                self.assertEqual(cm.exception.status, 500)
+                # Larger than httpd.MAX_BODY_SIZE: answered before the body is read
+                with self.assertRaises(DaemonError) as cm:
+                    client.validate(["x" * 1000] * 20000)
+                self.assertEqual(cm.exception.status, 413)
+                self.assertEqual(client.health()['status'], 'ok')
+        finally:
+            del self.service._routes[('POST', '/broken')]
+
+    def test_socket_path_protection(self):
+        """Test that only a stale socket is replaced, never a live one or a regular file"""
+        async def start(path):
+            server = await start_unix_server(self.service.handle, path)
+            server.close()
+            await server.wait_closed()
+
+        with self.assertRaises(FileExistsError):
+            asyncio.run(start(self.socket_path))
+        with self.client() as client:
+            self.assertEqual(client.health()['status'], 'ok')
+
+        regular = os.path.join(self.tmp.name, 'regular.sock')
+        with open(regular, 'w') as f:
+            f.write("keep me")
+        with self.assertRaises(FileExistsError):
+            asyncio.run(start(regular))
+        self.assertTrue(os.path.isfile(regular))
+
+        stale = os.path.join(self.tmp.name, 'stale.sock')
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(stale)
+        sock.close()
+        asyncio.run(start(stale))
+
+    def test_metrics(self):
+        """Test that the daemon records metrics and serves them as Prometheus text"""
+        with self.client() as client:
+            client.validate(["MyStr0ng!Pass", "short"])
+            text = client.metrics()
+        self.assertIn('# TYPE pypassguard_validations_total counter', text)
+        self.assertIn('pypassguard_validation_failures_total{check="length"}', text)
+        self.assertIn('pypassguard_daemon_requests_total{endpoint="/validate",status="200"}', text)
+
+if __name__ == '__main__':
+    unittest.main()
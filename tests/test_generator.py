@@ -2,11 +2,12 @@ import unittest
 import sys
 import os
 import re
+import io
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from generator import generate_password, generate_multiple_passwords
+from pypassguard.generator import BULK_BLOCK_SIZE, generate_password, generate_multiple_passwords, generate_passwords_bulk, write_passwords
 
 class TestGenerator(unittest.TestCase):
     
@@ -61,6 +62,41 @@ class TestGenerator(unittest.TestCase):
         """Test error handling for invalid length"""
         with self.assertRaises(ValueError):
             generate_password(3)
+        with self.assertRaises(ValueError):
+            list(generate_passwords_bulk(1, 3))
+    
+    def test_bulk_generation(self):
+        """Test that bulk passwords have the right length and character types"""
+        for include_special in (True, False):
+            passwords = list(generate_passwords_bulk(500, 4, include_special))
+            self.assertEqual(len(passwords), 500)
+            for password in passwords:
+                self.assertEqual(len(password), 4)
+                self.assertTrue(any(c.islower() for c in password))
+                self.assertTrue(any(c.isupper() for c in password))
+                self.assertTrue(any(c.isdigit() for c in password))
+                has_special = any(c in '!@#$%^&*()_+-=[]{};:,.<>?' for c in password)
+                self.assertEqual(has_special, include_special)
+    
+    def test_bulk_uses_whole_pool(self):
+        """Test that every pool character can be produced"""
+        chars = set(''.join(generate_passwords_bulk(2000, 16)))
+        self.assertEqual(len(chars), 26 + 26 + 10 + len('!@#$%^&*()_+-=[]{};:,.<>?'))
+    
+    def test_bulk_longer_than_block(self):
+        """Test lengths beyond one block of randomness, and many lengths that straddle blocks"""
+        self.assertEqual(len(next(generate_passwords_bulk(1, 2 * BULK_BLOCK_SIZE))), 2 * BULK_BLOCK_SIZE)
+        passwords = list(generate_passwords_bulk(20000, 97))
+        self.assertEqual(len(passwords), 20000)
+        self.assertEqual({len(password) for password in passwords}, {97})
+    
+    def test_write_passwords(self):
+        """Test streaming bulk passwords to a file"""
+        out = io.StringIO()
+        self.assertEqual(write_passwords(out, 100, 10), 100)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 100)
+        self.assertTrue(all(len(line) == 10 for line in lines))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,7 +5,9 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from hasher import hash_password
+from pypassguard.hasher import (hash_password, encode_password, verify_password, needs_rehash,
+                    calibrate, get_hasher, PasswordHasher, Pbkdf2Hasher, ScryptHasher)
+from pypassguard.config import HASHER_SETTINGS
 
 class TestHasher(unittest.TestCase):
     
@@ -32,6 +34,60 @@ class TestHasher(unittest.TestCase):
         different_password = "test124"
         different_hash = hash_password(different_password)
         self.assertNotEqual(hashed, different_hash)
+    
+    def test_encode_and_verify(self):
+        """Test salted hashing and verification for every scheme"""
+        for hasher in (Pbkdf2Hasher(1000), ScryptHasher(ln=8)):
+            encoded = hasher.encode("s3cret")
+            self.assertTrue(encoded.startswith(f"${hasher.scheme}$"))
+            self.assertTrue(verify_password("s3cret", encoded))
+            self.assertFalse(verify_password("s3cret!", encoded))
+            # A fresh salt makes every hash unique
+            self.assertNotEqual(encoded, hasher.encode("s3cret"))
+    
+    def test_default_scheme(self):
+        """Test encode_password with the configured scheme"""
+        encoded = encode_password("s3cret")
+        self.assertTrue(encoded.startswith(f"${HASHER_SETTINGS['scheme']}$"))
+        self.assertTrue(verify_password("s3cret", encoded))
+        self.assertFalse(needs_rehash(encoded))
+    
+    def test_needs_rehash(self):
+        """Test detection of outdated schemes and work factors"""
+        weak_scrypt = ScryptHasher(ln=8).encode("s3cret")
+        weak_pbkdf2 = Pbkdf2Hasher(1000).encode("s3cret")
+        self.assertTrue(needs_rehash(weak_scrypt))
+        self.assertTrue(needs_rehash(weak_pbkdf2))
+    
+    def test_invalid_hashes(self):
+        """Test error handling for malformed or unknown hashes"""
+        for encoded in ("plain", "$bogus$x$y$z", "$scrypt$ln=8$c2FsdA$aGFzaA"):
+            with self.assertRaises(ValueError):
+                verify_password("s3cret", encoded)
+        with self.assertRaises(ValueError):
+            get_hasher("md5")
+    
+    def test_explicit_arguments(self):
+        """Test that explicit falsy arguments are used or rejected, never replaced"""
+        encoded = Pbkdf2Hasher(1000).encode("s3cret", salt=b'')
+        self.assertEqual(encoded.split('$')[3], '')
+        self.assertTrue(verify_password("s3cret", encoded))
+        for params in ({'i': 0}, {'i': '1000'}):
+            with self.assertRaises(ValueError):
+                Pbkdf2Hasher(**params)
+        with self.assertRaises(ValueError):
+            ScryptHasher(r=0)
+        with self.assertRaises(ValueError):
+            get_hasher('')
+        with self.assertRaises(TypeError):
+            PasswordHasher()
+    
+    def test_calibrate(self):
+        """Test that calibration returns usable parameters"""
+        params = calibrate(5, 'pbkdf2-sha256')
+        self.assertGreaterEqual(params['i'], 1000)
+        encoded = get_hasher('pbkdf2-sha256', **params).encode("s3cret")
+        self.assertTrue(verify_password("s3cret", encoded))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
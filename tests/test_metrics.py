@@ -0,0 +1,138 @@
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard import metrics
+from pypassguard.generator import generate_password, generate_passwords_bulk
+from pypassguard.hasher import hash_password
+from pypassguard.policy import get_policy
+from pypassguard.validator import validate_password, validate_password_mask
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_disabled_records_nothing(self):
+        """Test that nothing is recorded while metrics are disabled"""
+        metrics.disable()
+        validate_password_mask("short")
+        hash_password("secret")
+        generate_password(12)
+        self.assertEqual(metrics.VALIDATIONS.value('rejected'), 0)
+        self.assertEqual(metrics.HASH_SECONDS.count('sha256', 'hash'), 0)
+        self.assertEqual(metrics.GENERATED.value('single'), 0)
+        self.assertIs(metrics.timer(metrics.HASH_SECONDS, 'sha256', 'hash'),
+                      metrics.timer(metrics.LOOKUP_SECONDS, 'breach'))
+
+    def test_validation_outcomes(self):
+        """Test outcome counters, rejection reasons and per-stage timings"""
+        validate_password("MyStr0ng!Pass")
+        validate_password("abc")
+        self.assertEqual(metrics.VALIDATIONS.value('valid'), 1)
+        self.assertEqual(metrics.VALIDATIONS.value('rejected'), 1)
+        self.assertEqual(metrics.REJECTIONS.value('length'), 1)
+        self.assertEqual(metrics.REJECTIONS.value('sequential'), 1)
+        self.assertEqual(metrics.REJECTIONS.value('lowercase'), 0)
+        for stage in ('classes', 'sequential', 'common_patterns'):
+            self.assertEqual(metrics.CHECK_SECONDS.count(stage), 2)
+
+    def test_instrumented_matches_check(self):
+        """Test that the instrumented rule check agrees with the plain one"""
+        rules = get_policy('default').rules
+        passwords = list(generate_passwords_bulk(200, 10)) + [
+            "", "short", "abc", "password1", "MyStr0ng!Pass", "qwerty123", "Ünïcödé7!", "x" * 300]
+        for password in passwords:
+            self.assertEqual(rules.check_instrumented(password), rules.check(password), password)
+        self.assertEqual(metrics.VALIDATIONS.value('valid') + metrics.VALIDATIONS.value('rejected'),
+                         len(passwords))
+
+    def test_policy_checks(self):
+        """Test that policy profiles are instrumented too"""
+        get_policy('strict').check("MyStr0ng!Pass")
+        self.assertEqual(metrics.VALIDATIONS.value('rejected'), 1)
+        self.assertGreaterEqual(metrics.LOOKUPS.value('policy', 'hit') +
+                                metrics.LOOKUPS.value('policy', 'miss'), 1)
+
+    def test_hash_and_generate(self):
+        """Test hashing and generation timings and counts"""
+        hash_password("secret")
+        generate_password(12)
+        passwords = list(generate_passwords_bulk(50, 12))
+        self.assertEqual(len(passwords), 50)
+        self.assertEqual(metrics.HASH_SECONDS.count('sha256', 'hash'), 1)
+        self.assertEqual(metrics.GENERATED.value('single'), 1)
+        self.assertEqual(metrics.GENERATED.value('bulk'), 50)
+        self.assertEqual(metrics.GENERATE_SECONDS.count('bulk'), 1)
+
+    def test_prometheus_format(self):
+        """Test the text exposition format: headers, labels and cumulative buckets"""
+        counter = metrics.Counter('test_events_total', 'Events', ('kind',))
+        histogram = metrics.Histogram('test_seconds', 'Durations', buckets=(0.1, 1.0))
+        try:
+            counter.inc('a "quoted" kind', amount=2)
+            histogram.observe(0.05)
+            histogram.observe(0.5)
+            histogram.observe(5)
+            lines = metrics.render_prometheus().splitlines()
+        finally:
+            metrics.REGISTRY.remove(counter)
+            metrics.REGISTRY.remove(histogram)
+        self.assertIn('# TYPE test_events_total counter', lines)
+        self.assertIn('test_events_total{kind="a \\"quoted\\" kind"} 2', lines)
+        self.assertIn('# TYPE test_seconds histogram', lines)
+        self.assertIn('test_seconds_bucket{le="0.1"} 1', lines)
+        self.assertIn('test_seconds_bucket{le="1"} 2', lines)
+        self.assertIn('test_seconds_bucket{le="+Inf"} 3', lines)
+        self.assertIn('test_seconds_sum 5.55', lines)
+        self.assertIn('test_seconds_count 3', lines)
+
+class TestCommandLine(unittest.TestCase):
+
+    def run_main(self, *args):
+        return subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), *args],
+                              capture_output=True, text=True, check=True)
+
+    def test_profile_report(self):
+        """Test that --profile writes a sorted cProfile report"""
+        with tempfile.TemporaryDirectory() as tmp:
+            report = os.path.join(tmp, 'profile.txt')
+            result = self.run_main('validate', 'MyStr0ng!Pass', '--profile-output', report,
+                                   '--profile-sort', 'tottime')
+            self.assertIn('Valid Password', result.stdout)
+            with open(report) as f:
+                text = f.read()
+        self.assertIn('Ordered by: internal time', text)
+        self.assertIn('function calls', text)
+
+    def test_switches_leave_password_alone(self):
+        """Test that a password after --profile/--metrics is validated, never used as a path"""
+        with tempfile.TemporaryDirectory() as tmp:
+            result = subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), 'validate',
+                                     '--profile', '--metrics', 'MyStr0ng!Pass'],
+                                    capture_output=True, text=True, check=True, cwd=tmp)
+            self.assertEqual(os.listdir(tmp), [])
+        self.assertIn('Valid Password', result.stdout)
+        self.assertIn('function calls', result.stderr)
+        self.assertIn('pypassguard_validations_total', result.stderr)
+
+    def test_metrics_dump(self):
+        """Test that --metrics dumps the run's metrics in Prometheus text format"""
+        result = self.run_main('hash', 'secret', '--metrics')
+        self.assertIn('pypassguard_hash_seconds_count{scheme="sha256",operation="hash"} 1',
+                      result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.parallel import chunked, parallel_map, validate_many_parallel, generate_passwords_parallel
+from pypassguard.validator import validate_many
+
+def square(x):
+    return x * x
+
+class TestParallel(unittest.TestCase):
+    
+    def test_chunked(self):
+        """Test lazy chunking"""
+        self.assertEqual(list(chunked(range(7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(chunked([], 3)), [])
+    
+    def test_parallel_map_ordering(self):
+        """Test ordered and unordered result streams"""
+        ordered = list(parallel_map(square, range(50), workers=2, max_pending=3))
+        self.assertEqual(ordered, [(x, x * x) for x in range(50)])
+        
+        unordered = parallel_map(square, range(50), workers=2, ordered=False)
+        self.assertEqual(sorted(unordered), [(x, x * x) for x in range(50)])
+    
+    def test_invalid_workers(self):
+        """Test error handling for an invalid worker count"""
+        with self.assertRaises(ValueError):
+            list(parallel_map(square, range(3), workers=0))
+    
+    def test_validate_many_parallel(self):
+        """Test that parallel validation matches validate_many"""
+        passwords = ["Str0ng!Pw@x", "weak", "password123", "NoDigitsHere!"] * 25
+        expected = list(validate_many(passwords))
+        
+        self.assertEqual(list(validate_many_parallel(passwords, 2, chunk_size=7)), expected)
+        unordered = validate_many_parallel(passwords, 2, chunk_size=7, ordered=False)
+        self.assertEqual(sorted(unordered), sorted(expected))
+    
+    def test_generate_passwords_parallel(self):
+        """Test parallel generation count and length"""
+        passwords = list(generate_passwords_parallel(1001, 10, workers=2, chunk_size=100))
+        self.assertEqual(len(passwords), 1001)
+        self.assertTrue(all(len(p) == 10 for p in passwords))
+        self.assertEqual(len(set(passwords)), 1001)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+import tempfile
+import math
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.passphrase import (WordList, WordListError, build_word_list, open_word_list,
+                                    parse_words)
+
+WORDS = ['otter', 'maple', 'crisp', 'lunar', 'vivid', 'oak', 'café']
+
+class TestPassphrase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp.name, 'words.txt')
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write('# comment\n\n' + '\n'.join(WORDS + ['oak']) + '\n')
+        self.path = os.path.join(self.tmp.name, 'words.ppw')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_build_and_index(self):
+        """Test that words round-trip through the mapped format, deduplicated"""
+        self.assertEqual(build_word_list([self.source], self.path), len(WORDS))
+        with WordList(self.path) as wordlist:
+            self.assertEqual([wordlist[i] for i in range(len(wordlist))], WORDS)
+            with self.assertRaises(IndexError):
+                wordlist[len(WORDS)]
+
+    def test_parse_diceware(self):
+        """Test that dice-roll prefixes are dropped"""
+        self.assertEqual(list(parse_words(['11111\tabacus', '11112 abdomen', 'plain'])),
+                         ['abacus', 'abdomen', 'plain'])
+
+    def test_passphrase(self):
+        """Test word count, separator and entropy"""
+        build_word_list([self.source], self.path)
+        with WordList(self.path) as wordlist:
+            phrase = wordlist.passphrase(5, ' ')
+            self.assertEqual(len(phrase.split(' ')), 5)
+            self.assertTrue(set(phrase.split(' ')) <= set(WORDS))
+            self.assertAlmostEqual(wordlist.entropy(5), 5 * math.log2(len(WORDS)))
+            with self.assertRaises(ValueError):
+                wordlist.passphrase(0)
+
+    def test_bulk_uses_every_word(self):
+        """Test bulk generation count and that every word is reachable"""
+        build_word_list([self.source], self.path)
+        with WordList(self.path) as wordlist:
+            phrases = list(wordlist.passphrases_bulk(500, 4, '-'))
+        self.assertEqual(len(phrases), 500)
+        seen = {word for phrase in phrases for word in phrase.split('-')}
+        self.assertEqual(seen, set(WORDS))
+
+    def test_open_plain_text(self):
+        """Test that plain-text lists are compiled transparently"""
+        with open_word_list(self.source) as wordlist:
+            self.assertEqual(len(wordlist), len(WORDS))
+        with open_word_list() as wordlist:
+            self.assertEqual(len(wordlist), 2048)
+
+    def test_invalid_file(self):
+        """Test error handling for files that are not word lists"""
+        with open(self.path, 'wb') as f:
+            f.write(b'not a word list at all')
+        with self.assertRaises(WordListError):
+            WordList(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
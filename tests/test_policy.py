@@ -0,0 +1,108 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard import rules
+from pypassguard.policy import Policy, PolicyError, PolicyStore, parse_policy_file
+
+class TestPolicy(unittest.TestCase):
+    
+    def test_compiled_policy(self):
+        """Test that settings override the defaults and compile into checks"""
+        policy = Policy('long', {'min_length': 12, 'require_special_chars': False})
+        self.assertEqual(policy.check("Xq7mZp2wKv9t"), 0)
+        self.assertEqual(policy.check("Xq7mZp2w"), rules.LENGTH)
+        is_valid, results = policy.validate("Xq7mZp2w")
+        self.assertFalse(is_valid)
+        self.assertFalse(results['length'])
+    
+    def test_policy_blocklist(self):
+        """Test per-policy blocklist patterns, with leetspeak normalization"""
+        policy = Policy('corp', {'blocklist': ['acmecorp']})
+        self.assertEqual(policy.check("Xq7!@cm3c0rpZ"), rules.COMMON_PATTERNS)
+        self.assertEqual(Policy('plain', {}).check("Xq7!acmecorpZ"), 0)
+    
+    def test_digest_and_immutability(self):
+        """Test that identical settings share a digest and policies are read-only"""
+        a = Policy('a', {'min_length': 10})
+        b = Policy('b', {'min_length': 10, 'version': 1})
+        self.assertEqual(a.digest, b.digest)
+        self.assertNotEqual(a.digest, Policy('c', {'min_length': 11}).digest)
+        with self.assertRaises(AttributeError):
+            a.name = 'changed'
+    
+    def test_invalid_settings(self):
+        """Test that unknown or malformed settings are rejected"""
+        with self.assertRaises(PolicyError):
+            Policy('bad', {'min_lenght': 10})
+        with self.assertRaises(PolicyError):
+            Policy('bad', {'keyboards': ['colemak']})
+        for settings in ({'min_length': "8"}, {'min_length': True}, {'min_length': -1},
+                         {'leet': 1}, {'blocklist': "acmecorp"}, {'special_chars': None}):
+            with self.assertRaises(PolicyError):
+                Policy('bad', settings)
+        self.assertEqual(Policy('none', {'blocklist_file': None}).check("Xq7!mZp2wKv9"), 0)
+
+class TestPolicyStore(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+        self.write('tenant-a.toml', 'version = 1\nmin_length = 10\n')
+        self.write('tenant-b.json', json.dumps({'version': 1, 'min_length': 10}))
+        self.store = PolicyStore(self.directory, cache_size=2, check_interval=0)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        mtime = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+        with open(path, 'w') as f:
+            f.write(text)
+        # Make sure the change is visible even on coarse-grained filesystems
+        os.utime(path, ns=(0, max(os.stat(path).st_mtime_ns, mtime + 10**9)))
+    
+    def test_get_and_share(self):
+        """Test loading both formats and sharing identical compiled policies"""
+        a = self.store.get('tenant-a')
+        self.assertIs(self.store.get('tenant-a'), a)
+        self.assertIs(self.store.get('tenant-b'), a)
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self.store.names(), ['tenant-a', 'tenant-b'])
+        self.assertEqual(self.store.hits, 2)
+    
+    def test_reload_on_change(self):
+        """Test that edits are picked up and broken edits keep the last good version"""
+        self.assertEqual(self.store.get('tenant-a').settings['min_length'], 10)
+        self.write('tenant-a.toml', 'version = 2\nmin_length = 16\n')
+        self.assertEqual(self.store.get('tenant-a').settings['min_length'], 16)
+        self.write('tenant-a.toml', 'min_length = ')
+        self.assertEqual(self.store.get('tenant-a').settings['version'], 2)
+    
+    def test_lru_eviction(self):
+        """Test that the compiled cache stays bounded and recompiles on demand"""
+        self.write('c.json', '{"min_length": 20}')
+        self.write('d.json', '{"min_length": 30}')
+        for name in ('tenant-a', 'c', 'd'):
+            self.store.get(name)
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.get('tenant-a').settings['min_length'], 10)
+    
+    def test_missing_and_invalid(self):
+        """Test errors for unknown names, path tricks and bad files"""
+        with self.assertRaises(PolicyError):
+            self.store.get('missing')
+        with self.assertRaises(PolicyError):
+            self.store.get('../tenant-a')
+        self.write('broken.json', '[1, 2]')
+        with self.assertRaises(PolicyError):
+            parse_policy_file(os.path.join(self.directory, 'broken.json'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+import asyncio
+import hashlib
+import tempfile
+import threading
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.range_server import RangeServer, RangeStore
+from pypassguard.range_client import RangeClient, TTLCache
+
+BREACHED = {"hunter2": 17, "letmein": 3, "password": 9000}
+
+class TestRange(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        """Write a range store and serve it from a background event loop"""
+        cls.tmp = tempfile.TemporaryDirectory()
+        for password, count in BREACHED.items():
+            digest = hashlib.sha1(password.encode()).hexdigest().upper()
+            with open(os.path.join(cls.tmp.name, digest[:5] + '.txt'), 'a') as f:
+                f.write(f"{digest[5:]}:{count}\r\n")
+        
+        cls.server = RangeServer(RangeStore(cls.tmp.name))
+        cls.loop = asyncio.new_event_loop()
+        cls.http = cls.loop.run_until_complete(cls.server.start())
+        cls.port = cls.http.sockets[0].getsockname()[1]
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        async def shutdown():
+            cls.http.close()
+            await cls.http.wait_closed()
+        asyncio.run_coroutine_threadsafe(shutdown(), cls.loop).result()
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.loop.close()
+        cls.tmp.cleanup()
+    
+    def client(self, **kwargs):
+        return RangeClient(f"http://127.0.0.1:{self.port}/range/", **kwargs)
+    
+    def test_lookup(self):
+        """Test single lookups against the local range server"""
+        with self.client() as client:
+            self.assertEqual(client.lookup("hunter2"), 17)
+            self.assertEqual(client.lookup("password"), 9000)
+            self.assertEqual(client.lookup("not breached at all"), 0)
+    
+    def test_lookup_many_deduplicates(self):
+        """Test that batch lookups fetch each prefix once"""
+        served = self.server.requests_served
+        passwords = ["hunter2", "letmein", "hunter2", "hunter2", "safe-one"]
+        with self.client() as client:
+            self.assertEqual(client.lookup_many(passwords), [17, 3, 17, 17, 0])
+            self.assertEqual(self.server.requests_served - served, 3)
+            
+            # A repeat batch is served entirely from the client cache
+            client.lookup_many(passwords)
+            self.assertEqual(self.server.requests_served - served, 3)
+            self.assertGreaterEqual(client.cache.hits, 3)
+    
+    def test_bad_prefix(self):
+        """Test that malformed paths are rejected"""
+        with self.client() as client:
+            response = client.session.get(f"http://127.0.0.1:{self.port}/range/XYZ")
+            self.assertEqual(response.status_code, 404)
+    
+    def test_ttl_cache(self):
+        """Test LRU eviction and TTL expiry"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        
+        expired = TTLCache(ttl=-1)
+        expired.put('a', 1)
+        self.assertIsNone(expired.get('a'))
+
+if __name__ == '__main__':
+    unittest.main()
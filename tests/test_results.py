@@ -0,0 +1,86 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.results import BatchResult, result_for_mask
+from pypassguard.rules import LENGTH, SEQUENTIAL
+from pypassguard.validator import (validate_batch, validate_password, validate_password_result,
+                                   validate_password_with_feedback, get_validation_feedback)
+
+PASSWORDS = ["MyStr0ng!Pass", "weak", "password123", "NoDigitsHere!", "abc123!", "Xy7!kkP0qz"]
+
+class TestValidationResult(unittest.TestCase):
+
+    def test_matches_dict_view(self):
+        """Test that the result agrees with validate_password and its feedback"""
+        for password in PASSWORDS:
+            result = validate_password_result(password)
+            is_valid, details = validate_password(password)
+            self.assertEqual(result.valid, is_valid)
+            self.assertEqual(result.as_dict(), details)
+            self.assertEqual(result.failed, tuple(k for k, v in details.items() if not v))
+            self.assertEqual(list(result.feedback), validate_password_with_feedback(password)[1])
+            for check, passed in details.items():
+                self.assertEqual(result.passed(check), passed)
+
+    def test_shared_and_immutable(self):
+        """Test that results are cached per mask and cannot be modified"""
+        self.assertIs(validate_password_result("weak"), validate_password_result("tiny"))
+        result = validate_password_result("weak")
+        with self.assertRaises(AttributeError):
+            result.valid = True
+
+    def test_feedback_follows_requirements(self):
+        """Test that feedback text uses the requirements it was checked against"""
+        default = result_for_mask(LENGTH)
+        strict = result_for_mask(LENGTH, {'min_length': 16, 'special_chars': '!'})
+        self.assertIn("at least 8 characters", default.feedback[0])
+        self.assertIn("at least 16 characters", strict.feedback[0])
+        self.assertIn("at least 14 characters",
+                      validate_password_result("Short!1aZ", "strict").feedback[0])
+
+    def test_feedback_list_is_fresh(self):
+        """Test that the compatibility list can be modified without side effects"""
+        _, details = validate_password("weak")
+        get_validation_feedback(details).clear()
+        self.assertTrue(get_validation_feedback(details))
+
+class TestBatchResult(unittest.TestCase):
+
+    def test_aggregates(self):
+        """Test per-check failure counts against single validations"""
+        batch = validate_batch(PASSWORDS)
+        self.assertEqual(len(batch), len(PASSWORDS))
+        self.assertEqual(batch.masks.itemsize, 1)
+        expected = {}
+        for password in PASSWORDS:
+            for check, passed in validate_password(password)[1].items():
+                expected[check] = expected.get(check, 0) + (not passed)
+        self.assertEqual(batch.failure_counts(), expected)
+        summary = batch.summary()
+        valid = sum(validate_password(p)[0] for p in PASSWORDS)
+        self.assertEqual((summary['valid'], summary['invalid']), (valid, len(PASSWORDS) - valid))
+        self.assertAlmostEqual(summary['failure_rates']['length'], expected['length'] / len(PASSWORDS))
+
+    def test_row_views(self):
+        """Test that rows come back as results and as validate_password dicts"""
+        batch = validate_batch(PASSWORDS)
+        for password, result, details in zip(PASSWORDS, batch, batch.as_dicts()):
+            self.assertIs(result, validate_password_result(password))
+            self.assertEqual(details, validate_password(password)[1])
+        self.assertIs(batch[1], validate_password_result("weak"))
+
+    def test_extend_and_empty(self):
+        """Test building a batch incrementally from masks"""
+        batch = BatchResult()
+        self.assertEqual(batch.summary()['failure_rates']['length'], 0.0)
+        batch.extend([0, LENGTH, LENGTH | SEQUENTIAL])
+        self.assertEqual(batch.valid_count, 1)
+        self.assertEqual(batch.mask_counts(), {0: 1, LENGTH: 1, LENGTH | SEQUENTIAL: 1})
+        self.assertEqual(batch.failure_counts()['sequential'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard import rules
+from pypassguard.rules import CompiledRules, FAILED_NAMES, results_from_mask
+
+REQUIREMENTS = {
+    'min_length': 8,
+    'require_uppercase': True,
+    'require_lowercase': True,
+    'require_digits': True,
+    'require_special_chars': True,
+    'special_chars': '!@#$%^&*'
+}
+
+class TestRules(unittest.TestCase):
+    
+    def setUp(self):
+        self.rules = CompiledRules(REQUIREMENTS)
+    
+    def test_valid_password(self):
+        """Test that a password meeting every rule has an empty mask"""
+        self.assertEqual(self.rules.check("Xq7!mZp2w"), 0)
+    
+    def test_class_failures(self):
+        """Test that missing character classes set their bits"""
+        self.assertEqual(self.rules.check("xq7!mzp2w"), rules.UPPERCASE)
+        self.assertEqual(self.rules.check("XQ7!MZP2W"), rules.LOWERCASE)
+        self.assertEqual(self.rules.check("Xq!mZpgw"), rules.DIGITS)
+        self.assertEqual(self.rules.check("Xq7mZp2w"), rules.SPECIAL)
+        self.assertEqual(self.rules.check("Xq7!"), rules.LENGTH)
+    
+    def test_optional_classes(self):
+        """Test that classes which are not required never fail"""
+        relaxed = dict(REQUIREMENTS, require_special_chars=False, require_uppercase=False)
+        self.assertEqual(CompiledRules(relaxed).check("xq7mzp2w"), 0)
+    
+    def test_sequential(self):
+        """Test sequence detection, including case-insensitive runs"""
+        for password in ["Xq7!abcw", "Xq7!AbCw", "Xq!789mw"]:
+            self.assertTrue(self.rules.check(password) & rules.SEQUENTIAL, password)
+        self.assertFalse(self.rules.check("Xq7!ab9w") & rules.SEQUENTIAL)
+    
+    def test_sequential_matches_detector(self):
+        """Test that pair bits built during the class walk agree with contains_any"""
+        detector = self.rules.sequences
+        long_run = "Xq7!" + "qwertyuiop" * 14
+        for password in ["", "a", "ab", "abc", "1qaz", "ñop", "Xq7!mZp2w", "zyx9!", long_run,
+                         long_run[:-1] + "é", "Ünïcödé7!", "()*", "@[\\"]:
+            self.assertEqual(bool(self.rules.check(password) & rules.SEQUENTIAL),
+                             detector.contains_any(password), password)
+
+    def test_non_ascii(self):
+        """Test that characters outside the precomputed table are classified"""
+        self.assertEqual(self.rules.check("Ünïcödé7!"), 0)
+    
+    def test_weak_pattern_hook(self):
+        """Test that the weak-pattern callback contributes its bit"""
+        engine = CompiledRules(REQUIREMENTS, lambda password: 'bad' in password)
+        self.assertEqual(engine.check("Xq7!mbadw"), rules.COMMON_PATTERNS)
+    
+    def test_mask_views(self):
+        """Test the dict and name views of a failure mask"""
+        mask = rules.LENGTH | rules.DIGITS
+        self.assertEqual(FAILED_NAMES[mask], ('length', 'digits'))
+        view = results_from_mask(mask)
+        self.assertFalse(view['length'])
+        self.assertFalse(view['digits'])
+        self.assertTrue(view['uppercase'])
+        self.assertEqual(len(view), 7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.sequences import SequenceDetector
+
+class TestSequenceDetector(unittest.TestCase):
+    
+    def setUp(self):
+        self.detector = SequenceDetector()
+    
+    def test_ascending_and_descending(self):
+        """Test case-insensitive runs in both directions, including punctuation"""
+        for password in ["Xq!abcw", "xAbCx", "x789y", "zyx!", "!543", "a()*b", "x+,-y", "/01", "Yz{"]:
+            self.assertTrue(self.detector.contains_any(password), password)
+        for password in ["ab9", "aceg", "xy", "", "Ünïcödé7!", "?@A", "YZ[", "@[\\"]:
+            self.assertFalse(self.detector.contains_any(password), password)
+    
+    def test_keyboard_walks(self):
+        """Test walks on each supported layout"""
+        self.assertEqual(self.detector.find_all("xqwer"), [(1, 5, 'qwerty')])
+        self.assertIn((0, 4, 'qwerty'), self.detector.find_all("1qaz"))
+        self.assertIn((0, 4, 'azerty'), self.detector.find_all("azer"))
+        self.assertIn((0, 4, 'dvorak'), self.detector.find_all("aoeu"))
+        self.assertTrue(self.detector.contains_any("!QAZ"))
+    
+    def test_find_all_spans(self):
+        """Test that every maximal run is reported with its span and kind"""
+        matches = SequenceDetector(keyboards=()).find_all("abcd!987")
+        self.assertEqual(matches, [(0, 4, 'ascending'), (5, 8, 'descending')])
+    
+    def test_min_lengths(self):
+        """Test separate minimums for sequences and keyboard walks"""
+        detector = SequenceDetector(3, keyboard_min_length=5, keyboards=('qwerty',))
+        self.assertFalse(detector.contains_any("qwer"))
+        self.assertTrue(detector.contains_any("qwert"))
+        self.assertTrue(detector.contains_any("xabc"))
+        self.assertEqual(detector.find_all("qwer"), [])
+        with self.assertRaises(ValueError):
+            SequenceDetector(1)
+
+if __name__ == '__main__':
+    unittest.main()
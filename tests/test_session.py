@@ -0,0 +1,97 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard import validator
+from pypassguard.config import PASSWORD_REQUIREMENTS
+from pypassguard.session import ValidationSession
+from pypassguard.validator import (get_validation_feedback, validate_password,
+                                   validate_password_mask)
+
+class TestValidationSession(unittest.TestCase):
+
+    def test_typing_matches_full_validation(self):
+        """Test that every keystroke and backspace gives the from-scratch mask"""
+        session = ValidationSession()
+        typed = ''
+        for char in 'abcdPassw0rd!123qwerty':
+            session.append(char)
+            typed += char
+            self.assertEqual(session.mask(), validate_password_mask(typed), typed)
+        while typed:
+            session.backspace()
+            typed = typed[:-1]
+            self.assertEqual(session.mask(), validate_password_mask(typed), typed)
+
+    def test_middle_edits(self):
+        """Test inserts, deletes and replacements away from the end"""
+        session = ValidationSession('Xq7!mZp2wKv9')
+        self.assertEqual(session.mask(), 0)
+        session.insert(4, 'abcd')
+        self.assertEqual(session.password, 'Xq7!abcdmZp2wKv9')
+        self.assertEqual(session.mask(), validate_password_mask(session.password))
+        session.replace(4, 8, 'passw0rd')
+        self.assertEqual(session.mask(), validate_password_mask(session.password))
+        session.delete(4, 12)
+        self.assertEqual(session.password, 'Xq7!mZp2wKv9')
+        self.assertEqual(session.mask(), 0)
+        with self.assertRaises(IndexError):
+            session.delete(20)
+
+    def test_update_and_feedback(self):
+        """Test whole-value updates and feedback equal to get_validation_feedback"""
+        session = ValidationSession()
+        for text in ['p', 'pa', 'Pass', 'Passw0rd!', 'Xassw0rd!', 'Xq7mZp2w!K', '']:
+            session.update(text)
+            self.assertEqual(session.password, text)
+            is_valid, results = validate_password(text)
+            self.assertEqual(session.validate(), (is_valid, results))
+            self.assertEqual(session.feedback(), get_validation_feedback(results))
+            self.assertEqual(session.result().valid, is_valid)
+
+    def test_irregular_characters(self):
+        """Test characters whose case folding changes length or context"""
+        session = ValidationSession()
+        for text in ['XqİİPASSWORD7!', 'ΣPASSWORDΣ7!k', 'Xq7!p\0ssword', 'Xq7!mZp2wKv9']:
+            session.update(text)
+            self.assertEqual(session.mask(), validate_password_mask(text), text)
+
+    def test_rebinds_after_rule_changes(self):
+        """Test that reload_requirements and load_blocklist reach open sessions"""
+        session = ValidationSession('Xq7!mZp2')
+        self.assertEqual(session.mask(), 0)
+        original = PASSWORD_REQUIREMENTS['min_length']
+        original_blocklist = validator._BLOCKLIST
+        try:
+            PASSWORD_REQUIREMENTS['min_length'] = 12
+            validator.reload_requirements()
+            self.assertEqual(session.mask(), validate_password_mask('Xq7!mZp2'))
+            self.assertFalse(session.result().valid)
+
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, 'words.txt')
+                with open(path, 'w') as f:
+                    f.write('zebrafish\n')
+                validator.load_blocklist(path)
+                session.update('Xq7!Zebrafish99')
+                self.assertFalse(session.result().valid)
+                self.assertIn('common_patterns', session.result().failed)
+        finally:
+            PASSWORD_REQUIREMENTS['min_length'] = original
+            validator.reload_requirements()
+            validator._BLOCKLIST = original_blocklist
+
+    def test_policy_session(self):
+        """Test sessions validating against a named policy profile"""
+        for text in ['Xq7!mZp2', 'Xq7mZp2wKv9tRs4', 'short']:
+            session = ValidationSession(text, policy='strict')
+            self.assertEqual(session.mask(), validate_password_mask(text, 'strict'), text)
+            session.backspace(3)
+            self.assertEqual(session.mask(), validate_password_mask(text[:-3], 'strict'), text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard import rules, validator
+from pypassguard.blocklist import Blocklist
+from pypassguard.config import COMMON_SUBSTITUTIONS, COMMON_WEAK_PATTERNS
+from pypassguard.policy import Policy
+from pypassguard.shared_blocklist import (SharedBlocklist, SharedBlocklistError, is_shared_blocklist,
+                                          open_blocklist, publish_blocklist)
+
+WORDS = ['acmecorp', 'Tr0ub4dor', 'zxcvbnm', 'hunter2', 'élan', 'Straße', 'p@55w0rd', '!@#$%']
+PASSWORDS = ['Xq7!@cm3c0rpZ', 'mytroubadorpass', 'ZXCVBNM', 'h|_|nter2', 'xxÉLANxx', 'STRASSE',
+             'strasse!', 'password99', 'Xq7!mZp2wKv9', '', 'ab', 'zxcvbn', 'ñandú🙂hello',
+             'Izeasb!Qx9', 'xx123456', 'iasz%!@#$%']
+
+class TestSharedBlocklist(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.words = os.path.join(self.tmp.name, 'words.txt')
+        with open(self.words, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(WORDS) + '\n')
+        self.shared = os.path.join(self.tmp.name, 'words.blocklist')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_blocklist(self):
+        """Test that a published file matches exactly what the word list matches"""
+        publish_blocklist(self.shared, COMMON_WEAK_PATTERNS, self.words, COMMON_SUBSTITUTIONS)
+        expected = Blocklist(COMMON_WEAK_PATTERNS, self.words, substitutions=COMMON_SUBSTITUTIONS)
+        shared = SharedBlocklist(self.shared)
+
+        self.assertTrue(is_shared_blocklist(self.shared))
+        self.assertFalse(is_shared_blocklist(self.words))
+        self.assertEqual(len(shared), len(expected))
+        for password in PASSWORDS:
+            self.assertEqual(shared.contains_any(password), expected.contains_any(password), password)
+            self.assertEqual(shared.find_all(password), expected.find_all(password), password)
+            self.assertEqual(shared.tracker(password).found(password),
+                             expected.contains_any(password), password)
+
+    def test_new_generation(self):
+        """Test that a republished file is swapped in whole on refresh"""
+        self.assertEqual(publish_blocklist(self.shared, ['acmecorp']), 1)
+        shared = SharedBlocklist(self.shared, reload_interval=0)
+        old_state = shared._state
+        self.assertEqual(shared.generation(), 1)
+        self.assertFalse(shared.contains_any('globexinc'))
+
+        self.assertEqual(publish_blocklist(self.shared, ['globexinc']), 2)
+        self.assertTrue(shared.contains_any('globexinc'))
+        self.assertFalse(shared.contains_any('acmecorp'))
+        self.assertEqual(shared.generation(), 2)
+        self.assertFalse(shared.refresh())
+        # Readers still holding the previous generation keep a valid mapping
+        self.assertTrue(old_state[4].contains_any('acmecorp'))
+
+    def test_bad_replacement_keeps_generation(self):
+        """Test that an invalid file at the published path keeps the last good generation"""
+        publish_blocklist(self.shared, ['acmecorp'])
+        shared = SharedBlocklist(self.shared, reload_interval=0)
+        os.replace(self.words, self.shared)
+        self.assertTrue(shared.contains_any('Xq7!acmecorp'))
+        self.assertEqual(shared.generation(), 1)
+        with self.assertRaises(SharedBlocklistError):
+            shared.refresh()
+
+        publish_blocklist(self.shared, ['globexinc'])
+        self.assertTrue(shared.contains_any('globexinc'))
+
+    def test_validator_and_policy(self):
+        """Test that load_blocklist and blocklist_file detect shared files"""
+        publish_blocklist(self.shared, COMMON_WEAK_PATTERNS, self.words, COMMON_SUBSTITUTIONS)
+        original = validator._BLOCKLIST
+        try:
+            self.assertEqual(validator.load_blocklist(self.shared),
+                             validator.load_blocklist(self.words))
+            validator.load_blocklist(self.shared)
+            self.assertIsInstance(validator._BLOCKLIST, SharedBlocklist)
+            is_valid, results = validator.validate_password("Xq7!@cm3c0rpZ")
+            self.assertFalse(is_valid)
+            self.assertFalse(results['common_patterns'])
+        finally:
+            validator._BLOCKLIST = original
+
+        policy = Policy('corp', {'blocklist_file': self.shared})
+        self.assertEqual(policy.check("Xq7!@cm3c0rpZ"), rules.COMMON_PATTERNS)
+        self.assertEqual(policy.check("Xq7!mZp2wKv9"), 0)
+        self.assertNotIsInstance(open_blocklist(self.words), SharedBlocklist)
+
+    def test_invalid_files(self):
+        """Test that truncated files and shared sources are rejected"""
+        publish_blocklist(self.shared, WORDS)
+        with open(self.shared, 'rb') as f:
+            data = f.read()
+        with open(self.shared, 'wb') as f:
+            f.write(data[:len(data) // 2])
+        with self.assertRaises(SharedBlocklistError):
+            SharedBlocklist(self.shared)
+
+        publish_blocklist(self.shared, WORDS)
+        with self.assertRaises(SharedBlocklistError):
+            publish_blocklist(os.path.join(self.tmp.name, 'copy.blocklist'), (), self.shared)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Budget for the package's own imports on a short CLI call, in milliseconds
+# (about 9 ms on a quiet host); generous because CI hosts are noisy
+STARTUP_BUDGET_MS = 40
+
+# Modules a plain `validate PASSWORD` must not pull in
+HEAVY_MODULES = ('pypassguard.policy', 'pypassguard.strength', 'pypassguard.breach',
+                 'pypassguard.parallel', 'tomllib', 'requests', 'multiprocessing')
+
+def import_times(*args):
+    """
+    Run main.py under `-X importtime` and parse its report.
+
+    The best of three warm runs is kept to ride out host noise.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Module -> (nesting depth, cumulative
+        import time in microseconds)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        # Bytecode and table caches are warm in real use; warm them first
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=os.path.join(tmp, 'pyc'),
+                   PYPASSGUARD_CACHE_DIR=os.path.join(tmp, 'tables'))
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        command = [sys.executable, '-X', 'importtime', os.path.join(ROOT, 'main.py'), *args]
+        subprocess.run(command, capture_output=True, env=env, check=True)
+        best = None
+        for _ in range(3):
+            result = subprocess.run(command, capture_output=True, text=True, env=env, check=True)
+            times = {}
+            for line in result.stderr.splitlines():
+                fields = line.split('|')
+                if line.startswith('import time:') and len(fields) == 3 and fields[1].strip().isdigit():
+                    name = fields[2][1:]
+                    times[name.strip()] = ((len(name) - len(name.lstrip())) // 2, int(fields[1]))
+            if best is None or package_import_ms(times) < package_import_ms(best):
+                best = times
+        return best
+
+def package_import_ms(times):
+    """Import time of the package's own modules, including what they import."""
+    return sum(us for name, (depth, us) in times.items()
+               if depth == 0 and name.startswith('pypassguard')) / 1000
+
+class TestStartup(unittest.TestCase):
+
+    def test_validate_startup(self):
+        """Test that validating one password stays within the import budget"""
+        times = import_times('validate', 'Xy7!kkP0qz')
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, times, f"{module} imported by `validate`")
+        self.assertLess(package_import_ms(times), STARTUP_BUDGET_MS)
+
+    def test_help_imports_nothing(self):
+        """Test that the CLI module itself imports no other package modules"""
+        times = import_times('--help')
+        self.assertEqual(sorted(m for m in times if m.startswith('pypassguard.')), ['pypassguard.cli'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard.keyboard import KEYBOARDS
+from pypassguard.strength import FrequencyTable, display_time, estimate_strength, find_matches
+
+class TestKeyboard(unittest.TestCase):
+    
+    def test_qwerty_neighbours(self):
+        """Test that adjacency follows the staggered QWERTY rows"""
+        graph = KEYBOARDS['qwerty'].graph
+        self.assertEqual(graph['a'], frozenset('qwszQWSZ'))
+        self.assertIn('1', graph['q'])
+        self.assertIn('@', graph['w'])
+        self.assertNotIn('e', graph['q'])
+    
+    def test_layout_summary(self):
+        """Test key count and average degree of the QWERTY layout"""
+        layout = KEYBOARDS['qwerty']
+        self.assertEqual(layout.keys, 47)
+        self.assertTrue(4 < layout.degree < 5)
+
+class TestFrequencyTable(unittest.TestCase):
+    
+    def test_ranks_and_find_all(self):
+        """Test that ranks follow list order and substrings are found"""
+        table = FrequencyTable(["# header", "password", "pass", "word", "Password"])
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.ranks['password'], 1)
+        found = {(start, end, word) for start, end, word, _ in table.find_all("xpassword")}
+        self.assertEqual(found, {(1, 9, 'password'), (1, 5, 'pass'), (5, 9, 'word')})
+
+class TestStrength(unittest.TestCase):
+    
+    def patterns(self, password):
+        return [(m['pattern'], m['token']) for m in estimate_strength(password)['sequence']]
+    
+    def test_common_password_scores_zero(self):
+        """Test that top-ranked passwords are trivially guessable"""
+        result = estimate_strength("password")
+        self.assertEqual(result['score'], 0)
+        self.assertEqual(self.patterns("password"), [('dictionary', 'password')])
+    
+    def test_leet_substitutions(self):
+        """Test that COMMON_SUBSTITUTIONS are undone before dictionary lookup"""
+        matches = [m for m in find_matches("p@55w0rd") if m[3] == 'dictionary']
+        self.assertTrue(any(m[4]['matched_word'] == 'password' and m[4]['l33t'] for m in matches))
+        self.assertEqual(estimate_strength("p@55w0rd")['score'], 0)
+    
+    def test_ambiguous_substitution(self):
+        """Test that '1' is tried as both 'i' and 'l'"""
+        words = {m[4]['matched_word'] for m in find_matches("1etme!n") if m[3] == 'dictionary'}
+        self.assertIn('letmein', words)
+    
+    def test_keyboard_sequence_and_repeat_patterns(self):
+        """Test spatial, sequence and repeat matchers"""
+        self.assertEqual(self.patterns("zxcvbnm,./"), [('spatial', 'zxcvbnm,./')])
+        self.assertEqual(self.patterns("hijklmn"), [('sequence', 'hijklmn')])
+        self.assertEqual(self.patterns("zzzzzzzz"), [('repeat', 'zzzzzzzz')])
+    
+    def test_mixed_sequence_is_cheaper_than_bruteforce(self):
+        """Test that the cover of matches beats bruteforce for patterned input"""
+        result = estimate_strength("Dragon1987")
+        self.assertEqual([p for p, _ in self.patterns("Dragon1987")], ['dictionary', 'regex'])
+        self.assertLess(result['guesses'], 10 ** 10)
+    
+    def test_random_password_scores_high(self):
+        """Test that a long random password gets the top score"""
+        result = estimate_strength("xK9#mP2$vL5@tQ")
+        self.assertEqual(result['score'], 4)
+        self.assertEqual(result['crack_times_display']['offline_slow_hashing_1e4_per_second'],
+                         'centuries')
+
+    def test_very_long_password(self):
+        """Test that guess counts past the float range are capped, not overflowed"""
+        password = ''.join(chr(0x4e00 + (i * 7919) % 20000) for i in range(1000))
+        result = estimate_strength(password)
+        self.assertEqual(result['guesses_log10'], 308.0)
+        self.assertEqual(result['crack_times_display']['offline_fast_hashing_1e10_per_second'],
+                         'centuries')
+
+    def test_empty_and_unicode(self):
+        """Test edge cases do not break the matchers"""
+        self.assertEqual(estimate_strength("")['score'], 0)
+        self.assertEqual(len(estimate_strength("İstanbul")['sequence']), 1)
+    
+    def test_display_time(self):
+        """Test crack time formatting"""
+        self.assertEqual(display_time(0.5), 'less than a second')
+        self.assertEqual(display_time(1), '1 second')
+        self.assertEqual(display_time(7200), '2 hours')
+        self.assertEqual(display_time(1e12), 'centuries')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pypassguard import validator
+from pypassguard.validation_cache import ValidationCache
+from pypassguard.validator import configure_validation_cache, validate_password_with_feedback
+
+class TestValidationCache(unittest.TestCase):
+
+    def setUp(self):
+        self.blocklist = validator._BLOCKLIST
+        self.cache = configure_validation_cache(4)
+
+    def tearDown(self):
+        configure_validation_cache(0)
+        validator._BLOCKLIST = self.blocklist
+
+    def test_repeats_hit(self):
+        """Test that repeats are served from the cache with identical results"""
+        expected = validator._validate_with_feedback("weakpass", None)
+        for _ in range(3):
+            self.assertEqual(validate_password_with_feedback("weakpass"), expected)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+
+    def test_result_is_a_copy(self):
+        """Test that modifying a returned feedback list does not touch the cache"""
+        validate_password_with_feedback("weakpass")[1].clear()
+        self.assertTrue(validate_password_with_feedback("weakpass")[1])
+
+    def test_policies_cached_apart(self):
+        """Test that the same password under different policies gets its own entry"""
+        self.assertTrue(validate_password_with_feedback("MyStr0ng!Pass")[0])
+        self.assertFalse(validate_password_with_feedback("MyStr0ng!Pass", "strict")[0])
+        self.assertEqual(len(self.cache), 2)
+
+    def test_bounded_lru(self):
+        """Test that the least recently used entries are evicted at the bound"""
+        for password in ("one1!", "two2@", "three3#", "four4$"):
+            validate_password_with_feedback(password)
+        validate_password_with_feedback("one1!")
+        validate_password_with_feedback("five5%")
+        self.assertEqual(len(self.cache), 4)
+        self.assertEqual(self.cache.evictions, 1)
+        hits = self.cache.hits
+        validate_password_with_feedback("one1!")
+        self.assertEqual(self.cache.hits, hits + 1)
+        validate_password_with_feedback("two2@")
+        self.assertEqual(self.cache.hits, hits + 1)
+
+    def test_no_plaintext_keys(self):
+        """Test that keys are fixed-size MACs that differ between processes' secrets"""
+        validate_password_with_feedback("hunter2hunter2")
+        (key,) = self.cache._entries
+        self.assertEqual(len(key), 16)
+        self.assertNotIn(b"hunter2", key)
+        self.assertNotEqual(ValidationCache()._key("hunter2hunter2", None), key)
+
+    def test_invalidated_by_blocklist_changes(self):
+        """Test that loading or editing a blocklist drops stale results"""
+        password = "Zebra!Crossing9"
+        self.assertTrue(validate_password_with_feedback(password)[0])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'words.txt')
+            with open(path, 'w') as f:
+                f.write("giraffe\n")
+            validator.load_blocklist(path)
+            validator._BLOCKLIST.reload_interval = 0
+            self.assertTrue(validate_password_with_feedback(password)[0])
+
+            with open(path, 'w') as f:
+                f.write("zebra\n")
+            os.utime(path, ns=(0, 10**9))
+            self.assertFalse(validate_password_with_feedback(password)[0])
+        self.assertEqual(self.cache.invalidations, 2)
+
+    def test_disable(self):
+        """Test that a size of 0 removes the cache"""
+        self.assertIsNone(configure_validation_cache(0))
+        self.assertIsNone(validator.validation_cache_stats())
+        self.assertTrue(validate_password_with_feedback("MyStr0ng!Pass")[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from validator import validate_password, get_validation_feedback, validate_password_with_feedback
+from pypassguard.validator import validate_password, get_validation_feedback, validate_password_with_feedback, validate_many
 
 class TestValidator(unittest.TestCase):
     
@@ -86,6 +86,34 @@ class TestValidator(unittest.TestCase):
         
         self.assertTrue(is_valid)
         self.assertEqual(len(feedback), 0)
+    
+    def test_validate_many_matches_single(self):
+        """Test that batch validation agrees with validate_password"""
+        passwords = ["Str0ng!Pw@x", "weak", "password123", "NoDigitsHere!"]
+        
+        for password, is_valid, failed in validate_many(passwords):
+            expected_valid, results = validate_password(password)
+            self.assertEqual(is_valid, expected_valid)
+            self.assertEqual(failed, tuple(k for k, v in results.items() if not v))
+    
+    def test_validate_many_is_lazy(self):
+        """Test that batch validation consumes its input lazily"""
+        def passwords():
+            yield "Str0ng!Pw@x"
+            raise AssertionError("input consumed eagerly")
+        
+        password, is_valid, failed = next(validate_many(passwords()))
+        self.assertEqual(password, "Str0ng!Pw@x")
+        self.assertTrue(is_valid)
+        self.assertEqual(failed, ())
+    
+    def test_named_policy(self):
+        """Test validating against a shipped policy profile"""
+        is_valid, _ = validate_password("Xq7mZp2wKv9tLs", policy='relaxed')
+        self.assertTrue(is_valid)
+        is_valid, feedback = validate_password_with_feedback("Xq7mZp2wK", policy='relaxed')
+        self.assertFalse(is_valid)
+        self.assertIn("at least 12 characters long", feedback[0])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file